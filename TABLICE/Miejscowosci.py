@@ -0,0 +1,184 @@
+# TABLICE/Miejscowosci.py
+
+"""
+Baza miejscowości: współrzędne, wysokość n.p.m. oraz strefy obciążenia śniegiem
+(PN-EN 1991-1-3/NA) i wiatrem (PN-EN 1991-1-4/NA).
+
+Dane przechowywane są w postaci tablicowej (miejscowosci.npz): nazwy jako jeden
+blok UTF-8 z przesunięciami, współrzędne i wysokości jako float32, strefy jako int8.
+Baza wczytywana jest raz (load_localities) i indeksowana:
+    - siatką kwadratów CELL_KM x CELL_KM - najbliższa miejscowość do punktu,
+    - posortowanymi kluczami nazw - wyszukiwanie po początku nazwy (podpowiedzi).
+
+Źródłem danych jest miejscowosci.csv (nazwa, lat, lon, A, strefa_snieg, strefa_wiatr);
+po jego zmianie bazę odbudowuje:
+    python Miejscowosci.py miejscowosci.csv
+Powtarzające się nazwy należy w CSV rozróżnić (np. "Nowa Wieś (pow. kielecki)").
+"""
+
+import sys
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+SCIEZKA_BAZY = Path(__file__).resolve().with_name("miejscowosci.npz")
+SCIEZKA_CSV = Path(__file__).resolve().with_name("miejscowosci.csv")
+
+CELL_KM = 10.0
+KM_NA_STOPIEN = 111.2
+
+
+def _fold(name):
+    # Klucz wyszukiwania: małe litery bez znaków diakrytycznych ("Łódź" -> "lodz")
+    name = name.casefold().replace("ł", "l")
+    return "".join(c for c in unicodedata.normalize("NFKD", name) if not unicodedata.combining(c))
+
+
+# ==============================================================================
+# BUDOWA I WCZYTANIE BAZY
+# ==============================================================================
+
+def build_locality_db(csv_path=SCIEZKA_CSV, npz_path=SCIEZKA_BAZY):
+    """Buduje plik .npz bazy z tabeli CSV. Zwraca liczbę miejscowości."""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, sep=None, engine="python")
+    encoded = [str(n).strip().encode("utf-8") for n in df["nazwa"]]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(e) for e in encoded])
+    np.savez_compressed(
+        npz_path,
+        names=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        offsets=offsets,
+        lat=df["lat"].to_numpy(dtype=np.float32),
+        lon=df["lon"].to_numpy(dtype=np.float32),
+        A=df["A"].to_numpy(dtype=np.float32),
+        strefa_snieg=df["strefa_snieg"].to_numpy(dtype=np.int8),
+        strefa_wiatr=df["strefa_wiatr"].to_numpy(dtype=np.int8),
+    )
+    return len(df)
+
+
+@lru_cache(maxsize=1)
+def load_localities(npz_path=SCIEZKA_BAZY):
+    """Wczytuje bazę i buduje indeksy (wynik buforowany - jedno wczytanie na proces)."""
+    with np.load(npz_path) as data:
+        db = {key: data[key] for key in data.files}
+    blob = db.pop("names").tobytes()
+    offsets = db.pop("offsets")
+    db["nazwa"] = [blob[a:b].decode("utf-8") for a, b in zip(offsets[:-1], offsets[1:])]
+    db["indeks_nazw"] = {}
+    for i, nazwa in enumerate(db["nazwa"]):
+        db["indeks_nazw"].setdefault(nazwa, i)
+
+    # Indeks nazw: klucze znormalizowane, posortowane
+    keys = np.array([_fold(n) for n in db["nazwa"]])
+    order = np.argsort(keys, kind="stable")
+    db["klucze"] = keys[order]
+    db["kolejnosc"] = order
+
+    # Indeks przestrzenny: siatka w rzucie równoodległościowym [km]
+    lat0 = float(np.mean(db["lat"])) if len(db["lat"]) else 52.0
+    db["kx"] = KM_NA_STOPIEN * np.cos(np.radians(lat0))
+    x = db["lon"].astype(float) * db["kx"]
+    y = db["lat"].astype(float) * KM_NA_STOPIEN
+    db["x0"], db["y0"] = float(x.min()), float(y.min())
+    ix = ((x - db["x0"]) // CELL_KM).astype(np.int64)
+    iy = ((y - db["y0"]) // CELL_KM).astype(np.int64)
+    db["nx"], db["ny"] = int(ix.max()) + 1, int(iy.max()) + 1
+    cell = iy * db["nx"] + ix
+    order = np.argsort(cell, kind="stable")
+    db["komorki_start"] = np.searchsorted(cell[order], np.arange(db["nx"] * db["ny"] + 1))
+    db["komorki_pkt"] = order
+    db["xy"] = np.column_stack([x, y])[order]
+    return db
+
+
+# ==============================================================================
+# ZAPYTANIA
+# ==============================================================================
+
+def locality(name):
+    """Dane miejscowości o podanej nazwie (słownik) lub None."""
+    db = load_localities()
+    i = db["indeks_nazw"].get(name)
+    if i is None:
+        return None
+    return {
+        "nazwa": db["nazwa"][i],
+        "lat": round(float(db["lat"][i]), 5),
+        "lon": round(float(db["lon"][i]), 5),
+        "A": float(db["A"][i]),
+        "strefa_snieg": int(db["strefa_snieg"][i]),
+        "strefa_wiatr": int(db["strefa_wiatr"][i]),
+    }
+
+
+def search_localities(prefix, limit=20):
+    """Nazwy miejscowości zaczynające się od prefix (bez rozróżniania wielkości liter i polskich znaków)."""
+    db = load_localities()
+    key = _fold(prefix.strip())
+    lo = np.searchsorted(db["klucze"], key, side="left")
+    hi = np.searchsorted(db["klucze"], key + "\U0010ffff", side="left")
+    return [db["nazwa"][i] for i in db["kolejnosc"][lo:min(hi, lo + limit)]]
+
+
+def nearest_locality(lat, lon):
+    """Najbliższa miejscowość do punktu (lat, lon) [°]: (dane jak w locality, odległość [km])."""
+    db = load_localities()
+    x, y = lon * db["kx"], lat * KM_NA_STOPIEN
+    cx = min(max(int((x - db["x0"]) // CELL_KM), 0), db["nx"] - 1)
+    cy = min(max(int((y - db["y0"]) // CELL_KM), 0), db["ny"] - 1)
+    nx, ny, starts = db["nx"], db["ny"], db["komorki_start"]
+
+    # Kwadrat komórek o promieniu r wokół komórki punktu (wiersz siatki = ciągły zakres punktów);
+    # r podwajane, aż najbliższy punkt w kwadracie jest bliżej niż brzeg kwadratu
+    # (brzeg na krawędzi siatki nie ogranicza - poza nim nie ma punktów)
+    r = 0
+    while True:
+        x_lo, x_hi = max(cx - r, 0), min(cx + r, nx - 1)
+        y_lo, y_hi = max(cy - r, 0), min(cy + r, ny - 1)
+        idx = np.concatenate([
+            np.arange(starts[iy * nx + x_lo], starts[iy * nx + x_hi + 1]) for iy in range(y_lo, y_hi + 1)
+        ])
+        margin = min(
+            x - (db["x0"] + x_lo * CELL_KM) if x_lo > 0 else np.inf,
+            db["x0"] + (x_hi + 1) * CELL_KM - x if x_hi < nx - 1 else np.inf,
+            y - (db["y0"] + y_lo * CELL_KM) if y_lo > 0 else np.inf,
+            db["y0"] + (y_hi + 1) * CELL_KM - y if y_hi < ny - 1 else np.inf,
+        )
+        if idx.size:
+            d2 = (db["xy"][idx, 0] - x) ** 2 + (db["xy"][idx, 1] - y) ** 2
+            k = int(np.argmin(d2))
+            if d2[k] <= margin**2:
+                best_i, best_d2 = int(db["komorki_pkt"][idx[k]]), float(d2[k])
+                break
+        elif margin == np.inf:
+            return None, np.inf
+        r = max(2 * r, 1)
+    return locality(db["nazwa"][best_i]), float(np.sqrt(best_d2))
+
+
+@lru_cache(maxsize=1)
+def locality_names():
+    """Nazwy wszystkich miejscowości w kolejności alfabetycznej (dla list wyboru)."""
+    db = load_localities()
+    return [db["nazwa"][i] for i in db["kolejnosc"]]
+
+
+@lru_cache(maxsize=2)
+def city_table(obciazenie="snieg"):
+    """Słownik nazwa -> {"strefa": "1".., "A": m n.p.m.} dla obciążenia "snieg" lub "wiatr"."""
+    db = load_localities()
+    strefy = db["strefa_snieg" if obciazenie == "snieg" else "strefa_wiatr"]
+    return {
+        nazwa: {"strefa": str(int(strefa)), "A": int(round(float(A)))}
+        for nazwa, strefa, A in zip(db["nazwa"], strefy, db["A"])
+    }
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else SCIEZKA_CSV
+    print(f"Zapisano {build_locality_db(csv_path)} miejscowości do {SCIEZKA_BAZY}")
@@ -7,6 +7,9 @@
 
 import streamlit as st
 import math
+import numpy as np
+import pandas as pd
+from functools import lru_cache
 
 # ==============================================================================
 # IMPORT TABLIC
@@ -110,113 +113,431 @@ def opening_sector_angles(x_cm, y_cm, hole_b_cm, hole_h_cm):
     return min(unwrapped), max(unwrapped), ref_angle
 
 
-def sample_segment(p0, p1, target_step_cm):
-    length = math.hypot(p1[0] - p0[0], p1[1] - p0[1])
-    steps = max(1, int(math.ceil(length / target_step_cm)))
-    return [
-        (
-            p0[0] + (p1[0] - p0[0]) * i / steps,
-            p0[1] + (p1[1] - p0[1]) * i / steps,
-        )
-        for i in range(steps + 1)
-    ]
+def line_piece(p0, p1):
+    return ("line", p0, p1)
 
 
-def sample_arc(center, radius_cm, angle_start, angle_end, target_step_cm):
-    arc_len = abs(angle_end - angle_start) * radius_cm
-    steps = max(6, int(math.ceil(arc_len / target_step_cm)))
-    return [
-        (
-            center[0] + radius_cm * math.cos(angle_start + (angle_end - angle_start) * i / steps),
-            center[1] + radius_cm * math.sin(angle_start + (angle_end - angle_start) * i / steps),
-        )
-        for i in range(steps + 1)
-    ]
-
-
-def merge_point_sequences(sequences):
-    merged = []
-    for seq in sequences:
-        for pt in seq:
-            if not merged or math.hypot(pt[0] - merged[-1][0], pt[1] - merged[-1][1]) > 1e-9:
-                merged.append(pt)
-    return merged
+def arc_piece(center, radius_cm, angle_start, angle_end):
+    return ("arc", center, radius_cm, angle_start, angle_end)
 
 
-def rounded_rectangle_points(width_cm, height_cm, radius_cm, target_step_cm=0.75):
+def rounded_rectangle_pieces(width_cm, height_cm, radius_cm):
+    # Obwód kontrolny: boki prostokąta odsunięte o radius_cm + łuki w narożach (przeciwnie do zegara)
     half_w = width_cm / 2.0
     half_h = height_cm / 2.0
-    sequences = [
-        sample_segment((-half_w, -half_h - radius_cm), (half_w, -half_h - radius_cm), target_step_cm),
-        sample_arc((half_w, -half_h), radius_cm, -math.pi / 2, 0.0, target_step_cm),
-        sample_segment((half_w + radius_cm, -half_h), (half_w + radius_cm, half_h), target_step_cm),
-        sample_arc((half_w, half_h), radius_cm, 0.0, math.pi / 2, target_step_cm),
-        sample_segment((half_w, half_h + radius_cm), (-half_w, half_h + radius_cm), target_step_cm),
-        sample_arc((-half_w, half_h), radius_cm, math.pi / 2, math.pi, target_step_cm),
-        sample_segment((-half_w - radius_cm, half_h), (-half_w - radius_cm, -half_h), target_step_cm),
-        sample_arc((-half_w, -half_h), radius_cm, math.pi, 3 * math.pi / 2, target_step_cm),
+    return [
+        line_piece((-half_w, -half_h - radius_cm), (half_w, -half_h - radius_cm)),
+        arc_piece((half_w, -half_h), radius_cm, -math.pi / 2, 0.0),
+        line_piece((half_w + radius_cm, -half_h), (half_w + radius_cm, half_h)),
+        arc_piece((half_w, half_h), radius_cm, 0.0, math.pi / 2),
+        line_piece((half_w, half_h + radius_cm), (-half_w, half_h + radius_cm)),
+        arc_piece((-half_w, half_h), radius_cm, math.pi / 2, math.pi),
+        line_piece((-half_w - radius_cm, half_h), (-half_w - radius_cm, -half_h)),
+        arc_piece((-half_w, -half_h), radius_cm, math.pi, 3 * math.pi / 2),
     ]
-    return merge_point_sequences(sequences)
 
 
-def rectangle_perimeter_points(width_cm, height_cm, target_step_cm=0.75):
+def rectangle_pieces(width_cm, height_cm):
     half_w = width_cm / 2.0
     half_h = height_cm / 2.0
-    sequences = [
-        sample_segment((-half_w, -half_h), (half_w, -half_h), target_step_cm),
-        sample_segment((half_w, -half_h), (half_w, half_h), target_step_cm),
-        sample_segment((half_w, half_h), (-half_w, half_h), target_step_cm),
-        sample_segment((-half_w, half_h), (-half_w, -half_h), target_step_cm),
+    return [
+        line_piece((-half_w, -half_h), (half_w, -half_h)),
+        line_piece((half_w, -half_h), (half_w, half_h)),
+        line_piece((half_w, half_h), (-half_w, half_h)),
+        line_piece((-half_w, half_h), (-half_w, -half_h)),
     ]
-    return merge_point_sequences(sequences)
 
 
-def split_perimeter_lengths(points, angle_min, angle_max, angle_ref):
+def piece_length(piece):
+    if piece[0] == "line":
+        (x0, y0), (x1, y1) = piece[1], piece[2]
+        return math.hypot(x1 - x0, y1 - y0)
+    return abs(piece[4] - piece[3]) * piece[2]
+
+
+def piece_point(piece, t):
+    # Punkt odcinka/łuku dla parametru t w [0, 1] (proporcjonalnego do długości)
+    if piece[0] == "line":
+        (x0, y0), (x1, y1) = piece[1], piece[2]
+        return (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+    (cx, cy), radius, a0, a1 = piece[1], piece[2], piece[3], piece[4]
+    angle = a0 + (a1 - a0) * t
+    return (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+
+
+def ray_parameter_on_piece(piece, angle_rad):
+    # Parametr t punktu, w którym promień z osi słupa pod kątem angle_rad przecina element obwodu
+    ux, uy = math.cos(angle_rad), math.sin(angle_rad)
+    if piece[0] == "line":
+        (x0, y0), (x1, y1) = piece[1], piece[2]
+        denom = ux * (y1 - y0) - uy * (x1 - x0)
+        if abs(denom) <= 1e-12:
+            return 0.0
+        t = -(ux * y0 - uy * x0) / denom
+    else:
+        (cx, cy), radius, a0, a1 = piece[1], piece[2], piece[3], piece[4]
+        dist_perp = ux * cy - uy * cx
+        s = ux * cx + uy * cy + math.sqrt(max(radius**2 - dist_perp**2, 0.0))
+        psi = normalize_angle_near(math.atan2(s * uy - cy, s * ux - cx), 0.5 * (a0 + a1))
+        t = (psi - a0) / (a1 - a0)
+    return min(max(t, 0.0), 1.0)
+
+
+def piece_sector_parameters(piece, angle_min, angle_max, angle_ref):
+    # Przedziały parametru t elementu leżące w cieniu otworu [angle_min, angle_max]
+    # (obwód wypukły wokół osi słupa - kąt biegunowy rośnie monotonicznie wzdłuż elementu)
+    p_start = piece_point(piece, 0.0)
+    p_end = piece_point(piece, 1.0)
+    theta0 = normalize_angle_near(math.atan2(p_start[1], p_start[0]), angle_ref)
+    theta1 = normalize_angle_near(math.atan2(p_end[1], p_end[0]), theta0)
+    intervals = []
+    for shift in (-2 * math.pi, 0.0, 2 * math.pi):
+        lo = max(theta0, angle_min + shift)
+        hi = min(theta1, angle_max + shift)
+        if hi > lo:
+            t_lo = ray_parameter_on_piece(piece, lo)
+            t_hi = ray_parameter_on_piece(piece, hi)
+            if t_hi > t_lo:
+                intervals.append((t_lo, t_hi))
+    return intervals
+
+
+def merge_sector_intervals(sectors):
+    """
+    Suma cieni kilku otworów: sortowanie przedziałów kątowych i jedno przejście
+    łączące nakładające się (O(N log N)), z domknięciem przez kąt 2*pi.
+    sectors: lista (angle_min, angle_max, angle_ref). Zwraca rozłączne przedziały w tym samym formacie.
+    """
+    full_turn = 2 * math.pi
+    intervals = sorted(
+        (a_min % full_turn, a_min % full_turn + (a_max - a_min))
+        for a_min, a_max, _ in sectors
+    )
+    merged = []
+    for lo, hi in intervals:
+        if merged and lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+
+    # Ostatni przedział może przejść przez 2*pi i pochłonąć początkowe
+    while len(merged) > 1 and merged[-1][1] - full_turn >= merged[0][0]:
+        merged[-1][1] = max(merged[-1][1], merged[0][1] + full_turn)
+        merged.pop(0)
+    if merged and merged[-1][1] - merged[-1][0] >= full_turn:
+        merged = [[0.0, full_turn]]
+
+    return [(lo, hi, 0.5 * (lo + hi)) for lo, hi in merged]
+
+
+def split_perimeter_lengths(pieces, sectors):
+    # Długość całkowita i długość w cieniu otworów (rozłączne przedziały) - dokładnie, O(1) na element obwodu
     total_len = 0.0
     excluded_len = 0.0
-    if len(points) < 2:
-        return total_len, excluded_len
-
-    for i, p1 in enumerate(points):
-        p2 = points[(i + 1) % len(points)]
-        seg_len = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-        if seg_len <= 1e-9:
+    for piece in pieces:
+        length = piece_length(piece)
+        if length <= 1e-9:
             continue
-        total_len += seg_len
-        mid_x = 0.5 * (p1[0] + p2[0])
-        mid_y = 0.5 * (p1[1] + p2[1])
-        mid_angle = normalize_angle_near(math.atan2(mid_y, mid_x), angle_ref)
-        if angle_min <= mid_angle <= angle_max:
-            excluded_len += seg_len
-
+        total_len += length
+        for angle_min, angle_max, angle_ref in sectors:
+            for t_lo, t_hi in piece_sector_parameters(piece, angle_min, angle_max, angle_ref):
+                excluded_len += (t_hi - t_lo) * length
     return total_len, excluded_len
 
 
-def points_on_effective_rectangle(width_cm, height_cm, count, angle_min=None, angle_max=None, angle_ref=0.0):
-    perimeter_points = rectangle_perimeter_points(width_cm, height_cm, target_step_cm=0.35)
+# Narożniki obwodów prostokątnych (znaki półwymiarów) - boki przeciwnie do zegara, jak rectangle_pieces
+RECTANGLE_SIDE_SIGNS = np.array([
+    [-1.0, -1.0, 1.0, -1.0],
+    [1.0, -1.0, 1.0, 1.0],
+    [1.0, 1.0, -1.0, 1.0],
+    [-1.0, 1.0, -1.0, -1.0],
+])
+
+
+def segments_sector_fraction(x0, y0, x1, y1, angle_min, angle_max, angle_ref):
+    # Wektorowo: udział długości odcinków (x0,y0)-(x1,y1) leżący w cieniu otworu
+    theta0 = np.arctan2(y0, x0)
+    theta0 = theta0 - 2 * np.pi * np.round((theta0 - angle_ref) / (2 * np.pi))
+    theta1 = np.arctan2(y1, x1)
+    theta1 = theta1 - 2 * np.pi * np.floor((theta1 - theta0) / (2 * np.pi))
+
+    def ray_parameter(angle):
+        ux, uy = np.cos(angle), np.sin(angle)
+        denom = ux * (y1 - y0) - uy * (x1 - x0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(np.abs(denom) > 1e-12, -(ux * y0 - uy * x0) / denom, 0.0)
+        return np.clip(t, 0.0, 1.0)
+
+    fraction = np.zeros(np.broadcast(x0, y0, x1, y1).shape)
+    for shift in (-2 * np.pi, 0.0, 2 * np.pi):
+        lo = np.maximum(theta0, angle_min + shift)
+        hi = np.minimum(theta1, angle_max + shift)
+        fraction += np.where(hi > lo, np.maximum(ray_parameter(hi) - ray_parameter(lo), 0.0), 0.0)
+    return fraction
+
+
+def layer_perimeter_lengths(b_cm, h_cm, layer_offsets, sectors=None):
+    """
+    Obwody wszystkich warstw zbrojenia na przebicie jednocześnie (NumPy).
+    sectors: rozłączne cienie otworów (merge_sector_intervals) lub None.
+    Zwraca (u_i, u_i_eff, reduction_ratio) - tablice o długości liczby warstw.
+    """
+    a = np.asarray(layer_offsets, dtype=float)
+    u_i = 2 * (b_cm + h_cm) + 2 * np.pi * a
+    reduction_ratio = np.ones_like(a)
+
+    if sectors:
+        half_w = (b_cm / 2.0 + a)[:, None]
+        half_h = (h_cm / 2.0 + a)[:, None]
+        sx0, sy0, sx1, sy1 = RECTANGLE_SIDE_SIGNS.T
+        x0, y0, x1, y1 = sx0 * half_w, sy0 * half_h, sx1 * half_w, sy1 * half_h
+        side_len = np.hypot(x1 - x0, y1 - y0)
+        fraction = sum(segments_sector_fraction(x0, y0, x1, y1, *sector) for sector in sectors)
+        excluded = (fraction * side_len).sum(axis=1)
+        total = side_len.sum(axis=1)
+        reduction_ratio = np.where(total > 1e-9, np.maximum(1.0 - excluded / np.where(total > 1e-9, total, 1.0), 0.15), 1.0)
+
+    return u_i, u_i * reduction_ratio, reduction_ratio
+
+
+def points_on_effective_rectangle(width_cm, height_cm, count, sectors=None):
+    pieces = rectangle_pieces(width_cm, height_cm)
+
+    # Odcinki obwodu poza cieniem otworów: (element, t_od, t_do)
     kept = []
-    for pt in perimeter_points:
-        if angle_min is not None and angle_max is not None:
-            angle = normalize_angle_near(math.atan2(pt[1], pt[0]), angle_ref)
-            if angle_min <= angle <= angle_max:
-                continue
-        kept.append(pt)
-
-    if not kept:
+    for piece in pieces:
+        excluded = []
+        for sector in sectors or []:
+            excluded.extend(piece_sector_parameters(piece, *sector))
+        t_prev = 0.0
+        for t_lo, t_hi in sorted(excluded):
+            if t_lo > t_prev + 1e-9:
+                kept.append((piece, t_prev, t_lo))
+            t_prev = max(t_prev, t_hi)
+        if t_prev < 1.0 - 1e-9:
+            kept.append((piece, t_prev, 1.0))
+
+    kept_lengths = [piece_length(piece) * (t_hi - t_lo) for piece, t_lo, t_hi in kept]
+    kept_total = sum(kept_lengths)
+    if kept_total <= 1e-9:
         return []
 
     if count <= 1:
-        return [kept[0]]
+        return [piece_point(kept[0][0], kept[0][1])]
+
+    # Punkty równomiernie po długości obwodu efektywnego (pierwszy i ostatni na końcach)
+    points = []
+    index = 0
+    offset = 0.0
+    for i in range(count):
+        target = kept_total * i / (count - 1)
+        while index < len(kept) - 1 and target > offset + kept_lengths[index]:
+            offset += kept_lengths[index]
+            index += 1
+        piece, t_lo, t_hi = kept[index]
+        frac = min(max((target - offset) / kept_lengths[index], 0.0), 1.0) if kept_lengths[index] > 0 else 0.0
+        points.append(piece_point(piece, t_lo + (t_hi - t_lo) * frac))
+    return points
 
-    if len(kept) <= count:
-        return kept
 
-    last_index = len(kept) - 1
-    return [
-        kept[int(round(i * last_index / (count - 1)))]
-        for i in range(count)
+# ==============================================================================
+# RDZEŃ OBLICZEŃ (BEZ INTERFEJSU)
+# ==============================================================================
+def punching_stresses(b_cm, h_col_cm, d_cm, fck, Ved_kN, beta, rho_l, u1_eff_cm):
+    # Naprężenia przy licu słupa (u0) i na obwodzie kontrolnym u1 oraz nośności bez zbrojenia
+    k = min(1 + math.sqrt(200 / (d_cm * 10)), 2.0)
+    CRdc = 0.18 / 1.5
+    u0 = 2 * (b_cm + h_col_cm)
+
+    vEd_u0 = beta * Ved_kN * 1000 / (u0 * d_cm * 100)
+    vEd = beta * Ved_kN * 1000 / (u1_eff_cm * d_cm * 100)
+    vRdc = CRdc * k * ((100 * rho_l * fck) ** (1/3))
+
+    nu = 0.6 * (1 - fck / 250)
+    fcd = fck / 1.5
+    vRdmax = 0.5 * nu * fcd
+    return {
+        "k": k, "CRdc": CRdc, "nu": nu, "fcd": fcd, "u0": u0,
+        "vEd_u0": vEd_u0, "vEd": vEd, "vRdc": vRdc, "vRdmax": vRdmax,
+    }
+
+
+def _opening_geometry(b_cm, h_col_cm, d_cm, openings):
+    # u1 i cienie otworów (krotka (hole_x, hole_y, hole_b, hole_h) [cm] dla każdego otworu)
+    u1 = 2 * (b_cm + h_col_cm) + 4 * math.pi * d_cm
+    distances = [rect_gap_distance_cm(b_cm, h_col_cm, *opening) for opening in openings]
+    near = [opening for opening, dist in zip(openings, distances) if dist < 6.0 * d_cm]
+    sectors = merge_sector_intervals([opening_sector_angles(*opening) for opening in near])
+
+    result = {
+        "u1": u1,
+        "u1_eff": u1,
+        "u1_excluded": 0.0,
+        "opening_distances": distances,
+        "opening_distance": min(distances) if distances else 0.0,
+        "opening_affects": False,
+        "opening_sectors": [],
+        "opening_reduction_pct": 0.0,
+    }
+    if not openings:
+        result["opening_reason"] = "Brak otworu."
+        return result
+    if not near:
+        result["opening_reason"] = (
+            f"Otwór jest poza strefą wpływu 6d ({min(distances):.1f} cm >= {6.0 * d_cm:.1f} cm)."
+            if len(openings) == 1
+            else f"Otwory są poza strefą wpływu 6d (najbliższy: {min(distances):.1f} cm >= {6.0 * d_cm:.1f} cm)."
+        )
+        return result
+
+    u1_total_geom, u1_excluded = split_perimeter_lengths(rounded_rectangle_pieces(b_cm, h_col_cm, 2.0 * d_cm), sectors)
+    result["u1_excluded"] = u1_excluded
+    if u1_total_geom > 1e-9 and u1_excluded > 1e-9:
+        u1_eff = max(u1 * (1.0 - u1_excluded / u1_total_geom), 0.15 * u1)
+        result.update(
+            u1_eff=u1_eff,
+            opening_affects=True,
+            opening_sectors=sectors,
+            opening_reduction_pct=100.0 * (u1 - u1_eff) / u1,
+            opening_reason=(
+                f"Otwór leży w strefie 6d i redukuje obwód kontrolny u1 o {u1 - u1_eff:.2f} cm."
+                if len(near) == 1
+                else f"{len(near)} otwory w strefie 6d ({len(sectors)} rozłączne cienie) redukują u1 o {u1 - u1_eff:.2f} cm."
+            ),
+        )
+    else:
+        result["opening_reason"] = "Otwór jest blisko słupa, ale nie przecina sektora obwodu kontrolnego."
+    return result
+
+
+@st.cache_resource
+def _shared_opening_geometry_cache():
+    """Pamięć geometrii otworów wspólna dla kolejnych przeliczeń strony (przetrwa przeładowanie modułu)."""
+    return lru_cache(maxsize=256)(_opening_geometry)
+
+
+def punching_opening_geometry(b_cm, h_col_cm, d_cm, openings=None):
+    """
+    u1, u1_eff i rozłączne cienie otworów dla geometrii słupa. Wynik z pamięci
+    podręcznej - zmiana samego V_Ed lub rho nie przelicza geometrii. Nie modyfikować.
+    """
+    key = tuple(tuple(float(v) for v in opening) for opening in (openings or ()))
+    return _shared_opening_geometry_cache()(float(b_cm), float(h_col_cm), float(d_cm), key)
+
+
+def round_up_to_multiple(value, multiple):
+    return int(math.ceil(value / multiple) * multiple)
+
+
+def punching_stud_layout(b_cm, h_col_cm, d_cm, beta, Ved_kN, vEd, vRdc, u1_eff_cm, fywk, phi_sw,
+                         rozmieszczenie_typ="Stała ilość / obwód", opening_sectors=None):
+    """
+    Obwody i liczba elementów zbrojenia na przebicie (dyble / strzemiona).
+    opening_sectors: rozłączne cienie otworów (angle_min, angle_max, angle_ref) lub None.
+    """
+    d = d_cm
+    k_out = 1.50
+    first_layer_a = 0.50 * d
+    radial_spacing_max = 0.75 * d
+    tangential_spacing_inner_max = 1.50 * d
+    tangential_spacing_outer_max = 2.00 * d
+    uout = beta * Ved_kN * 1000 / (vRdc * d * 100)
+    x_out = max((uout - 2 * (b_cm + h_col_cm)) / (2 * math.pi), 2 * d)
+
+    if x_out < 3 * d:
+        first_layer_a = 0.30 * d
+        last_required_a = 1.50 * d
+    else:
+        last_required_a = max(first_layer_a + radial_spacing_max, x_out - k_out * d)
+
+    radial_spacing = radial_spacing_max
+    n_layers_from_zone = math.ceil((last_required_a - first_layer_a) / radial_spacing) + 1
+    n_layers = max(2, n_layers_from_zone)
+    layer_offsets = [
+        first_layer_a + i * radial_spacing
+        for i in range(n_layers)
     ]
 
+    d_mm = d * 10
+    sr_design_mm = radial_spacing * 10
+    fywd_eff = min(250 + 0.25 * d_mm, fywk / 1.15)
+    one_bar = bar_area_cm2(phi_sw)
+
+    Asw_req_perimeter = max(
+        (vEd - 0.75 * vRdc)
+        * (u1_eff_cm * 10.0)
+        * d_mm
+        / (1.5 * (d_mm / sr_design_mm) * fywd_eff),
+        0,
+    ) / 100
+
+    # Obwody wszystkich warstw jednocześnie (geometria niezależna od średnicy prętów)
+    _, u_eff_layers, reduction_layers = layer_perimeter_lengths(b_cm, h_col_cm, layer_offsets, opening_sectors)
+    st_limits = np.where(
+        np.asarray(layer_offsets) <= 2 * d,
+        tangential_spacing_inner_max,
+        tangential_spacing_outer_max,
+    )
+    n_spacing_layers = np.maximum(4, np.ceil(u_eff_layers / st_limits))
+    n_i_strength = max(4, math.ceil(Asw_req_perimeter / one_bar))
+    required_counts = np.maximum(n_spacing_layers, n_i_strength).astype(int).tolist()
+
+    # --- DECYZJA O SPOSOBIE ALOKACJI PRĘTÓW ---
+    if rozmieszczenie_typ == "Stała ilość / obwód":
+        n_per_layer = round_up_to_multiple(max(required_counts), 4)
+        layer_counts = [n_per_layer for _ in layer_offsets]
+    else:
+        layer_counts = [round_up_to_multiple(req, 4) for req in required_counts]
+
+    n_total_layout = sum(layer_counts)
+    return {
+        "uout": uout,
+        "x_out": x_out,
+        "radial_spacing": radial_spacing,
+        "n_layers": n_layers,
+        "layer_offsets": layer_offsets,
+        "layer_counts": layer_counts,
+        "layer_effective_lengths": u_eff_layers.tolist(),
+        "layer_reduction_ratios": reduction_layers.tolist(),
+        "tangential_spacing_inner_max": tangential_spacing_inner_max,
+        "tangential_spacing_outer_max": tangential_spacing_outer_max,
+        "sr_design_mm": sr_design_mm,
+        "fywd_eff": fywd_eff,
+        "Asw_req_perimeter": Asw_req_perimeter,
+        "n_total_layout": n_total_layout,
+        "Asw_prov_perimeter_min": min(layer_counts) * one_bar,
+        "Asw_prov_perimeter_max": max(layer_counts) * one_bar,
+        "Asw_prov_total": n_total_layout * one_bar,
+    }
+
+
+def punching_check_interior(b_cm, h_col_cm, d_cm, fck, Ved_kN, Mx_kNm=0.0, My_kNm=0.0, rho_x=0.0, rho_y=0.0,
+                            beta=None, fywk=500.0, phi_sw=10, rozmieszczenie_typ="Stała ilość / obwód",
+                            openings=None):
+    """
+    Pełne sprawdzenie przebicia przy słupie wewnętrznym (bez interfejsu).
+    beta=None - wyznaczane z momentów (beta_from_moments); openings - lista
+    (hole_x, hole_y, hole_b, hole_h) [cm]. Zwraca słownik wyników.
+    """
+    if beta is None:
+        beta = beta_from_moments(Ved_kN, b_cm, h_col_cm, Mx_kNm, My_kNm)
+    rho_l = min(math.sqrt(rho_x * rho_y), 0.02)
+
+    result = {"beta": beta, "rho_l": rho_l}
+    result.update(punching_opening_geometry(b_cm, h_col_cm, d_cm, openings))
+    result.update(punching_stresses(b_cm, h_col_cm, d_cm, fck, Ved_kN, beta, rho_l, result["u1_eff"]))
+
+    result["basic_ok"] = result["vEd"] <= result["vRdc"]
+    result["max_ok"] = result["vEd_u0"] <= result["vRdmax"]
+    result["need_reinf"] = not result["basic_ok"]
+    result["layout"] = None
+    if result["need_reinf"] and result["max_ok"]:
+        result["layout"] = punching_stud_layout(
+            b_cm, h_col_cm, d_cm, beta, Ved_kN, result["vEd"], result["vRdc"], result["u1_eff"],
+            fywk, phi_sw, rozmieszczenie_typ, result["opening_sectors"],
+        )
+    return result
+
 
 # ==============================================================================
 # MAIN
@@ -434,6 +755,7 @@ def run():
     opening_offset = 0.0
     hole_x = 0.0
     hole_y = 0.0
+    extra_openings_df = None
 
     if opening_enabled:
         with c2:
@@ -526,6 +848,14 @@ def run():
                     key="hole_y_ps_wew"
                 )
 
+        st.markdown("Dodatkowe otwory (środek względem osi słupa):")
+        extra_openings_df = st.data_editor(
+            pd.DataFrame({"x [cm]": [], "y [cm]": [], "b [cm]": [], "h [cm]": []}, dtype=float),
+            num_rows="dynamic",
+            use_container_width=True,
+            key="extra_openings_ps_wew",
+        )
+
     # --------------------------------------------------------------------------
     # ROW 7
     # --------------------------------------------------------------------------
@@ -599,55 +929,32 @@ def run():
         rho_y = Asy / (100 * dy)
         rho_l = min(math.sqrt(rho_x * rho_y), 0.02)
 
-        k = min(1 + math.sqrt(200 / (d * 10)), 2.0)
-        CRdc = 0.18 / 1.5
-
-        u0 = 2 * (b + h_col)
-        u1 = 2 * (b + h_col) + 4 * math.pi * d
-        u1_eff = u1
-        u1_excluded = 0.0
-        opening_distance = 0.0
-        opening_affects = False
-        opening_reason = "Brak otworu."
-        opening_angle_min = 0.0
-        opening_angle_max = 0.0
-        opening_angle_ref = 0.0
-        opening_reduction_pct = 0.0
-
+        openings = []
         if opening_enabled:
-            opening_distance = rect_gap_distance_cm(b, h_col, hole_x, hole_y, hole_b, hole_h)
-            opening_reason = f"Otwór w odległości {opening_distance:.1f} cm od lica słupa."
-            if opening_distance < 6.0 * d:
-                opening_angle_min, opening_angle_max, opening_angle_ref = opening_sector_angles(
-                    hole_x, hole_y, hole_b, hole_h
-                )
-                u1_points = rounded_rectangle_points(b, h_col, 2.0 * d, target_step_cm=0.40)
-                u1_total_geom, u1_excluded = split_perimeter_lengths(
-                    u1_points,
-                    opening_angle_min,
-                    opening_angle_max,
-                    opening_angle_ref,
-                )
-                if u1_total_geom > 1e-9 and u1_excluded > 1e-9:
-                    opening_affects = True
-                    u1_eff = max(u1 * (1.0 - u1_excluded / u1_total_geom), 0.15 * u1)
-                    opening_reduction_pct = 100.0 * (u1 - u1_eff) / u1
-                    opening_reason = (
-                        f"Otwór leży w strefie 6d i redukuje obwód kontrolny u1 o {u1 - u1_eff:.2f} cm."
-                    )
-                else:
-                    opening_reason = "Otwór jest blisko słupa, ale nie przecina sektora obwodu kontrolnego."
-            else:
-                opening_reason = f"Otwór jest poza strefą wpływu 6d ({opening_distance:.1f} cm >= {6.0 * d:.1f} cm)."
-
-        vEd_u0 = beta * Ved * 1000 / (u0 * d * 100)
-        vEd = beta * Ved * 1000 / (u1_eff * d * 100)
-
-        vRdc = CRdc * k * ((100 * rho_l * fck) ** (1/3))
-
-        nu = 0.6 * (1 - fck / 250)
-        fcd = fck / 1.5
-        vRdmax = 0.5 * nu * fcd
+            openings.append((hole_x, hole_y, hole_b, hole_h))
+            if extra_openings_df is not None:
+                for row in extra_openings_df.dropna().itertuples(index=False):
+                    if row[2] > 0 and row[3] > 0:
+                        openings.append(tuple(float(v) for v in row))
+        opening_res = punching_opening_geometry(b, h_col, d, openings)
+        u1 = opening_res["u1"]
+        u1_eff = opening_res["u1_eff"]
+        opening_distance = opening_res["opening_distance"]
+        opening_affects = opening_res["opening_affects"]
+        opening_reason = opening_res["opening_reason"]
+        opening_sectors = opening_res["opening_sectors"]
+        opening_reduction_pct = opening_res["opening_reduction_pct"]
+
+        stresses = punching_stresses(b, h_col, d, fck, Ved, beta, rho_l, u1_eff)
+        k = stresses["k"]
+        CRdc = stresses["CRdc"]
+        nu = stresses["nu"]
+        fcd = stresses["fcd"]
+        u0 = stresses["u0"]
+        vEd_u0 = stresses["vEd_u0"]
+        vEd = stresses["vEd"]
+        vRdc = stresses["vRdc"]
+        vRdmax = stresses["vRdmax"]
 
         need_reinf = vEd > vRdc
 
@@ -860,9 +1167,9 @@ def run():
             st.markdown(
                 f"""
                 <div class="metric-box" style="border-left: 3px solid {opening_color}; margin-top: 14px;">
-                    <div class="res-label">OTWÓR PROSTOKĄTNY</div>
+                    <div class="res-label">{"OTWÓR PROSTOKĄTNY" if len(openings) == 1 else f"OTWORY PROSTOKĄTNE ({len(openings)})"}</div>
                     <div class="res-val">
-                        {opening_status}: {hole_b:.1f} × {hole_h:.1f} cm
+                        {opening_status}: {hole_b:.1f} × {hole_h:.1f} cm{" + " + str(len(openings) - 1) + " dodatk." if len(openings) > 1 else ""}
                     </div>
                     <div class="layout-note">
                         Środek otworu: x = {hole_x:.1f} cm, y = {hole_y:.1f} cm. {opening_reason}
@@ -899,84 +1206,37 @@ def run():
                 unsafe_allow_html=True,
             )
 
-            k_out = 1.50
-            first_layer_a = 0.50 * d
-            radial_spacing_max = 0.75 * d
-            tangential_spacing_inner_max = 1.50 * d
-            tangential_spacing_outer_max = 2.00 * d
-            uout = beta * Ved * 1000 / (vRdc * d * 100)
-            x_out = max((uout - 2 * (b + h_col)) / (2 * math.pi), 2 * d)
-
-            if x_out < 3 * d:
-                first_layer_a = 0.30 * d
-                last_required_a = 1.50 * d
-            else:
-                last_required_a = max(first_layer_a + radial_spacing_max, x_out - k_out * d)
-
-            def round_up_to_multiple(value, multiple):
-                return int(math.ceil(value / multiple) * multiple)
-
-            radial_spacing = radial_spacing_max
-            n_layers_from_zone = math.ceil((last_required_a - first_layer_a) / radial_spacing) + 1
-            n_layers = max(2, n_layers_from_zone)
-            layer_offsets =[
-                first_layer_a + i * radial_spacing
-                for i in range(n_layers)
-            ]
-
-            d_mm = d * 10
-            u1_mm = u1 * 10
-            sr_design_mm = radial_spacing * 10
-            fywd_eff = min(250 + 0.25 * d_mm, fywd)
-
-            Asw_req_perimeter = max(
-                (vEd - 0.75 * vRdc)
-                * (u1_eff * 10.0)
-                * d_mm
-                / (1.5 * (d_mm / sr_design_mm) * fywd_eff),
-                0,
-            ) / 100
-
-            required_counts =[]
-            layer_effective_lengths = []
-            layer_reduction_ratios = []
-            for a_i in layer_offsets:
-                u_i = 2 * (b + h_col) + 2 * math.pi * a_i
-                reduction_ratio = 1.0
-                if opening_affects:
-                    ring_points = rectangle_perimeter_points(b + 2 * a_i, h_col + 2 * a_i, target_step_cm=0.40)
-                    ring_total_geom, ring_excluded = split_perimeter_lengths(
-                        ring_points,
-                        opening_angle_min,
-                        opening_angle_max,
-                        opening_angle_ref,
-                    )
-                    if ring_total_geom > 1e-9:
-                        reduction_ratio = max(1.0 - ring_excluded / ring_total_geom, 0.15)
-                u_i_eff = u_i * reduction_ratio
-                layer_effective_lengths.append(u_i_eff)
-                layer_reduction_ratios.append(reduction_ratio)
-                st_limit = (
-                    tangential_spacing_inner_max
-                    if a_i <= 2 * d
-                    else tangential_spacing_outer_max
-                )
-                n_i_spacing = max(4, math.ceil(u_i_eff / st_limit))
-                n_i_strength = max(4, math.ceil(Asw_req_perimeter / one_bar))
-                required_counts.append(max(n_i_spacing, n_i_strength))
-
-            # --- DECYZJA O SPOSOBIE ALOKACJI PRĘTÓW ---
-            if rozmieszczenie_typ == "Stała ilość / obwód":
-                n_per_layer = round_up_to_multiple(max(required_counts), 4)
-                layer_counts =[n_per_layer for _ in layer_offsets]
-            else:
-                layer_counts =[round_up_to_multiple(req, 4) for req in required_counts]
-            
-            n_total_layout = sum(layer_counts)
-            Asw_prov_perimeter_min = min(layer_counts) * one_bar
-            Asw_prov_perimeter_max = max(layer_counts) * one_bar
-            
-            Asw_prov_total = n_total_layout * one_bar
+            layout = punching_stud_layout(
+                b,
+                h_col,
+                d,
+                beta,
+                Ved,
+                vEd,
+                vRdc,
+                u1_eff,
+                fywk,
+                phi_sw,
+                rozmieszczenie_typ,
+                opening_sectors,
+            )
+            uout = layout["uout"]
+            x_out = layout["x_out"]
+            radial_spacing = layout["radial_spacing"]
+            n_layers = layout["n_layers"]
+            layer_offsets = layout["layer_offsets"]
+            layer_counts = layout["layer_counts"]
+            layer_effective_lengths = layout["layer_effective_lengths"]
+            layer_reduction_ratios = layout["layer_reduction_ratios"]
+            tangential_spacing_inner_max = layout["tangential_spacing_inner_max"]
+            tangential_spacing_outer_max = layout["tangential_spacing_outer_max"]
+            sr_design_mm = layout["sr_design_mm"]
+            fywd_eff = layout["fywd_eff"]
+            Asw_req_perimeter = layout["Asw_req_perimeter"]
+            n_total_layout = layout["n_total_layout"]
+            Asw_prov_perimeter_min = layout["Asw_prov_perimeter_min"]
+            Asw_prov_perimeter_max = layout["Asw_prov_perimeter_max"]
+            Asw_prov_total = layout["Asw_prov_total"]
             Asw_req = Asw_req_perimeter
 
             c_asw1, c_asw2, c_asw3 = st.columns(3)
@@ -1101,12 +1361,12 @@ def run():
                     ax.add_patch(uout_patch)
                     ax.text(b/2 + x_out + 3, 0, "uₒᵤₜ", color="#047857", fontsize=11, fontweight="bold", va="center")
 
-                    if opening_enabled:
+                    for o_x, o_y, o_b, o_h in openings:
                         ax.add_patch(
                             Rectangle(
-                                (hole_x - hole_b / 2, hole_y - hole_h / 2),
-                                hole_b,
-                                hole_h,
+                                (o_x - o_b / 2, o_y - o_h / 2),
+                                o_b,
+                                o_h,
                                 facecolor="#ffffff",
                                 edgecolor="#dc2626",
                                 linewidth=1.4,
@@ -1115,8 +1375,8 @@ def run():
                             )
                         )
                         ax.text(
-                            hole_x,
-                            hole_y,
+                            o_x,
+                            o_y,
                             "OTWÓR",
                             color="#991b1b",
                             ha="center",
@@ -1125,14 +1385,15 @@ def run():
                             fontweight="bold",
                             zorder=5,
                         )
-                        if opening_affects:
-                            ray_len = max(
-                                x_out,
-                                layer_offsets[-1] if layer_offsets else 0.0,
-                                math.hypot(hole_x, hole_y),
-                                2 * d,
-                            ) + max(b, h_col, hole_b, hole_h)
-                            for ang in (opening_angle_min, opening_angle_max):
+                    if opening_affects:
+                        ray_len = max(
+                            x_out,
+                            layer_offsets[-1] if layer_offsets else 0.0,
+                            2 * d,
+                            *(math.hypot(o_x, o_y) + max(o_b, o_h) for o_x, o_y, o_b, o_h in openings),
+                        ) + max(b, h_col)
+                        for sector in opening_sectors:
+                            for ang in sector[:2]:
                                 ax.plot(
                                     [0.0, ray_len * math.cos(ang)],
                                     [0.0, ray_len * math.sin(ang)],
@@ -1162,14 +1423,7 @@ def run():
                         ax.add_patch(Rectangle((-ring_w / 2, -ring_h / 2), ring_w, ring_h, fill=False, edgecolor="#94a3b8", linewidth=0.8, linestyle="-", zorder=2))
                     
                         # Punkty prętów/dybli (jednolite, ciemne CAD)
-                        pts = points_on_effective_rectangle(
-                            ring_w,
-                            ring_h,
-                            n_i,
-                            opening_angle_min if opening_affects else None,
-                            opening_angle_max if opening_affects else None,
-                            opening_angle_ref,
-                        )
+                        pts = points_on_effective_rectangle(ring_w, ring_h, n_i, opening_sectors)
                         ax.scatter([p[0] for p in pts], [p[1] for p in pts], s=25, color="#1e293b", edgecolor="#ffffff", linewidth=0.5, zorder=3)
 
                     # Opisy skrajnych obwodów
@@ -1180,8 +1434,8 @@ def run():
                         x_out,
                         layer_offsets[-1],
                         2 * d,
-                        abs(hole_x) + hole_b / 2 if opening_enabled else 0.0,
-                        abs(hole_y) + hole_h / 2 if opening_enabled else 0.0,
+                        *(abs(o_x) + o_b / 2 for o_x, o_y, o_b, o_h in openings),
+                        *(abs(o_y) + o_h / 2 for o_x, o_y, o_b, o_h in openings),
                     )
                     lim_x = b / 2 + max_a + 25
                     lim_y = h_col / 2 + max_a + 25
@@ -1235,6 +1489,11 @@ def run():
                 st.latex(rf"b_{{otw}} = {hole_b:.1f} \, \text{{cm}}, \quad h_{{otw}} = {hole_h:.1f} \, \text{{cm}}")
                 st.latex(rf"x_{{otw}} = {hole_x:.1f} \, \text{{cm}}, \quad y_{{otw}} = {hole_y:.1f} \, \text{{cm}}")
                 st.latex(rf"a_{{otw}} = {opening_distance:.2f} \, \text{{cm}}")
+                if len(openings) > 1:
+                    st.markdown(
+                        f"Otwory: {len(openings)}, rozłączne cienie na u1: {len(opening_sectors)} "
+                        "(suma przedziałów kątowych po sortowaniu)."
+                    )
                 if opening_affects:
                     st.latex(rf"u_{{1,eff}} = u_1 - \Delta u_{{otw}} = {u1:.2f} - {u1 - u1_eff:.2f} = {u1_eff:.2f} \, \text{{cm}}")
                 else:
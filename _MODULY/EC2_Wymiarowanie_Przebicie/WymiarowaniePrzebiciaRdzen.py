@@ -0,0 +1,680 @@
+# ==============================================================================
+# WymiarowaniePrzebiciaRdzen.py
+# Wspólny, parametryczny rdzeń przebicia dla słupów prostokątnych i okrągłych
+# (wewnętrznych, krawędziowych, narożnych) oraz zakończeń i naroży ścian,
+# w płytach stropowych (PS) i fundamentowych (PF).
+#
+# Każdy przypadek opisuje szablon obwodu: długość u(a) i pole A(a) obwodu
+# odsuniętego o a od lica podpory (postać zamknięta), obwód u0 oraz elementy
+# (odcinki / łuki) do rysunku. Strony przypadków wywołują render_punching_page.
+# ==============================================================================
+
+import streamlit as st
+import math
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib import patches
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from TABLICE.ParametryBetonu import list_concrete_classes, get_concrete_params  # noqa: E402
+from WymiarowaniePrzebiciaPlytySlupProstokatnyKwadratowyWewnetrznyPS import (  # noqa: E402
+    arc_piece,
+    bar_area_cm2,
+    beta_from_moments,
+    line_piece,
+    piece_length,
+    piece_point,
+    round_up_to_multiple,
+    rounded_rectangle_pieces,
+)
+
+
+# ==============================================================================
+# PRZYPADKI
+# ==============================================================================
+# beta_approx - wartości przybliżone wg EC2 6.4.3(6) (rys. 6.21N);
+# n_min / n_multiple - najmniejsza liczba elementów na obwód i krotność zaokrąglenia
+PRZYPADKI = {
+    "prostokatny_wewnetrzny": {"label": "Słup prostokątny wewnętrzny", "shape": "prostokatny",
+                               "beta_approx": 1.15, "n_min": 4, "n_multiple": 4},
+    "prostokatny_krawedziowy": {"label": "Słup prostokątny krawędziowy", "shape": "prostokatny",
+                                "beta_approx": 1.40, "n_min": 3, "n_multiple": 2},
+    "prostokatny_narozny": {"label": "Słup prostokątny narożny", "shape": "prostokatny",
+                            "beta_approx": 1.50, "n_min": 2, "n_multiple": 1},
+    "okragly_wewnetrzny": {"label": "Słup okrągły wewnętrzny", "shape": "okragly",
+                           "beta_approx": 1.15, "n_min": 4, "n_multiple": 4},
+    "okragly_krawedziowy": {"label": "Słup okrągły krawędziowy", "shape": "okragly",
+                            "beta_approx": 1.40, "n_min": 3, "n_multiple": 2},
+    "okragly_narozny": {"label": "Słup okrągły narożny", "shape": "okragly",
+                        "beta_approx": 1.50, "n_min": 2, "n_multiple": 1},
+    "sciana_zakonczenie": {"label": "Zakończenie ściany", "shape": "sciana",
+                           "beta_approx": 1.15, "n_min": 4, "n_multiple": 2},
+    "sciana_naroznik": {"label": "Narożnik ściany", "shape": "sciana",
+                        "beta_approx": 1.15, "n_min": 4, "n_multiple": 1},
+}
+
+TYPY_PLYT = {"PS": "Płyta stropowa", "PF": "Płyta fundamentowa"}
+
+
+# ==============================================================================
+# SZABLONY OBWODÓW
+# ==============================================================================
+def wall_effective_dimensions(t_cm, L_cm, d_cm):
+    # Wymiary zastępczej podpory dla ściany (jak dla podpór wydłużonych):
+    # b1 = min(t; 2.8d), a1 = min(L; 2t; 5.6d - b1), nie mniej niż b1
+    b1 = min(t_cm, 2.8 * d_cm)
+    a1 = max(min(L_cm, 2.0 * t_cm, 5.6 * d_cm - b1), b1)
+    return a1, b1
+
+
+def _affine_template(L0, k, A0, u0, pieces_fn, support, edges_fn):
+    # Obwód odsunięty o a od wypukłej podpory: u(a) = L0 + k a, A(a) = A0 + L0 a + k a^2 / 2
+    return {
+        "L0": L0,
+        "k": k,
+        "A0": A0,
+        "u0": u0,
+        "u": lambda a: L0 + k * np.asarray(a, dtype=float),
+        "area": lambda a: A0 + L0 * np.asarray(a, dtype=float) + 0.5 * k * np.asarray(a, dtype=float) ** 2,
+        "pieces": pieces_fn,
+        "support": support,
+        "edges": edges_fn,
+        "closed": math.isclose(k, 2 * math.pi),
+    }
+
+
+def _rect_edge_pieces(c1, c2, a):
+    # Krawędź płyty: y = 0, słup przy krawędzi (x w [-c2/2, c2/2], y w [-c1, 0])
+    hx = c2 / 2.0
+    return [
+        line_piece((-hx - a, 0.0), (-hx - a, -c1)),
+        arc_piece((-hx, -c1), a, math.pi, 1.5 * math.pi),
+        line_piece((-hx, -c1 - a), (hx, -c1 - a)),
+        arc_piece((hx, -c1), a, 1.5 * math.pi, 2 * math.pi),
+        line_piece((hx + a, -c1), (hx + a, 0.0)),
+    ]
+
+
+def _rect_corner_pieces(c1, c2, a):
+    # Krawędzie płyty: x = 0 i y = 0, słup w narożu (x w [-c2, 0], y w [-c1, 0])
+    return [
+        line_piece((-c2 - a, 0.0), (-c2 - a, -c1)),
+        arc_piece((-c2, -c1), a, math.pi, 1.5 * math.pi),
+        line_piece((-c2, -c1 - a), (0.0, -c1 - a)),
+    ]
+
+
+def _wall_corner_notch(a1, t, a):
+    # Naroże wklęsłe ściany L: kąt połowy łuku przy końcach ramion, gdy odsunięte
+    # boki wewnętrzne zanikają (a > a1 - t) - przecięcie okręgów wokół końców ramion
+    if a <= a1 - t:
+        return 0.5 * math.pi
+    disc = max(2.0 * a * a - (a1 - t) ** 2, 0.0)
+    p = (-(a1 + t) - math.sqrt(disc)) / 2.0
+    psi = math.atan2(p + t, p + a1) + 2 * math.pi
+    return psi - math.pi
+
+
+def _wall_corner_pieces(a1, t, a):
+    # Ściana L: ramiona x w [-a1, 0] (y w [-t, 0]) oraz y w [-a1, 0] (x w [-t, 0])
+    if a <= a1 - t:
+        notch = [
+            arc_piece((-a1, -t), a, math.pi, 1.5 * math.pi),
+            line_piece((-a1, -t - a), (-t - a, -t - a)),
+            line_piece((-t - a, -t - a), (-t - a, -a1)),
+            arc_piece((-t, -a1), a, math.pi, 1.5 * math.pi),
+        ]
+    else:
+        phi = _wall_corner_notch(a1, t, a)
+        notch = [
+            arc_piece((-a1, -t), a, math.pi, math.pi + phi),
+            arc_piece((-t, -a1), a, 1.5 * math.pi - phi, 1.5 * math.pi),
+        ]
+    return notch + [
+        line_piece((-t, -a1 - a), (0.0, -a1 - a)),
+        arc_piece((0.0, -a1), a, 1.5 * math.pi, 2 * math.pi),
+        line_piece((a, -a1), (a, 0.0)),
+        arc_piece((0.0, 0.0), a, 0.0, 0.5 * math.pi),
+        line_piece((0.0, a), (-a1, a)),
+        arc_piece((-a1, 0.0), a, 0.5 * math.pi, math.pi),
+        line_piece((-a1 - a, 0.0), (-a1 - a, -t)),
+    ]
+
+
+def _wall_corner_template(a1, t):
+    a_c = a1 - t
+    L0 = 4.0 * a1
+    k = 2.5 * math.pi - 2.0
+    A0 = 2.0 * a1 * t - t * t
+
+    def u(a):
+        a = np.asarray(a, dtype=float)
+        # Poza zakresem a <= a1 - t: łuki przy końcach ramion przecinają się na przekątnej
+        disc = np.maximum(2.0 * a * a - a_c ** 2, 0.0)
+        p = (-(a1 + t) - np.sqrt(disc)) / 2.0
+        phi = np.arctan2(p + t, p + a1) + math.pi
+        u_far = 2.0 * (a1 + t) + 1.5 * math.pi * a + 2.0 * a * phi
+        return np.where(a <= a_c, L0 + k * a, u_far)
+
+    def area(a):
+        # dA/da = u(a): całkowanie w postaci zamkniętej do a1 - t, dalej kwadratura
+        a = np.asarray(a, dtype=float)
+        near = A0 + L0 * np.minimum(a, a_c) + 0.5 * k * np.minimum(a, a_c) ** 2
+        if np.all(a <= a_c):
+            return near
+        grid = np.linspace(a_c, max(float(np.max(a)), a_c), 401)
+        u_grid = u(grid)
+        cumulative = np.concatenate(([0.0], np.cumsum(0.5 * (u_grid[1:] + u_grid[:-1]) * np.diff(grid))))
+        return near + np.where(a > a_c, np.interp(a, grid, cumulative), 0.0)
+
+    return {
+        "L0": L0,
+        "k": k,
+        "A0": A0,
+        "u0": L0,
+        "u": u,
+        "area": area,
+        "pieces": lambda a: _wall_corner_pieces(a1, t, a),
+        "support": [("polygon", [(-a1, -t), (-t, -t), (-t, -a1), (0.0, -a1), (0.0, 0.0), (-a1, 0.0)])],
+        "edges": lambda r: [],
+        "closed": True,
+    }
+
+
+@lru_cache(maxsize=256)
+def perimeter_template(case, dims, d_cm):
+    """
+    Szablon obwodów dla przypadku i geometrii (wyznaczany raz, pamiętany).
+    dims: (b, h) - słup prostokątny wewnętrzny, (c1, c2) - krawędziowy/narożny
+    (c1 prostopadle do krawędzi), (D,) - słup okrągły, (t, L) - ściany [cm].
+    """
+    meta = PRZYPADKI[case]
+    if case == "prostokatny_wewnetrzny":
+        b, h = dims
+        L0 = 2.0 * (b + h)
+        template = _affine_template(
+            L0, 2 * math.pi, b * h, L0,
+            lambda a: rounded_rectangle_pieces(b, h, a),
+            [("rect", (-b / 2, -h / 2), b, h)], lambda r: [],
+        )
+    elif case == "prostokatny_krawedziowy":
+        c1, c2 = dims
+        L0 = 2.0 * c1 + c2
+        template = _affine_template(
+            L0, math.pi, c1 * c2, min(c2 + 3.0 * d_cm, L0),
+            lambda a: _rect_edge_pieces(c1, c2, a),
+            [("rect", (-c2 / 2, -c1), c2, c1)], lambda r: [((-c2 / 2 - r, 0.0), (c2 / 2 + r, 0.0))],
+        )
+    elif case == "prostokatny_narozny":
+        c1, c2 = dims
+        L0 = c1 + c2
+        template = _affine_template(
+            L0, 0.5 * math.pi, c1 * c2, min(3.0 * d_cm, L0),
+            lambda a: _rect_corner_pieces(c1, c2, a),
+            [("rect", (-c2, -c1), c2, c1)],
+            lambda r: [((-c2 - r, 0.0), (0.0, 0.0)), ((0.0, 0.0), (0.0, -c1 - r))],
+        )
+    elif case == "okragly_wewnetrzny":
+        (D,) = dims
+        R = D / 2.0
+        template = _affine_template(
+            math.pi * D, 2 * math.pi, math.pi * R * R, math.pi * D,
+            lambda a: [arc_piece((0.0, 0.0), R + a, 0.0, 2 * math.pi)],
+            [("circle", (0.0, 0.0), R)], lambda r: [],
+        )
+    elif case == "okragly_krawedziowy":
+        (D,) = dims
+        R = D / 2.0
+        L0 = math.pi * R + D
+        template = _affine_template(
+            L0, math.pi, 0.5 * math.pi * R * R + D * R, min(D + 3.0 * d_cm, L0),
+            lambda a: [
+                line_piece((-R - a, 0.0), (-R - a, -R)),
+                arc_piece((0.0, -R), R + a, math.pi, 2 * math.pi),
+                line_piece((R + a, -R), (R + a, 0.0)),
+            ],
+            [("circle", (0.0, -R), R)], lambda r: [((-R - r, 0.0), (R + r, 0.0))],
+        )
+    elif case == "okragly_narozny":
+        (D,) = dims
+        R = D / 2.0
+        L0 = 0.5 * math.pi * R + D
+        template = _affine_template(
+            L0, 0.5 * math.pi, 0.25 * math.pi * R * R + D * R + R * R, min(3.0 * d_cm, L0),
+            lambda a: [
+                line_piece((-R - (R + a), 0.0), (-R - (R + a), -R)),
+                arc_piece((-R, -R), R + a, math.pi, 1.5 * math.pi),
+                line_piece((-R, -R - (R + a)), (0.0, -R - (R + a))),
+            ],
+            [("circle", (-R, -R), R)],
+            lambda r: [((-D - r, 0.0), (0.0, 0.0)), ((0.0, 0.0), (0.0, -D - r))],
+        )
+    elif case == "sciana_zakonczenie":
+        t, L = dims
+        a1, b1 = wall_effective_dimensions(t, L, d_cm)
+        L0 = 2.0 * (a1 + b1)
+        # Koniec ściany przy x = a1/2, ściana ciągnie się w kierunku -x
+        L_draw = max(L, a1 + 4 * d_cm)
+        template = _affine_template(
+            L0, 2 * math.pi, a1 * b1, L0,
+            lambda a: rounded_rectangle_pieces(a1, b1, a),
+            [("rect", (a1 / 2 - L_draw, -t / 2), L_draw, t), ("rect_eff", (-a1 / 2, -b1 / 2), a1, b1)],
+            lambda r: [],
+        )
+        template.update(a1=a1, b1=b1)
+    elif case == "sciana_naroznik":
+        t, L = dims
+        a1, b1 = wall_effective_dimensions(t, L, d_cm)
+        template = _wall_corner_template(a1, b1)
+        template.update(a1=a1, b1=b1)
+    else:
+        raise ValueError(f"Nieznany przypadek przebicia: {case}")
+
+    template.update(case=case, dims=dims, d=d_cm, **meta)
+    template["u1"] = float(template["u"](2.0 * d_cm))
+    template["A1"] = float(template["area"](2.0 * d_cm))
+    return template
+
+
+def template_offset_for_length(template, u_target, a_max):
+    # Odsunięcie a, dla którego u(a) = u_target (u rosnące; dla szablonu afinicznego wprost)
+    if template["case"] != "sciana_naroznik":
+        return (u_target - template["L0"]) / template["k"]
+    grid = np.linspace(0.0, a_max, 2001)
+    return float(np.interp(u_target, template["u"](grid), grid))
+
+
+# ==============================================================================
+# RDZEŃ OBLICZEŃ (BEZ INTERFEJSU)
+# ==============================================================================
+def template_stresses(template, d_cm, fck, Ved_kN, beta, rho_l, soil_kPa=0.0):
+    """
+    Naprężenia przy licu (u0) i na obwodzie kontrolnym oraz nośności bez zbrojenia.
+    soil_kPa > 0 (płyta fundamentowa): V_Ed,red = V_Ed - sigma A(a), obwód krytyczny
+    a <= 2d wyznaczany jako maksimum wytężenia v_Ed(a) / (v_Rd,c 2d / a) (EC2 6.4.4).
+    """
+    k = min(1 + math.sqrt(200 / (d_cm * 10)), 2.0)
+    CRdc = 0.18 / 1.5
+    vRdc = CRdc * k * ((100 * rho_l * fck) ** (1/3))
+    nu = 0.6 * (1 - fck / 250)
+    fcd = fck / 1.5
+    vRdmax = 0.5 * nu * fcd
+    u0 = template["u0"]
+    vEd_u0 = beta * Ved_kN * 1000 / (u0 * d_cm * 100)
+
+    if soil_kPa > 0:
+        a = np.linspace(2.0 * d_cm / 200, 2.0 * d_cm, 200)
+        Ved_red = np.maximum(Ved_kN - soil_kPa * template["area"](a) / 1e4, 0.0)
+        vEd_a = beta * Ved_red * 1000 / (template["u"](a) * d_cm * 100)
+        vRd_a = vRdc * 2.0 * d_cm / a
+        i = int(np.argmax(vEd_a / vRd_a))
+        a_crit, Ved_crit, vEd, vRd = float(a[i]), float(Ved_red[i]), float(vEd_a[i]), float(vRd_a[i])
+        Ved_red_u1 = float(Ved_red[-1])
+    else:
+        a_crit, Ved_crit = 2.0 * d_cm, Ved_kN
+        vEd = beta * Ved_kN * 1000 / (template["u1"] * d_cm * 100)
+        vRd = vRdc
+        Ved_red_u1 = Ved_kN
+
+    return {
+        "k": k, "CRdc": CRdc, "nu": nu, "fcd": fcd, "u0": u0, "u1": template["u1"],
+        "vEd_u0": vEd_u0, "vEd": vEd, "vRdc": vRdc, "vRd": vRd, "vRdmax": vRdmax,
+        "a_crit": a_crit, "u_crit": float(template["u"](a_crit)), "Ved_crit": Ved_crit,
+        "Ved_red_u1": Ved_red_u1,
+    }
+
+
+def template_stud_layout(template, d_cm, beta, Ved_kN, vEd_u1, vRdc, fywk, phi_sw,
+                         rozmieszczenie_typ="Stała ilość / obwód"):
+    """Obwody i liczba elementów zbrojenia na przebicie - reguły jak dla słupa wewnętrznego."""
+    d = d_cm
+    k_out = 1.50
+    first_layer_a = 0.50 * d
+    radial_spacing_max = 0.75 * d
+    tangential_spacing_inner_max = 1.50 * d
+    tangential_spacing_outer_max = 2.00 * d
+    uout = beta * Ved_kN * 1000 / (vRdc * d * 100)
+    x_out = max(template_offset_for_length(template, uout, 20.0 * d), 2 * d)
+
+    if x_out < 3 * d:
+        first_layer_a = 0.30 * d
+        last_required_a = 1.50 * d
+    else:
+        last_required_a = max(first_layer_a + radial_spacing_max, x_out - k_out * d)
+
+    radial_spacing = radial_spacing_max
+    n_layers = max(2, math.ceil((last_required_a - first_layer_a) / radial_spacing) + 1)
+    layer_offsets = first_layer_a + radial_spacing * np.arange(n_layers)
+
+    d_mm = d * 10
+    sr_design_mm = radial_spacing * 10
+    fywd_eff = min(250 + 0.25 * d_mm, fywk / 1.15)
+    one_bar = bar_area_cm2(phi_sw)
+
+    Asw_req_perimeter = max(
+        (vEd_u1 - 0.75 * vRdc)
+        * (template["u1"] * 10.0)
+        * d_mm
+        / (1.5 * (d_mm / sr_design_mm) * fywd_eff),
+        0,
+    ) / 100
+
+    # Wszystkie obwody z szablonu jednocześnie
+    u_layers = template["u"](layer_offsets)
+    st_limits = np.where(layer_offsets <= 2 * d, tangential_spacing_inner_max, tangential_spacing_outer_max)
+    n_min = template["n_min"]
+    n_multiple = template["n_multiple"]
+    # Obwód otwarty (krawędź płyty) ma elementy na obu końcach
+    n_spacing = np.ceil(u_layers / st_limits) + (0 if template["closed"] else 1)
+    n_strength = max(n_min, math.ceil(Asw_req_perimeter / one_bar))
+    required_counts = np.maximum(np.maximum(n_spacing, n_min), n_strength).astype(int).tolist()
+
+    if rozmieszczenie_typ == "Stała ilość / obwód":
+        layer_counts = [round_up_to_multiple(max(required_counts), n_multiple)] * n_layers
+    else:
+        layer_counts = [round_up_to_multiple(req, n_multiple) for req in required_counts]
+
+    n_total_layout = sum(layer_counts)
+    return {
+        "uout": uout,
+        "x_out": x_out,
+        "radial_spacing": radial_spacing,
+        "n_layers": n_layers,
+        "layer_offsets": layer_offsets.tolist(),
+        "layer_counts": layer_counts,
+        "layer_lengths": u_layers.tolist(),
+        "tangential_spacing_inner_max": tangential_spacing_inner_max,
+        "tangential_spacing_outer_max": tangential_spacing_outer_max,
+        "sr_design_mm": sr_design_mm,
+        "fywd_eff": fywd_eff,
+        "Asw_req_perimeter": Asw_req_perimeter,
+        "n_total_layout": n_total_layout,
+        "Asw_prov_perimeter_min": min(layer_counts) * one_bar,
+        "Asw_prov_perimeter_max": max(layer_counts) * one_bar,
+        "Asw_prov_total": n_total_layout * one_bar,
+    }
+
+
+def punching_check(case, dims, d_cm, fck, Ved_kN, rho_x=0.0, rho_y=0.0, beta=None, soil_kPa=0.0,
+                   fywk=500.0, phi_sw=10, rozmieszczenie_typ="Stała ilość / obwód"):
+    """
+    Pełne sprawdzenie przebicia dla dowolnego przypadku z PRZYPADKI (bez interfejsu).
+    beta=None - wartość przybliżona przypadku; soil_kPa - odpór gruntu (płyta fundamentowa).
+    """
+    template = perimeter_template(case, tuple(float(v) for v in dims), float(d_cm))
+    if beta is None:
+        beta = template["beta_approx"]
+    rho_l = min(math.sqrt(rho_x * rho_y), 0.02)
+
+    result = {"case": case, "template": template, "beta": beta, "rho_l": rho_l, "soil_kPa": soil_kPa}
+    result.update(template_stresses(template, d_cm, fck, Ved_kN, beta, rho_l, soil_kPa))
+    result["basic_ok"] = result["vEd"] <= result["vRd"]
+    result["max_ok"] = result["vEd_u0"] <= result["vRdmax"]
+    result["need_reinf"] = not result["basic_ok"]
+    result["layout"] = None
+    if result["need_reinf"] and result["max_ok"]:
+        vEd_u1 = beta * result["Ved_red_u1"] * 1000 / (template["u1"] * d_cm * 100)
+        result["layout"] = template_stud_layout(
+            template, d_cm, beta, result["Ved_red_u1"], vEd_u1, result["vRdc"], fywk, phi_sw, rozmieszczenie_typ,
+        )
+    return result
+
+
+# ==============================================================================
+# RYSUNEK
+# ==============================================================================
+def _draw_pieces(ax, pieces, **style):
+    for piece in pieces:
+        if piece[0] == "line":
+            (x0, y0), (x1, y1) = piece[1], piece[2]
+            ax.plot([x0, x1], [y0, y1], **style)
+        elif piece[2] > 1e-9:
+            (cx, cy), radius, a0, a1 = piece[1], piece[2], piece[3], piece[4]
+            ax.add_patch(patches.Arc(
+                (cx, cy), 2 * radius, 2 * radius, theta1=math.degrees(a0), theta2=math.degrees(a1),
+                color=style.get("color", "black"), lw=style.get("lw", 1.0), ls=style.get("ls", "-"),
+            ))
+
+
+def points_on_pieces(pieces, count, closed=True):
+    # Punkty rozłożone równomiernie wzdłuż obwodu (otwarty - z punktami na obu końcach)
+    lengths = np.array([piece_length(p) for p in pieces])
+    total = lengths.sum()
+    if count <= 0 or total <= 0:
+        return []
+    if closed:
+        s = (np.arange(count) + 0.5) * total / count
+    else:
+        s = np.linspace(0.0, total, count) if count > 1 else np.array([0.5 * total])
+    starts = np.concatenate(([0.0], np.cumsum(lengths)[:-1]))
+    idx = np.clip(np.searchsorted(starts, s, side="right") - 1, 0, len(pieces) - 1)
+    points = []
+    for i, si in zip(idx, s):
+        t = (si - starts[i]) / lengths[i] if lengths[i] > 0 else 0.0
+        points.append(piece_point(pieces[i], min(max(t, 0.0), 1.0)))
+    return points
+
+
+def draw_template(result):
+    template = result["template"]
+    d = template["d"]
+    fig, ax = plt.subplots(figsize=(6.0, 6.0))
+
+    for item in template["support"]:
+        if item[0] == "rect":
+            ax.add_patch(patches.Rectangle(item[1], item[2], item[3], facecolor="#d9d9d9", edgecolor="black", lw=1.2))
+        elif item[0] == "rect_eff":
+            ax.add_patch(patches.Rectangle(item[1], item[2], item[3], fill=False, edgecolor="black", lw=0.8, ls="--"))
+        elif item[0] == "circle":
+            ax.add_patch(patches.Circle(item[1], item[2], facecolor="#d9d9d9", edgecolor="black", lw=1.2))
+        elif item[0] == "polygon":
+            ax.add_patch(patches.Polygon(item[1], closed=True, facecolor="#d9d9d9", edgecolor="black", lw=1.2))
+
+    layout = result["layout"]
+    reach = 1.2 * max(layout["x_out"] if layout else 0.0, 2.0 * d)
+    for p0, p1 in template["edges"](reach):
+        ax.plot([p0[0], p1[0]], [p0[1], p1[1]], color="black", lw=2.5)
+
+    _draw_pieces(ax, template["pieces"](result["a_crit"]), color="black", lw=1.4, ls="--")
+    if layout:
+        _draw_pieces(ax, template["pieces"](layout["x_out"]), color="black", lw=1.0, ls=":")
+        for a_i, n_i in zip(layout["layer_offsets"], layout["layer_counts"]):
+            pts = points_on_pieces(template["pieces"](a_i), n_i, template["closed"])
+            if pts:
+                xs, ys = zip(*pts)
+                ax.plot(xs, ys, "o", color="black", ms=3.5)
+
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    ax.margins(0.08)
+    ax.set_xlabel("[cm]")
+    ax.grid(True, lw=0.3, alpha=0.5)
+    ax.set_title(f"{template['label']} - obwód kontrolny (a = {result['a_crit'] / d:.2f}d)", fontsize=10)
+    return fig
+
+
+# ==============================================================================
+# STRONA (WSPÓLNA DLA WSZYSTKICH PRZYPADKÓW)
+# ==============================================================================
+def _geometry_inputs(case, key):
+    shape = PRZYPADKI[case]["shape"]
+    c1, c2 = st.columns(2)
+    if shape == "okragly":
+        with c1:
+            D = st.number_input("Średnica słupa $D$ [cm]", value=40.0, min_value=10.0, step=5.0, key=f"D_{key}")
+        return (D,)
+    if shape == "sciana":
+        with c1:
+            t = st.number_input("Grubość ściany $t$ [cm]", value=25.0, min_value=10.0, step=5.0, key=f"t_{key}")
+        with c2:
+            L = st.number_input(
+                "Długość ściany / ramienia $L$ [cm]", value=200.0, min_value=10.0, step=10.0, key=f"L_{key}"
+            )
+        return (t, L)
+    if case == "prostokatny_wewnetrzny":
+        labels = ("Wymiar słupa $b$ [cm]", "Wymiar słupa $h$ [cm]")
+    else:
+        labels = ("Wymiar $c_1$ (prostopadle do krawędzi) [cm]", "Wymiar $c_2$ (wzdłuż krawędzi) [cm]")
+    with c1:
+        v1 = st.number_input(labels[0], value=40.0, min_value=10.0, step=5.0, key=f"c1_{key}")
+    with c2:
+        v2 = st.number_input(labels[1], value=40.0, min_value=10.0, step=5.0, key=f"c2_{key}")
+    return (v1, v2)
+
+
+def render_punching_page(case, slab):
+    """Strona kalkulatora dla przypadku case (klucz PRZYPADKI) i typu płyty slab ("PS" / "PF")."""
+    meta = PRZYPADKI[case]
+    key = f"{case}_{slab}".lower()
+    st.markdown(f"#### {meta['label']} - {TYPY_PLYT[slab].lower()}")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        Ved = st.number_input("Siła przebijająca $V_{Ed}$ [kN]", value=500.0, min_value=0.0, step=50.0,
+                              key=f"ved_{key}")
+    with c2:
+        h_p = st.number_input("Grubość płyty $h$ [cm]", value=25.0 if slab == "PS" else 50.0, min_value=10.0,
+                              step=1.0, key=f"hp_{key}")
+    dims = _geometry_inputs(case, key)
+
+    phi_list = [8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32]
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        concrete = st.selectbox("Klasa betonu", list_concrete_classes(), index=4, key=f"conc_{key}")
+    with c2:
+        phi_x = st.selectbox("$\\phi_x$ [mm]", phi_list, index=4, key=f"phix_{key}")
+    with c3:
+        phi_y = st.selectbox("$\\phi_y$ [mm]", phi_list, index=4, key=f"phiy_{key}")
+    with c4:
+        cnom = st.number_input("Otulina $c_{nom}$ [mm]", value=30, step=5, key=f"cnom_{key}")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        As_x = st.number_input("Zbrojenie $A_{s,x}$ [cm²/m]", value=10.0, min_value=0.0, step=1.0, key=f"asx_{key}")
+    with c2:
+        As_y = st.number_input("Zbrojenie $A_{s,y}$ [cm²/m]", value=10.0, min_value=0.0, step=1.0, key=f"asy_{key}")
+
+    beta_modes = ["Auto", "Ręcznie"]
+    if case == "prostokatny_wewnetrzny":
+        beta_modes.insert(1, "Wylicz")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        beta_mode = st.radio("Współczynnik $\\beta$", beta_modes, horizontal=True, key=f"beta_mode_{key}")
+    beta = meta["beta_approx"]
+    if beta_mode == "Wylicz":
+        with c2:
+            Mx = st.number_input("$M_x$ [kNm]", value=10.0, step=10.0, key=f"mx_{key}")
+        with c3:
+            My = st.number_input("$M_y$ [kNm]", value=10.0, step=10.0, key=f"my_{key}")
+        beta = beta_from_moments(Ved, dims[0], dims[1], Mx, My)
+    elif beta_mode == "Ręcznie":
+        with c2:
+            beta = st.number_input("$\\beta$ [-]", value=meta["beta_approx"], min_value=1.0, step=0.05,
+                                   key=f"beta_{key}")
+    else:
+        with c2:
+            st.text_input("$\\beta$ [-]", value=f"{beta:.2f}", disabled=True, key=f"beta_auto_{key}")
+
+    soil = 0.0
+    if slab == "PF":
+        soil = st.number_input("Odpór gruntu netto $\\sigma_{gd}$ [kPa]", value=150.0, min_value=0.0, step=10.0,
+                               key=f"soil_{key}")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        phi_sw = st.selectbox("Średnica dybli / strzemion $\\phi_{sw}$ [mm]", [8, 10, 12, 14, 16], index=1,
+                              key=f"phisw_{key}")
+    with c2:
+        fywk = st.number_input("$f_{ywk}$ [MPa]", value=500.0, step=10.0, key=f"fywk_{key}")
+    with c3:
+        rozmieszczenie_typ = st.selectbox(
+            "Rozmieszczenie", ["Stała ilość / obwód", "Minimalna ilość / obwód"], key=f"rozm_{key}"
+        )
+
+    if not st.button("OBLICZ", key=f"btn_{key}", use_container_width=True):
+        return
+
+    d = ((h_p * 10 - cnom - phi_x / 2) + (h_p * 10 - cnom - phi_x - phi_y / 2)) / 2 / 10
+    if d <= 0:
+        st.error("Wysokość użyteczna płyty $d$ jest niedodatnia - sprawdź grubość płyty i otulinę.")
+        return
+    rho_x = As_x / (100 * d)
+    rho_y = As_y / (100 * d)
+    fck = get_concrete_params(concrete).fck
+    res = punching_check(case, dims, d, fck, Ved, rho_x, rho_y, beta, soil, fywk, phi_sw, rozmieszczenie_typ)
+    template = res["template"]
+
+    st.markdown("---")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("d [cm]", f"{d:.1f}")
+    c2.metric("u0 [cm]", f"{res['u0']:.1f}")
+    c3.metric("u1 [cm]" if slab == "PS" else "u(a_crit) [cm]", f"{res['u_crit']:.1f}")
+    c4.metric("β [-]", f"{beta:.2f}")
+
+    c1, c2 = st.columns(2)
+    c1.metric("v_Ed,0 / v_Rd,max", f"{res['vEd_u0'] / res['vRdmax']:.2f}",
+              help=f"{res['vEd_u0']:.3f} / {res['vRdmax']:.3f} MPa")
+    c2.metric("v_Ed / v_Rd,c", f"{res['vEd'] / res['vRd']:.2f}", help=f"{res['vEd']:.3f} / {res['vRd']:.3f} MPa")
+
+    if not res["max_ok"]:
+        st.error("Przekroczona nośność krzyżulców ściskanych przy licu podpory ($v_{Ed,0} > v_{Rd,max}$). "
+                 "Zwiększ grubość płyty lub wymiary podpory.")
+    elif res["need_reinf"]:
+        st.warning("Wymagane zbrojenie na przebicie.")
+    else:
+        st.success("Nośność na przebicie bez zbrojenia poprzecznego jest wystarczająca.")
+
+    layout = res["layout"]
+    if layout:
+        df = pd.DataFrame({
+            "obwód": np.arange(1, layout["n_layers"] + 1),
+            "a [cm]": layout["layer_offsets"],
+            "a/d [-]": np.asarray(layout["layer_offsets"]) / d,
+            "u_i [cm]": layout["layer_lengths"],
+            "n [szt.]": layout["layer_counts"],
+        })
+        st.dataframe(df.round(2), hide_index=True, use_container_width=True)
+        st.markdown(
+            f"$u_{{out}}$ = {layout['uout']:.1f} cm, $x_{{out}}$ = {layout['x_out']:.1f} cm, "
+            f"$s_r$ = {layout['sr_design_mm']:.0f} mm, $f_{{ywd,ef}}$ = {layout['fywd_eff']:.0f} MPa, "
+            f"$A_{{sw}}$ = {layout['Asw_req_perimeter']:.2f} cm² / obwód, "
+            f"razem {layout['n_total_layout']} szt. ∅{phi_sw}"
+        )
+
+    st.pyplot(draw_template(res))
+    plt.close("all")
+
+    with st.expander("Szczegóły obliczeń"):
+        st.latex(rf"k = 1 + \sqrt{{200/d}} = {res['k']:.3f},\quad \rho_l = {res['rho_l']:.4f}")
+        st.latex(rf"v_{{Rd,c}} = C_{{Rd,c}}\,k\,(100\rho_l f_{{ck}})^{{1/3}} = {res['vRdc']:.3f}\ \mathrm{{MPa}}")
+        st.latex(rf"u(a) = {template['L0']:.1f} + {template['k']:.3f}\,a\ \mathrm{{[cm]}}"
+                 if case != "sciana_naroznik" else
+                 rf"u(a) = {template['L0']:.1f} + {template['k']:.3f}\,a\quad (a \le a_1 - t)")
+        if "a1" in template:
+            st.latex(rf"a_1 = {template['a1']:.1f}\ \mathrm{{cm}},\quad b_1 = {template['b1']:.1f}\ \mathrm{{cm}}")
+        if slab == "PF":
+            st.latex(rf"a_{{crit}} = {res['a_crit']:.1f}\ \mathrm{{cm}},\quad "
+                     rf"V_{{Ed,red}} = V_{{Ed}} - \sigma_{{gd}} A(a_{{crit}}) = {res['Ved_crit']:.1f}\ \mathrm{{kN}}")
+            st.latex(rf"v_{{Rd}} = v_{{Rd,c}}\,\frac{{2d}}{{a_{{crit}}}} = {res['vRd']:.3f}\ \mathrm{{MPa}}")
+        st.latex(rf"v_{{Ed}} = \frac{{\beta V}}{{u\,d}} = {res['vEd']:.3f}\ \mathrm{{MPa}},\quad "
+                 rf"v_{{Ed,0}} = \frac{{\beta V_{{Ed}}}}{{u_0 d}} = {res['vEd_u0']:.3f}\ \mathrm{{MPa}}")
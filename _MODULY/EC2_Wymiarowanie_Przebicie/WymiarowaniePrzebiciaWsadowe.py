@@ -0,0 +1,174 @@
+"""
+WymiarowaniePrzebiciaWsadowe.py
+Sprawdzenie przebicia dla wszystkich słupów stropu płaskiego (bez interfejsu Streamlit).
+
+Wejście: tabela słupów (CSV) z kolumnami:
+    id, typ, b, h, d, V_Ed, Mx, My, rho_x, rho_y
+oraz opcjonalnie: beton, phi_sw, otwory.
+    - typ: "wewnetrzny", "krawedziowy" lub "narozny" (pozostałe typy są
+      zgłaszane jako nieobsługiwane),
+    - b, h, d [cm], V_Ed [kN], Mx, My [kNm], rho_x, rho_y [-]
+      (dla słupa krawędziowego/narożnego b = c1 prostopadle do krawędzi, h = c2),
+    - otwory: "x;y;b;h" [cm] względem osi słupa, kolejne rozdzielone "|"
+      (pusty - brak otworów).
+
+Słupy wewnętrzne liczone są rdzeniem strony słupa wewnętrznego
+(punching_check_interior: beta z momentów, u0/u1, otwory, układ dybli),
+krawędziowe i narożne - wspólnym rdzeniem przypadków (WymiarowaniePrzebiciaRdzen,
+beta przybliżone wg EC2 6.4.3(6), bez otworów).
+Słupy rozdzielane są na pulę procesów (--workers).
+
+Wyjście: tabela wytężeń i wymaganej liczby elementów zbrojenia (CSV).
+
+Przykład:
+    python WymiarowaniePrzebiciaWsadowe.py slupy.csv -o przebicie.csv --concrete C30/37 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import WymiarowaniePrzebiciaPlytySlupProstokatnyKwadratowyWewnetrznyPS as przebicie  # noqa: E402
+import WymiarowaniePrzebiciaRdzen as rdzen  # noqa: E402
+from TABLICE.ParametryBetonu import get_concrete_params  # noqa: E402
+
+KOLUMNY_WYMAGANE = ["id", "typ", "b", "h", "d", "V_Ed", "Mx", "My", "rho_x", "rho_y"]
+TYPY_OBSLUGIWANE = ["wewnetrzny", "krawedziowy", "narozny"]
+
+
+def parse_openings(text):
+    """Lista otworów z zapisu "x;y;b;h|x;y;b;h" [cm] (pusta, gdy brak)."""
+    if text is None or (isinstance(text, float) and pd.isna(text)) or not str(text).strip():
+        return []
+    openings = []
+    for item in str(text).split("|"):
+        values = [float(v) for v in item.split(";")]
+        if len(values) != 4:
+            raise ValueError(f"Otwór '{item}' - oczekiwano x;y;b;h")
+        openings.append(tuple(values))
+    return openings
+
+
+def check_column(row, concrete_name="C30/37", fywk=500.0, phi_sw=10, rozmieszczenie_typ="Stała ilość / obwód"):
+    """Sprawdzenie jednego słupa (wiersz tabeli jako słownik). Zwraca wiersz tabeli wyników."""
+    out = {"id": row["id"], "typ": row["typ"]}
+    typ = str(row["typ"]).strip().lower()
+    if typ not in TYPY_OBSLUGIWANE:
+        out["status"] = "NIEOBSŁUGIWANY TYP"
+        return out
+
+    try:
+        concrete = row.get("beton") if isinstance(row.get("beton"), str) else concrete_name
+        phi = int(row["phi_sw"]) if not pd.isna(row.get("phi_sw", float("nan"))) else phi_sw
+        fck = get_concrete_params(concrete).fck
+        if typ == "wewnetrzny":
+            res = przebicie.punching_check_interior(
+                float(row["b"]), float(row["h"]), float(row["d"]), fck,
+                float(row["V_Ed"]), float(row["Mx"]), float(row["My"]), float(row["rho_x"]), float(row["rho_y"]),
+                fywk=fywk, phi_sw=phi, rozmieszczenie_typ=rozmieszczenie_typ,
+                openings=parse_openings(row.get("otwory")),
+            )
+        else:
+            res = rdzen.punching_check(
+                f"prostokatny_{typ}", (float(row["b"]), float(row["h"])), float(row["d"]), fck,
+                float(row["V_Ed"]), float(row["rho_x"]), float(row["rho_y"]),
+                fywk=fywk, phi_sw=phi, rozmieszczenie_typ=rozmieszczenie_typ,
+            )
+            res.update(u1_eff=res["u1"], opening_reduction_pct=0.0)
+    except Exception as e:
+        out["status"] = f"BŁĄD: {e}"
+        return out
+
+    if not res["max_ok"]:
+        status = "PRZEKROCZONE v_Rd,max"
+    elif res["need_reinf"]:
+        status = "ZBROJENIE"
+    else:
+        status = "OK"
+
+    layout = res["layout"] or {}
+    out.update({
+        "status": status,
+        "beta": res["beta"],
+        "u1_eff [cm]": res["u1_eff"],
+        "redukcja u1 [%]": res["opening_reduction_pct"],
+        "vEd,0/vRd,max": res["vEd_u0"] / res["vRdmax"],
+        "vEd/vRd,c": res["vEd"] / res["vRdc"],
+        "n_obwodow": layout.get("n_layers", 0),
+        "n_elementow": layout.get("n_total_layout", 0),
+        "n_max/obwod": max(layout.get("layer_counts", [0])),
+        "Asw_total [cm2]": layout.get("Asw_prov_total", 0.0),
+        "x_out [cm]": layout.get("x_out", 0.0),
+    })
+    return out
+
+
+def _check_column_args(args):
+    return check_column(*args)
+
+
+def check_floor(columns, concrete_name="C30/37", fywk=500.0, phi_sw=10,
+                rozmieszczenie_typ="Stała ilość / obwód", workers=None):
+    """Sprawdzenie wszystkich słupów z tabeli (DataFrame). workers=1 - bez puli procesów."""
+    brak = [k for k in KOLUMNY_WYMAGANE if k not in columns.columns]
+    if brak:
+        raise ValueError(f"Brak wymaganych kolumn tabeli słupów: {', '.join(brak)}")
+
+    rows = columns.to_dict("records")
+    tasks = [(row, concrete_name, fywk, phi_sw, rozmieszczenie_typ) for row in rows]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(rows) < 2:
+        results = [_check_column_args(t) for t in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_check_column_args, tasks, chunksize=chunksize))
+    return pd.DataFrame(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sprawdzenie przebicia dla wszystkich słupów stropu (EC2).")
+    parser.add_argument("input", help="Tabela słupów (CSV).")
+    parser.add_argument("-o", "--output", default="przebicie_slupy.csv", help="Tabela wyników (CSV).")
+    parser.add_argument("--concrete", default="C30/37", help="Klasa betonu (gdy brak kolumny beton).")
+    parser.add_argument("--fywk", type=float, default=500.0, help="Granica plastyczności zbrojenia na przebicie [MPa].")
+    parser.add_argument("--phi-sw", type=int, default=10, help="Średnica elementów zbrojenia [mm] (gdy brak kolumny phi_sw).")
+    parser.add_argument("--min-count", action="store_true", help="Minimalna ilość elementów na obwód zamiast stałej.")
+    parser.add_argument("--workers", type=int, default=None, help="Liczba procesów (domyślnie liczba rdzeni).")
+    args = parser.parse_args(argv)
+
+    columns = pd.read_csv(args.input, sep=None, engine="python")
+    rozmieszczenie_typ = "Minimalna ilość / obwód" if args.min_count else "Stała ilość / obwód"
+
+    t_start = time.perf_counter()
+    results = check_floor(columns, args.concrete, args.fywk, args.phi_sw, rozmieszczenie_typ, args.workers)
+    elapsed = time.perf_counter() - t_start
+    results.to_csv(args.output, index=False)
+
+    print(f"Sprawdzono {len(results)} słupów w {elapsed:.2f} s. Wyniki: {args.output}")
+    print(results["status"].value_counts().to_string())
+
+
+if __name__ == "__main__":
+    main()
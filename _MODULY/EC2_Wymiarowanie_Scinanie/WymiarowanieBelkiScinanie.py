@@ -6,6 +6,9 @@
 import streamlit as st
 import math
 
+import numpy as np
+import pandas as pd
+
 # --- TABLICE ---
 try:
     from TABLICE.ParametryBetonu import CONCRETE_TABLE, list_concrete_classes
@@ -15,6 +18,138 @@ except Exception:
     st.stop()
 
 
+# ==============================================================================
+# SILNIK WSADOWY - ŚCINANIE WZDŁUŻ BELKI (WEKTOROWO)
+# ==============================================================================
+
+COT_THETA_MIN = 1.0
+COT_THETA_MAX = 2.5
+
+
+def design_shear_along_span(concrete_name, steel_name, bw_cm, h_cm, phi_w, n_legs, As1_cm2, a1_mm,
+                            V_Ed_kN, cot_step=0.01, cot_theta=None):
+    """
+    Wymiarowanie strzemion dla wykresu V_Ed [kN] w wielu przekrojach (bez interfejsu).
+    Dla każdego przekroju przeglądany jest cały zakres cot(theta) 1.0-2.5 jako tablica
+    i wybierany kąt dający najmniejsze A_sw przy spełnionym V_Ed <= V_Rd,max.
+    Podanie cot_theta wyłącza dobór kąta (obliczenie dla zadanego kąta, jak na stronie).
+    As1_cm2 może być tablicą (zmienne zbrojenie podłużne). Zwraca słownik tablic
+    oraz wielkości pośrednie (d, z, f_cd, f_ywd, nu1, k, rho_l, v_min, v_Rd,c).
+    """
+    beton = CONCRETE_TABLE[concrete_name]
+    stal = STEEL_TABLE[steel_name]
+
+    fck = beton.fck
+    fyk = stal.fyk
+    gamma_c = 1.4
+    gamma_s = 1.15
+
+    d_mm = h_cm * 10 - a1_mm
+    d_m = d_mm / 1000
+    z_m = 0.9 * d_m
+    bw_m = bw_cm / 100
+
+    nu1 = 0.6 * (1 - fck / 250)
+    fcd = fck / gamma_c
+    fywd = fyk / gamma_s
+
+    V_Ed = np.abs(np.asarray(V_Ed_kN, dtype=float))
+    As1_mm2 = np.asarray(As1_cm2, dtype=float) * 100
+
+    # V_Rd,c
+    rho_l = np.minimum(As1_mm2 / (bw_cm * 10 * d_mm), 0.02)
+    k = min(1 + math.sqrt(200 / d_mm), 2.0)
+    C_Rd_c = 0.18 / gamma_c
+    v_min = 0.035 * k**1.5 * math.sqrt(fck)
+    v_Rd_c_val = np.maximum(C_Rd_c * k * (100 * rho_l * fck) ** (1 / 3), v_min)
+    V_Rd_c = np.broadcast_to(v_Rd_c_val * bw_m * d_m * 1000, V_Ed.shape)
+
+    # Siatka (przekrój x cot_theta): V_Rd,max i wymagane A_sw
+    if cot_theta is None:
+        cot_grid = np.round(np.arange(COT_THETA_MIN, COT_THETA_MAX + cot_step / 2, cot_step), 6)
+    else:
+        cot_grid = np.array([float(cot_theta)])
+    V_Rd_max_grid = (bw_m * z_m * nu1 * fcd / (cot_grid + 1 / cot_grid)) * 1000
+    a_sw_grid = (V_Ed[..., None] / 1000.0) / (z_m * fywd * cot_grid) * 10000
+    admissible = V_Ed[..., None] <= V_Rd_max_grid
+
+    # Najmniejsze A_sw wśród kątów dopuszczalnych; brak - cot = 1.0 (największe V_Rd,max)
+    crushing_ok = admissible.any(axis=-1)
+    idx = np.argmin(np.where(admissible, a_sw_grid, np.inf), axis=-1)
+    idx = np.where(crushing_ok, idx, 0)
+    cot_sel = cot_grid[idx]
+    V_Rd_max = V_Rd_max_grid[idx]
+
+    shear_needed = V_Ed > V_Rd_c
+    a_sw_req = np.where(shear_needed, np.take_along_axis(a_sw_grid, idx[..., None], axis=-1)[..., 0], 0.0)
+    # Bez zbrojenia obliczeniowego kąt nie ma znaczenia - przyjmuje się największy dopuszczalny
+    if cot_theta is None:
+        cot_sel = np.where(shear_needed | ~crushing_ok, cot_sel, COT_THETA_MAX)
+
+    rho_w_min = 0.08 * math.sqrt(fck) / fyk
+    a_sw_min = rho_w_min * bw_m * 10000
+    a_sw_design = np.maximum(a_sw_min, a_sw_req)
+
+    Asw = n_legs * math.pi * (phi_w / 20) ** 2
+    s_cal = np.where(a_sw_design > 0, Asw / a_sw_design * 100, 100.0)
+    s_max = min(0.75 * d_mm / 10, 40)
+    s = np.floor(np.minimum(s_cal, s_max))
+
+    return {
+        "V_Ed": V_Ed,
+        "V_Rd_c": V_Rd_c,
+        "V_Rd_max": V_Rd_max,
+        "cot_theta": cot_sel,
+        "crushing_ok": crushing_ok,
+        "shear_needed": shear_needed,
+        "a_sw_req": a_sw_req,
+        "a_sw_min": a_sw_min,
+        "a_sw_design": a_sw_design,
+        "s_cal": s_cal,
+        "s_max": s_max,
+        "s": s,
+        "Asw": Asw,
+        "fck": fck, "fyk": fyk, "fcd": fcd, "fywd": fywd, "nu1": nu1,
+        "d_mm": d_mm, "z_m": z_m, "k": k, "rho_l": rho_l, "v_min": v_min, "v_Rd_c_val": v_Rd_c_val,
+    }
+
+
+def stirrup_zoning(x_m, s_cm, V_Ed_kN=None, cot_theta=None, crushing_ok=None, spacing_module_cm=5.0):
+    """
+    Strefy strzemion: ciągi przekrojów o jednakowym rozstawie (zaokrąglonym w dół
+    do modułu spacing_module_cm). Przekrój reprezentuje odcinek między środkami
+    sąsiednich przekrojów. Zwraca DataFrame zestawienia stref.
+    """
+    x_m = np.asarray(x_m, dtype=float)
+    s_cm = np.asarray(s_cm, dtype=float)
+    s_zone = np.where(s_cm >= spacing_module_cm, np.floor(s_cm / spacing_module_cm) * spacing_module_cm, np.floor(s_cm))
+
+    edges = np.concatenate([[x_m[0]], 0.5 * (x_m[1:] + x_m[:-1]), [x_m[-1]]])
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(s_zone) != 0) + 1])
+    ends = np.concatenate([starts[1:], [len(x_m)]])
+
+    x_from = edges[starts]
+    x_to = edges[ends]
+    length = x_to - x_from
+    s_out = s_zone[starts]
+
+    zones = {
+        "strefa": np.arange(1, len(starts) + 1),
+        "x_od [m]": x_from,
+        "x_do [m]": x_to,
+        "dlugosc [m]": length,
+        "s [cm]": s_out,
+        "n_strzemion": np.ceil(np.round(length * 100 / np.maximum(s_out, 1), 9)).astype(int),
+    }
+    if V_Ed_kN is not None:
+        zones["V_Ed_max [kN]"] = np.maximum.reduceat(np.abs(np.asarray(V_Ed_kN, dtype=float)), starts)
+    if cot_theta is not None:
+        zones["cot_theta_min"] = np.minimum.reduceat(np.asarray(cot_theta, dtype=float), starts)
+    if crushing_ok is not None:
+        zones["V_Rd,max OK"] = np.logical_and.reduceat(np.asarray(crushing_ok, dtype=bool), starts)
+    return pd.DataFrame(zones)
+
+
 def StronaScinanieBelki():
 
     # ------------------------------------------------------------------
@@ -131,62 +266,18 @@ def StronaScinanieBelki():
         oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
 
     if oblicz:
-        beton = CONCRETE_TABLE[concrete_name]
-        stal = STEEL_TABLE[steel_name]
-
-        fck = beton.fck
-        fyk = stal.fyk
-        gamma_c = 1.4
-        gamma_s = 1.15  # Norma zaleca 1.15 dla stali
-
-        d_mm = h_cm * 10 - a1_mm
-        d_m = d_mm / 1000
-        z_m = 0.9 * d_m
-        bw_m = bw_cm / 100
-
-        nu1 = 0.6 * (1 - fck / 250)
+        w = design_shear_along_span(concrete_name, steel_name, bw_cm, h_cm, phi_w, n_legs, As1_cm2, a1_mm,
+                                    V_Ed, cot_theta=cot_theta)
+        fck, fyk = w["fck"], w["fyk"]
+        fcd, fywd, nu1 = w["fcd"], w["fywd"], w["nu1"]
+        d_mm, z_m, k, v_min = w["d_mm"], w["z_m"], w["k"], w["v_min"]
         tan_theta = 1 / cot_theta
-        fcd = fck / gamma_c
-        fywd = fyk / gamma_s
-        
-        # V_Rd,max
-        # Przyjęto alpha_cw = 1.0
-        V_Rd_max = (bw_m * z_m * nu1 * fcd / (cot_theta + tan_theta)) * 1000
-
-        As1_mm2 = As1_cm2 * 100
-        rho_l = min(As1_mm2 / (bw_cm * 10 * d_mm), 0.02)
-        k = min(1 + math.sqrt(200 / d_mm), 2.0)
-        C_Rd_c = 0.18 / gamma_c
-        v_min = 0.035 * k**1.5 * math.sqrt(fck)
-        
-        # Obliczenie v_Rd_c [MPa]
-        val_calc = C_Rd_c * k * (100 * rho_l * fck) ** (1 / 3)
-        v_Rd_c_val = max(val_calc, v_min)
-        
-        V_Rd_c = v_Rd_c_val * bw_m * d_m * 1000
-
-        rho_w_min = 0.08 * math.sqrt(fck) / fyk
-        a_sw_min = rho_w_min * bw_m * 10000
-
-        Asw = n_legs * math.pi * (phi_w / 20) ** 2
-        
-        # Zbrojenie obliczeniowe
-        if V_Ed > V_Rd_c:
-            V_Ed_MN = V_Ed / 1000.0
-            a_sw_req = (V_Ed_MN / (z_m * fywd * cot_theta)) * 10000 # cm2/m
-        else:
-            a_sw_req = 0.0
-
-        a_sw_design = max(a_sw_min, a_sw_req)
-
-        # Rozstaw
-        if a_sw_design > 0:
-            s_cal = (Asw / a_sw_design) * 100
-        else:
-            s_cal = 100.0
-            
-        s_max = min(0.75 * d_mm / 10, 40)
-        s = math.floor(min(s_cal, s_max))
+        V_Rd_max = float(w["V_Rd_max"])
+        V_Rd_c = float(w["V_Rd_c"])
+        rho_l = float(w["rho_l"])
+        v_Rd_c_val = float(w["v_Rd_c_val"])
+        a_sw_min, a_sw_req, a_sw_design = w["a_sw_min"], float(w["a_sw_req"]), float(w["a_sw_design"])
+        Asw, s_cal, s_max, s = w["Asw"], float(w["s_cal"]), w["s_max"], int(w["s"])
 
         if s > 0:
             a_sw_prov = Asw / s * 100
@@ -212,7 +303,7 @@ def StronaScinanieBelki():
             "d_cm": d_mm/10, "z_cm": z_m*100, "fcd": fcd, "fywd": fywd,
             "nu1": nu1, "cot_theta": cot_theta, "tan_theta": tan_theta,
             "k": k, "rho_l": rho_l, "v_min": v_min, "v_Rd_c_val": v_Rd_c_val,
-            "shear_needed": (V_Ed > V_Rd_c),
+            "shear_needed": bool(w["shear_needed"]),
             "a_sw_req": a_sw_req, "a_sw_design": a_sw_design,
             "s_cal": s_cal, "s_max": s_max, "Asw": Asw
         }
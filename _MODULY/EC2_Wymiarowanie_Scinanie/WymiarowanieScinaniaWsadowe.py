@@ -0,0 +1,112 @@
+"""
+WymiarowanieScinaniaWsadowe.py
+Wsadowe wymiarowanie strzemion wzdłuż belki (bez interfejsu Streamlit).
+
+Wejście: wykres sił tnących jako CSV z kolumnami x [m], V_Ed [kN] oraz
+opcjonalnie As1 [cm2] (zmienne zbrojenie podłużne) albo belka swobodnie
+podparta obciążona równomiernie (--span, --q).
+
+Dla każdego przekroju dobierany jest cot(theta) z zakresu 1.0-2.5 minimalizujący
+pole strzemion (design_shear_along_span), a następnie rozstawy grupowane są
+w strefy o jednakowym rozstawie (stirrup_zoning).
+
+Przykład:
+    python WymiarowanieScinaniaWsadowe.py --span 8 --q 120 --bw 30 --h 50 -o strefy.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import WymiarowanieBelkiScinanie as scinanie  # noqa: E402
+
+
+def simply_supported_shear(span_m, q_kNm, n_stations=2001):
+    """Wykres V_Ed [kN] belki swobodnie podpartej obciążonej równomiernie."""
+    x = np.linspace(0.0, span_m, n_stations)
+    return x, q_kNm * (0.5 * span_m - x)
+
+
+def read_shear_diagram(path):
+    """Wczytuje wykres sił tnących z CSV. Zwraca (x, V_Ed, As1 lub None)."""
+    df = pd.read_csv(path, sep=None, engine="python")
+    brak = [k for k in ("x", "V_Ed") if k not in df.columns]
+    if brak:
+        raise ValueError(f"Brak wymaganych kolumn wykresu sił tnących: {', '.join(brak)}")
+    df = df.sort_values("x")
+    as1 = df["As1"].to_numpy(dtype=float) if "As1" in df.columns else None
+    return df["x"].to_numpy(dtype=float), df["V_Ed"].to_numpy(dtype=float), as1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wsadowe wymiarowanie strzemion wzdłuż belki (EC2).")
+    parser.add_argument("input", nargs="?", help="Wykres sił tnących (CSV: x, V_Ed[, As1]).")
+    parser.add_argument("--span", type=float, default=None, help="Rozpiętość belki swobodnie podpartej [m].")
+    parser.add_argument("--q", type=float, default=None, help="Obciążenie równomierne [kN/m].")
+    parser.add_argument("-n", type=int, default=2001, help="Liczba przekrojów dla --span/--q.")
+    parser.add_argument("-o", "--output", default="strefy_strzemion.csv", help="Zestawienie stref (CSV).")
+    parser.add_argument("--stations", default=None, help="Wyniki w przekrojach (CSV), opcjonalnie.")
+    parser.add_argument("--concrete", default="C30/37", help="Klasa betonu.")
+    parser.add_argument("--steel", default="B500", help="Klasa stali.")
+    parser.add_argument("--bw", type=float, default=30.0, help="Szerokość środnika [cm].")
+    parser.add_argument("--h", type=float, default=50.0, help="Wysokość przekroju [cm].")
+    parser.add_argument("--phi-w", type=int, default=8, help="Średnica strzemion [mm].")
+    parser.add_argument("--legs", type=int, default=2, help="Liczba cięć strzemienia.")
+    parser.add_argument("--as1", type=float, default=6.0, help="Zbrojenie rozciągane As1 [cm2] (gdy brak w CSV).")
+    parser.add_argument("--a1", type=float, default=45.0, help="Odległość środka zbrojenia od krawędzi [mm].")
+    parser.add_argument("--module", type=float, default=5.0, help="Moduł rozstawu strzemion w strefach [cm].")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        x, v_ed, as1 = read_shear_diagram(args.input)
+        if as1 is None:
+            as1 = args.as1
+    elif args.span is not None and args.q is not None:
+        x, v_ed = simply_supported_shear(args.span, args.q, args.n)
+        as1 = args.as1
+    else:
+        parser.error("Podaj plik CSV z wykresem sił tnących albo --span i --q.")
+
+    t_start = time.perf_counter()
+    res = scinanie.design_shear_along_span(
+        args.concrete, args.steel, args.bw, args.h, args.phi_w, args.legs, as1, args.a1, v_ed
+    )
+    strefy = scinanie.stirrup_zoning(
+        x, res["s"], res["V_Ed"], res["cot_theta"], res["crushing_ok"], spacing_module_cm=args.module
+    )
+    elapsed = time.perf_counter() - t_start
+
+    strefy.to_csv(args.output, index=False)
+    if args.stations:
+        pd.DataFrame({"x [m]": x, **{k: np.broadcast_to(v, x.shape) for k, v in res.items()}}).to_csv(
+            args.stations, index=False
+        )
+
+    print(f"Zwymiarowano {len(x)} przekrojów w {elapsed:.3f} s. Strefy: {args.output}")
+    if not res["crushing_ok"].all():
+        print(f"UWAGA: V_Ed > V_Rd,max w {int((~res['crushing_ok']).sum())} przekrojach - zmień przekrój.")
+    print(strefy.round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
 
 try:
     from TABLICE.ParametryBetonu import CONCRETE_TABLE, list_concrete_classes
@@ -19,7 +24,8 @@ except Exception:
 # SOLVER - OBLICZENIA POMOCNICZE EC2
 # ==============================================================================
 
-def get_MRd(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
+def get_MRd_bisection(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
+    """Referencyjna (skalarna) wersja get_MRd - bisekcja po wysokości strefy ściskanej."""
     if N_Ed < 0: 
         return 0.0
         
@@ -59,8 +65,143 @@ def get_MRd(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
     _, M_Rd = calc_N_M((x_min_bisect + x_max_bisect) / 2)
     return M_Rd
 
-def solve_1D(N_Ed, M_Ed, width, height, d, d2, fcd, fyd, Es, fck):
+# ------------------------------------------------------------------------------
+# KRZYWA INTERAKCJI N-M (WEKTOROWO, NUMPY)
+# ------------------------------------------------------------------------------
+# Dla ustalonej wysokości strefy ściskanej x siły w przekroju są liniowe względem
+# pola zbrojenia: N(x) = Nc(x) + As_half * ns(x), M(x) = Mc(x) + As_half * ms(x).
+# Składowe "jednostkowe" liczone są raz dla przekroju, a krzywa dla dowolnego As
+# to jedna kombinacja liniowa tablic.
+
+N_PKT_KRZYWEJ = 400
+
+@lru_cache(maxsize=64)
+def build_interaction_diagram(width, height, d, d2, fcd, fyd, Es, fck, n_points=N_PKT_KRZYWEJ):
+    """Zwraca składowe krzywej interakcji przekroju (tablice po x), niezależne od As."""
+    lam = 0.8 if fck <= 50 else 0.8 - (fck - 50) / 400.0
+    eta_c = 1.0 if fck <= 50 else 1.0 - (fck - 50) / 200.0
+    eps_top = 0.0035
+    eps_yd = fyd / Es
+
+    x_lo, x_hi = 0.0001, 10.0 * height
+    # Siatka geometryczna (zagęszczona dla x > h) + punkty załamania (uplastycznienie prętów, x_eff = h)
+    x_grid = np.concatenate([
+        np.geomspace(x_lo, height, n_points // 2),
+        np.geomspace(height, x_hi, n_points - n_points // 2),
+    ])
+    kinks = [height / lam]
+    for dd in (d2, d):
+        for eps_s in (eps_yd, -eps_yd):
+            kinks.append(eps_top * dd / (eps_top - eps_s))
+    kinks = [k for k in kinks if x_lo < k < x_hi]
+    x = np.unique(np.concatenate([x_grid, kinks]))
+
+    sigma_s2 = np.clip(eps_top * (x - d2) / x * Es, -fyd, fyd)
+    sigma_s1 = np.clip(eps_top * (x - d) / x * Es, -fyd, fyd)
+    x_eff = np.minimum(height, lam * x)
+    Nc = eta_c * fcd * width * x_eff
+
+    diagram = {
+        "x": x,
+        "Nc": Nc,
+        "Mc": Nc * (height / 2 - x_eff / 2),
+        "ns": sigma_s2 + sigma_s1,
+        "ms": sigma_s2 * (height / 2 - d2) + sigma_s1 * (height / 2 - d),
+    }
+    for arr in diagram.values():
+        arr.setflags(write=False)
+    return diagram
+
+def interaction_curve(diagram, As_half):
+    """Krzywa (N, M) dla zadanego zbrojenia; dla tablicy As_half wynik ma wymiar [nAs, nx]."""
+    As_half = np.asarray(As_half, dtype=float)[..., None]
+    N = diagram["Nc"] + As_half * diagram["ns"]
+    M = diagram["Mc"] + As_half * diagram["ms"]
+    return N, M
+
+def compute_MRd(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
+    """M_Rd przy danym N_Ed - interpolacja na krzywej interakcji (N rośnie monotonicznie z x)."""
+    if N_Ed < 0:
+        return 0.0
+    diagram = build_interaction_diagram(width, height, d, d2, fcd, fyd, Es, fck)
+    N, M = interaction_curve(diagram, As_half)
+    if N_Ed >= N[-1]:
+        return 0.0
+    return float(np.interp(N_Ed, N, M))
+
+# ------------------------------------------------------------------------------
+# PAMIĘĆ PODRĘCZNA NOŚNOŚCI (LRU, WSPÓLNA DLA WSZYSTKICH PRZELICZEŃ STRONY)
+# ------------------------------------------------------------------------------
+# Kwanty zaokrąglenia argumentów: N [MN], As [m²], wymiary [m], naprężenia [MPa].
+# Wynik liczony jest zawsze dla wartości zaokrąglonych, więc nie zależy od stanu pamięci.
+KWANTY_KLUCZA = (1e-6, 1e-8, 1e-5, 1e-5, 1e-5, 1e-5, 1e-4, 1e-4, 1.0, 1e-3)
+
+class CapacityCache:
+    """Ograniczona pamięć LRU wartości M_Rd z licznikami trafień i chybień."""
+
+    def __init__(self, maxsize=50_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_MRd(self, N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
+        key = tuple(round(v / q) for v, q in zip((N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck), KWANTY_KLUCZA))
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        args = [k * q for k, q in zip(key, KWANTY_KLUCZA)]
+        value = compute_MRd(*args)
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+@st.cache_resource
+def _shared_capacity_cache():
+    """Jedna instancja pamięci nośności na proces Streamlit (przetrwa kolejne przeliczenia strony)."""
+    return CapacityCache()
+
+_capacity_cache = None
+
+def get_capacity_cache():
+    """Wspólna pamięć nośności (pobierana z st.cache_resource raz na wykonanie modułu)."""
+    global _capacity_cache
+    if _capacity_cache is None:
+        _capacity_cache = _shared_capacity_cache()
+    return _capacity_cache
+
+def get_MRd(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck):
+    """M_Rd przy danym N_Ed (przez wspólną pamięć podręczną nośności)."""
+    return get_capacity_cache().get_MRd(N_Ed, As_half, width, height, d, d2, fcd, fyd, Es, fck)
+
+SOLVER_SKOKOWY = "skokowy"
+SOLVER_BRENT = "brent"
+
+def solve_1D(N_Ed, M_Ed, width, height, d, d2, fcd, fyd, Es, fck, method=SOLVER_SKOKOWY, tol=1e-6):
     """Zwraca wymagane pole zbrojenia (całkowite dla kierunku) dla zadanego M_Ed."""
+    if method == SOLVER_BRENT:
+        return solve_1D_brent(N_Ed, M_Ed, width, height, d, d2, fcd, fyd, Es, fck, tol=tol)["As"]
     if M_Ed <= 0: return 0.0
     As_req = 0.0
     step = 0.002 # Skok 20 cm2
@@ -75,6 +216,475 @@ def solve_1D(N_Ed, M_Ed, width, height, d, d2, fcd, fyd, Es, fck):
         As_req += step
     return As_req
 
+def solve_1D_brent(N_Ed, M_Ed, width, height, d, d2, fcd, fyd, Es, fck, tol=1e-6, As_cap=2.0, max_iter=100):
+    """
+    Wymagane pole zbrojenia z warunku M_Rd(As) = M_Ed metodą Brenta.
+
+    Korzysta z monotoniczności M_Rd(As): przedział [0, As_hi] jest poszerzany
+    (podwajanie), a następnie zawężany iteracjami sieczna / interpolacja odwrotna
+    z zabezpieczeniem bisekcją. Zwracany jest koniec przedziału po stronie
+    bezpiecznej (M_Rd >= M_Ed), z dokładnością tol [m²].
+
+    Zwraca słownik: As [m²], iterations, evaluations, converged.
+    """
+    stats = {"As": 0.0, "iterations": 0, "evaluations": 0, "converged": True}
+    if M_Ed <= 0:
+        return stats
+
+    def f(As_tot):
+        stats["evaluations"] += 1
+        return get_MRd(N_Ed, As_tot / 2, width, height, d, d2, fcd, fyd, Es, fck) - M_Ed
+
+    # 1. Przedział startowy
+    a, fa = 0.0, f(0.0)
+    if fa >= 0:
+        return stats
+    b = 0.002
+    fb = f(b)
+    while fb < 0:
+        if b >= As_cap:
+            stats.update(As=b, converged=False)
+            return stats
+        a, fa = b, fb
+        b = min(2.0 * b, As_cap)
+        fb = f(b)
+
+    # 2. Brent: b - najlepsze przybliżenie, c - drugi koniec przedziału (fc * fb < 0)
+    c, fc = a, fa
+    e = dd = b - a
+    for it in range(1, max_iter + 1):
+        stats["iterations"] = it
+        if abs(fc) < abs(fb):
+            a, fa = b, fb
+            b, fb = c, fc
+            c, fc = a, fa
+        tol1 = 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            break
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, dd = dd, p / q
+            else:
+                dd = xm
+                e = dd
+        else:
+            dd = xm
+            e = dd
+        a, fa = b, fb
+        b += dd if abs(dd) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            e = dd = b - a
+    else:
+        stats["converged"] = False
+
+    stats["As"] = b if fb >= 0 else c
+    return stats
+
+# ==============================================================================
+# PRZEKRÓJ WŁÓKNOWY - NOŚNOŚĆ PRZY ZGINANIU DWUKIERUNKOWYM (N - My - Mz)
+# ==============================================================================
+# Układ współrzędnych przekroju: y - wzdłuż boku h, z - wzdłuż boku b (środek w
+# środku ciężkości). My = Σ σ·A·y (oś silna, zbrojenie As1), Mz = Σ σ·A·z (oś
+# słaba, zbrojenie As2). Ściskanie dodatnie. Beton: prostokątny blok naprężeń
+# (λ, η) jak w get_MRd, stal sprężysto-plastyczna, ε_cu = 3.5‰ na skrajnym włóknie.
+
+def rectangular_bar_layout(width, height, d2, As1, As2, n_bars_b=3, n_bars_h=4):
+    """
+    Położenia i pola prętów (y, z, A). As1 - łącznie na dwóch bokach b,
+    As2 - łącznie na dwóch bokach h (pręty pośrednie, bez narożnych).
+    """
+    yb = height / 2 - d2
+    zb = width / 2 - d2
+    z_b = np.linspace(-zb, zb, max(2, n_bars_b))
+    y_h = np.linspace(-yb, yb, max(3, n_bars_h))[1:-1]
+
+    y = np.concatenate([np.full_like(z_b, yb), np.full_like(z_b, -yb), y_h, y_h])
+    z = np.concatenate([z_b, z_b, np.full_like(y_h, -zb), np.full_like(y_h, zb)])
+    A = np.concatenate([
+        np.full(2 * len(z_b), As1 / (2 * len(z_b))),
+        np.full(2 * len(y_h), As2 / (2 * len(y_h))),
+    ])
+    return y, z, A
+
+def _capacity_surface(width, height, d2, As1, As2, fcd, fyd, Es, fck, n_bars_b, n_bars_h, n_angles, n_depths, n_fib):
+    """
+    Powierzchnia nośności N - My - Mz z całkowania po włóknach.
+
+    Dla siatki kątów osi obojętnej θ i głębokości strefy ściskanej x całość
+    liczona jest jedną operacją tablicową [nθ, nx, nwłókien]. Zwraca słownik
+    tablic N, My, Mz o wymiarze [nθ, nx] (N rośnie monotonicznie z x).
+    """
+    lam = 0.8 if fck <= 50 else 0.8 - (fck - 50) / 400.0
+    eta_c = 1.0 if fck <= 50 else 1.0 - (fck - 50) / 200.0
+    eps_top = 0.0035
+
+    # Włókna betonu (środki komórek siatki n_fib x n_fib)
+    dy, dz = height / n_fib, width / n_fib
+    yc, zc = np.meshgrid(-height / 2 + dy * (np.arange(n_fib) + 0.5),
+                         -width / 2 + dz * (np.arange(n_fib) + 0.5), indexing="ij")
+    yc, zc = yc.ravel(), zc.ravel()
+    A_fib = dy * dz
+    ys, zs, As = rectangular_bar_layout(width, height, d2, As1, As2, n_bars_b, n_bars_h)
+
+    theta = np.linspace(0.0, 2.0 * np.pi, n_angles, endpoint=False)
+    cos_t, sin_t = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    # u - współrzędna w kierunku najbardziej ściskanego narożnika
+    u_top = (height / 2) * np.abs(cos_t) + (width / 2) * np.abs(sin_t)      # [nθ, 1]
+    u_c = yc * cos_t + zc * sin_t                                             # [nθ, nf]
+    u_s = ys * cos_t + zs * sin_t                                             # [nθ, nb]
+    du = dy * np.abs(cos_t) + dz * np.abs(sin_t)                              # zasięg włókna wzdłuż u
+
+    x = (2.0 * u_top) * np.geomspace(1e-3, 10.0, n_depths)                   # [nθ, nx]
+
+    # Beton - udział włókna w bloku naprężeń (wygładzenie na krawędzi bloku)
+    u_lim = (u_top - lam * x)[:, :, None]
+    w = np.clip((u_c[:, None, :] - u_lim) / du[:, :, None] + 0.5, 0.0, 1.0)   # [nθ, nx, nf]
+    sigma_c = eta_c * fcd * A_fib
+    Nc = sigma_c * w.sum(axis=2)
+    Myc = sigma_c * (w @ yc)
+    Mzc = sigma_c * (w @ zc)
+
+    # Stal
+    eps_s = eps_top * (u_s[:, None, :] - (u_top - x)[:, :, None]) / x[:, :, None]
+    F_s = np.clip(eps_s * Es, -fyd, fyd) * As                                 # [nθ, nx, nb]
+
+    surface = {
+        "theta": theta,
+        "x": x,
+        "N": Nc + F_s.sum(axis=2),
+        "My": Myc + F_s @ ys,
+        "Mz": Mzc + F_s @ zs,
+    }
+    for arr in surface.values():
+        arr.setflags(write=False)
+    return surface
+
+# Kwanty klucza powierzchni (width, height, d2, As1, As2, fcd, fyd, Es, fck) - jak w KWANTY_KLUCZA
+KWANTY_POWIERZCHNI = (1e-5, 1e-5, 1e-5, 1e-8, 1e-8, 1e-4, 1e-4, 1.0, 1e-3)
+
+@st.cache_resource
+def _shared_surface_cache():
+    """Pamięć powierzchni nośności wspólna dla kolejnych przeliczeń strony (przetrwa przeładowanie modułu)."""
+    return lru_cache(maxsize=32)(_capacity_surface)
+
+def build_capacity_surface(width, height, d2, As1, As2, fcd, fyd, Es, fck,
+                           n_bars_b=3, n_bars_h=4, n_angles=72, n_depths=120, n_fib=24):
+    """
+    Powierzchnia nośności z pamięci podręcznej. Argumenty zaokrąglane są do KWANTY_POWIERZCHNI,
+    a powierzchnia liczona dla wartości zaokrąglonych, więc wynik nie zależy od stanu pamięci.
+    """
+    key = [round(v / q) * q for v, q in zip((width, height, d2, As1, As2, fcd, fyd, Es, fck), KWANTY_POWIERZCHNI)]
+    return _shared_surface_cache()(*key, int(n_bars_b), int(n_bars_h), int(n_angles), int(n_depths), int(n_fib))
+
+def load_contour(surface, N_Ed):
+    """Kontur nośności (My, Mz) przy zadanych N_Ed; wynik [nθ, nN]."""
+    N_Ed = np.atleast_1d(np.asarray(N_Ed, dtype=float))
+    n_angles = surface["N"].shape[0]
+    My = np.empty((n_angles, N_Ed.size))
+    Mz = np.empty((n_angles, N_Ed.size))
+    for k in range(n_angles):
+        N_k = surface["N"][k]
+        My[k] = np.interp(N_Ed, N_k, surface["My"][k])
+        Mz[k] = np.interp(N_Ed, N_k, surface["Mz"][k])
+    return My, Mz
+
+def check_biaxial_fiber(surface, N_Ed, My_Ed, Mz_Ed):
+    """
+    Wytężenie η = |M_Ed| / |M_Rd| dla trójek (N, My, Mz) - przecięcie promienia
+    wektora momentu z konturem nośności przy danym N. Dla N poza zakresem η = inf.
+    """
+    N_Ed, My_Ed, Mz_Ed = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (N_Ed, My_Ed, Mz_Ed)))
+    My_c, Mz_c = load_contour(surface, N_Ed)
+
+    # Krawędzie wielokąta P_k -> P_k+1
+    ey = np.roll(My_c, -1, axis=0) - My_c
+    ez = np.roll(Mz_c, -1, axis=0) - Mz_c
+    denom = My_Ed * ez - Mz_Ed * ey
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (My_c * ez - Mz_c * ey) / denom            # P = t * M_Ed
+        s = (My_c * Mz_Ed - Mz_c * My_Ed) / denom      # położenie na krawędzi
+    valid = (denom != 0) & (t > 0) & (s >= -1e-9) & (s <= 1 + 1e-9)
+    t_min = np.where(valid, t, np.inf).min(axis=0)
+
+    with np.errstate(divide="ignore"):
+        eta = np.where(np.isfinite(t_min), 1.0 / t_min, np.inf)
+    eta = np.where((My_Ed == 0) & (Mz_Ed == 0), 0.0, eta)
+
+    N_lo = surface["N"][:, 0].max()
+    N_hi = surface["N"][:, -1].min()
+    return np.where((N_Ed < N_lo) | (N_Ed >= N_hi), np.inf, eta)
+
+# ==============================================================================
+# PROJEKTOWANIE SŁUPA (BEZ INTERFEJSU) - STRONA I TRYB WSADOWY
+# ==============================================================================
+
+def design_column(concrete_class, steel_class, b_cm, h_cm, N_kN, M0y_kNm, M0z_kNm,
+                  L_m=3.0, beta_y=1.0, beta_z=1.0, c_mm=35, phi_s_mm=16, phi_w_mm=8,
+                  rh=50, t0=28, cement_type="N - normalnie twardniejący", m_ratio=0.7,
+                  eta_limit=1.0, solver_method=SOLVER_SKOKOWY, solver_tol=1e-6, fiber_check=True):
+    """
+    Wymiarowanie słupa prostokątnego: efekty II rzędu (nominalna sztywność, 5.8.7)
+    i zginanie dwukierunkowe (5.8.9). Dane w jednostkach interfejsu (cm, mm, m, kN, kNm),
+    wyniki pośrednie w m, MN, MNm, MPa.
+    """
+    # --- DANE (JEDNOSTKI: m, MN, MNm, MPa) ---
+    concrete = CONCRETE_TABLE[concrete_class]
+    steel = STEEL_TABLE[steel_class]
+
+    b = b_cm / 100.0
+    h = h_cm / 100.0
+    c_nom = c_mm / 1000.0
+    phi_s = phi_s_mm / 1000.0
+    phi_w = phi_w_mm / 1000.0
+
+    solver_stats = {"calls": 0, "iterations": 0, "evaluations": 0}
+    capacity_cache = get_capacity_cache()
+    cache_before = capacity_cache.stats()
+
+    NEd = N_kN / 1000.0
+    M0y = M0y_kNm / 1000.0
+    M0z = M0z_kNm / 1000.0
+
+    # --- PARAMETRY MATERIAŁOWE I GEOMETRYCZNE ---
+    fck = concrete.fck
+    fcm = fck + 8
+    Ecm = concrete.Ecm * 1000 if concrete.Ecm < 1000 else concrete.Ecm
+    fyk = steel.fyk
+    Es = steel.Es * 1000 if steel.Es < 1000 else steel.Es
+
+    fcd = fck / 1.5
+    fyd = fyk / 1.15
+
+    Ac = b * h
+    # h0 spójne w mm
+    Ac_mm2 = (b * 1000) * (h * 1000)
+    u_mm = 2 * (b * 1000 + h * 1000)
+    h0 = 2 * Ac_mm2 / u_mm
+
+    Ic_y = b * h**3 / 12
+    Ic_z = h * b**3 / 12
+
+    iy = h / math.sqrt(12)
+    iz = b / math.sqrt(12)
+
+    d2 = c_nom + phi_w + phi_s / 2
+    d_y = h - d2
+    d_z = b - d2
+    area_bar = math.pi * (phi_s / 2)**2
+
+    # --- PEŁZANIE ---
+    alpha_1 = (35/fcm)**0.7
+    alpha_2 = (35/fcm)**0.2
+    if fcm <= 35:
+        phi_RH = 1 + (1 - rh/100) / (0.1 * (h0)**(1/3))
+    else:
+        phi_RH = (1 + ((1 - rh/100) / (0.1 * (h0)**(1/3))) * alpha_1) * alpha_2
+
+    beta_fcm = 16.8 / math.sqrt(fcm)
+    alpha_cem = -1 if cement_type.startswith("S") else (0 if cement_type.startswith("N") else 1)
+    t0_adj = max(0.5, t0 * (9 / (2 + t0**1.2) + 1)**alpha_cem)
+    beta_t0 = 1 / (0.1 + t0_adj**0.2)
+
+    phi_eff = (phi_RH * beta_fcm * beta_t0) * m_ratio
+
+    # Sztywność betonu Ecd wg 5.8.7.2(2)
+    Ecd = Ecm / 1.2
+
+    # --- SOLVER: EFEKTY II RZĘDU & ZBROJENIE ---
+    l0_y = beta_y * L_m
+    l0_z = beta_z * L_m
+
+    lambda_y = l0_y / iy if iy > 0 else 0
+    lambda_z = l0_z / iz if iz > 0 else 0
+
+    n_rel_N = NEd / (Ac * fcd) if (Ac * fcd) > 0 else 0
+    k1 = math.sqrt(fck / 20.0)
+    k2_y = min(n_rel_N * lambda_y / 170.0, 0.20)
+    k2_z = min(n_rel_N * lambda_z / 170.0, 0.20)
+
+    # Dokładny współczynnik Kc wg normy 5.8.7.2 (Wzór 5.21)
+    Kc_y = (k1 * k2_y) / (1 + phi_eff)
+    Kc_z = (k1 * k2_z) / (1 + phi_eff)
+
+    As_min_ec2 = max(0.10 * NEd / fyd, 0.002 * Ac)
+    As_min_user = 4 * area_bar  # Minimum 4 pręty (po 1 w narożniku)
+    As_min_tot = max(As_min_ec2, As_min_user)
+    As_max = 0.04 * Ac
+
+    # Start iteracji od minimalnego zbrojenia
+    As1 = As_min_tot / 2.0
+    As2 = As_min_tot / 2.0
+    eta = 999.0
+
+    for step in range(150):
+        Is_y = As1 * (h/2 - d2)**2 + As2 * (1/3) * (h/2 - d2)**2
+        Is_z = As2 * (b/2 - d2)**2 + As1 * (1/3) * (b/2 - d2)**2
+
+        EI_y = Kc_y * Ecd * Ic_y + Es * Is_y
+        EI_z = Kc_z * Ecd * Ic_z + Es * Is_z
+
+        NB_y = (math.pi**2 * EI_y) / (l0_y**2) if l0_y > 0 else 1e9
+        NB_z = (math.pi**2 * EI_z) / (l0_z**2) if l0_z > 0 else 1e9
+
+        # Bezpiecznik przed zerowym mianownikiem (jeśli utrata stateczności)
+        NB_y = max(NB_y, NEd + 0.0001)
+        NB_z = max(NB_z, NEd + 0.0001)
+
+        M_Ed_y = M0y / (1 - NEd/NB_y)
+        M_Ed_z = M0z / (1 - NEd/NB_z)
+
+        # 1. Oblicz bazowe zapotrzebowanie 1D
+        if solver_method == SOLVER_BRENT:
+            res_y = solve_1D_brent(NEd, M_Ed_y, b, h, d_y, d2, fcd, fyd, Es, fck, tol=solver_tol)
+            res_z = solve_1D_brent(NEd, M_Ed_z, h, b, d_z, d2, fcd, fyd, Es, fck, tol=solver_tol)
+            for res in (res_y, res_z):
+                solver_stats["calls"] += 1
+                solver_stats["iterations"] += res["iterations"]
+                solver_stats["evaluations"] += res["evaluations"]
+            req_As1, req_As2 = res_y["As"], res_z["As"]
+        else:
+            req_As1 = solve_1D(NEd, M_Ed_y, b, h, d_y, d2, fcd, fyd, Es, fck)
+            req_As2 = solve_1D(NEd, M_Ed_z, h, b, d_z, d2, fcd, fyd, Es, fck)
+
+        test_As1 = max(req_As1, As_min_tot / 2.0)
+        test_As2 = max(req_As2, As_min_tot / 2.0)
+
+        # 2. Wewnętrzna pętla poszukująca interakcji 2D (Dystrybucja proporcjonalna/ważona)
+        for _ in range(30):
+            MRd_y = get_MRd(NEd, test_As1/2, b, h, d_y, d2, fcd, fyd, Es, fck)
+            MRd_z = get_MRd(NEd, test_As2/2, h, b, d_z, d2, fcd, fyd, Es, fck)
+
+            N_Rd = Ac * fcd + (test_As1 + test_As2) * fyd
+            n_rel = NEd / N_Rd if N_Rd > 0 else 1.0
+
+            if n_rel <= 0.1: a_exp = 1.0
+            elif n_rel <= 0.7: a_exp = 1.0 + (n_rel - 0.1) * (0.5 / 0.6)
+            elif n_rel <= 1.0: a_exp = 1.5 + (n_rel - 0.7) * (0.5 / 0.3)
+            else: a_exp = 2.0
+
+            eta_y = (M_Ed_y / MRd_y)**a_exp if MRd_y > 0 else 999.0
+            eta_z = (M_Ed_z / MRd_z)**a_exp if MRd_z > 0 else 999.0
+            eta = eta_y + eta_z
+
+            if eta <= eta_limit or (test_As1 + test_As2) > As_max:
+                break
+
+            # Ustalenie proporcji "winy" za przekroczenie wytężenia
+            w_y = eta_y / eta if eta > 0 else 0.5
+            w_z = eta_z / eta if eta > 0 else 0.5
+
+            # Obliczenie potrzebnego globalnego zapasu stali dla osiągnięcia warunku eta_limit
+            scale = min(1.2, max(1.02, (eta / eta_limit)**(1/a_exp)))
+            delta_As = (test_As1 + test_As2) * (scale - 1.0)
+
+            # Aplikacja zapasu proporcjonalnie do udziału osi
+            test_As1 += delta_As * w_y
+            test_As2 += delta_As * w_z
+
+        target_As1 = test_As1
+        target_As2 = test_As2
+
+        # Relaksacja numeryczna na zewnątrz dla efektów II rzędu
+        diff1 = abs(As1 - target_As1)
+        diff2 = abs(As2 - target_As2)
+
+        As1 = 0.5 * As1 + 0.5 * target_As1
+        As2 = 0.5 * As2 + 0.5 * target_As2
+
+        if diff1 < 1e-5 and diff2 < 1e-5:
+            break
+
+    As_tot = As1 + As2
+
+    # ----------------------------------------------------------------------
+    # PONOWNE WYLICZENIE STANÓW KOŃCOWYCH (DLA MODUŁU "SZCZEGÓŁY OBLICZEŃ")
+    # ----------------------------------------------------------------------
+    Is_y_fin = As1 * (h/2 - d2)**2 + As2 * (1/3) * (h/2 - d2)**2
+    Is_z_fin = As2 * (b/2 - d2)**2 + As1 * (1/3) * (b/2 - d2)**2
+    EI_y_fin = Kc_y * Ecd * Ic_y + Es * Is_y_fin
+    EI_z_fin = Kc_z * Ecd * Ic_z + Es * Is_z_fin
+    NB_y_fin = (math.pi**2 * EI_y_fin) / (l0_y**2) if l0_y > 0 else 1e9
+    NB_z_fin = (math.pi**2 * EI_z_fin) / (l0_z**2) if l0_z > 0 else 1e9
+    NB_y_fin = max(NB_y_fin, NEd + 0.0001)
+    NB_z_fin = max(NB_z_fin, NEd + 0.0001)
+    M_Ed_y_fin = M0y / (1 - NEd/NB_y_fin)
+    M_Ed_z_fin = M0z / (1 - NEd/NB_z_fin)
+    MRd_y_fin = get_MRd(NEd, As1/2, b, h, d_y, d2, fcd, fyd, Es, fck)
+    MRd_z_fin = get_MRd(NEd, As2/2, h, b, d_z, d2, fcd, fyd, Es, fck)
+    N_Rd_fin = Ac * fcd + (As1 + As2) * fyd
+    n_rel_fin = NEd / N_Rd_fin if N_Rd_fin > 0 else 1.0
+
+    if n_rel_fin <= 0.1: a_exp_fin = 1.0
+    elif n_rel_fin <= 0.7: a_exp_fin = 1.0 + (n_rel_fin - 0.1) * (0.5 / 0.6)
+    elif n_rel_fin <= 1.0: a_exp_fin = 1.5 + (n_rel_fin - 0.7) * (0.5 / 0.3)
+    else: a_exp_fin = 2.0
+
+    eta_fin = (M_Ed_y_fin / MRd_y_fin)**a_exp_fin + (M_Ed_z_fin / MRd_z_fin)**a_exp_fin if MRd_y_fin > 0 and MRd_z_fin > 0 else 999.0
+
+    # Weryfikacja przekrojem włóknowym (powierzchnia nośności N - My - Mz)
+    eta_fib = None
+    if fiber_check:
+        fiber_surface = build_capacity_surface(b, h, d2, As1, As2, fcd, fyd, Es, fck)
+        eta_fib = float(check_biaxial_fiber(fiber_surface, NEd, M_Ed_y_fin, M_Ed_z_fin)[0])
+
+    # Obliczenia na cm2 dla prezentacji
+    As1_cm2 = As1 * 10000
+    As2_cm2 = As2 * 10000
+    area_bar_cm2 = area_bar * 10000
+
+    # Przeliczenie na fizyczne pręty dla poszczególnych pasm (min. 2 na krawędź ze względu na narożniki)
+    n1 = max(2, math.ceil(As1_cm2 / area_bar_cm2))
+    As1_prov_disp = n1 * area_bar_cm2
+
+    n2 = max(2, math.ceil(As2_cm2 / area_bar_cm2))
+    As2_prov_disp = n2 * area_bar_cm2
+
+    # Wyznaczenie ilości prętów całkowitej (min. 4 szt., zawsze parzysta liczba dla symetrii)
+    n_total = max(4, math.ceil(As_tot / area_bar))
+    n_total = (n_total + 1) // 2 * 2
+
+    As_prov_cm2 = n_total * area_bar_cm2
+    As_min_cm2 = As_min_tot * 10000
+    As_max_cm2 = As_max * 10000
+
+    cache_after = capacity_cache.stats()
+
+    return {
+        "b": b, "h": h, "c_nom": c_nom, "phi_s": phi_s, "phi_w": phi_w,
+        "NEd": NEd, "M0y": M0y, "M0z": M0z,
+        "fck": fck, "fyk": fyk, "fcd": fcd, "fyd": fyd, "Ecm": Ecm, "Ecd": Ecd,
+        "d2": d2, "d_y": d_y, "d_z": d_z, "h0": h0,
+        "phi_RH": phi_RH, "beta_fcm": beta_fcm, "beta_t0": beta_t0, "phi_eff": phi_eff,
+        "l0_y": l0_y, "l0_z": l0_z, "iy": iy, "iz": iz, "lambda_y": lambda_y, "lambda_z": lambda_z,
+        "k1": k1, "k2_y": k2_y, "k2_z": k2_z, "Kc_y": Kc_y, "Kc_z": Kc_z,
+        "As1": As1, "As2": As2, "As_tot": As_tot, "As_min_tot": As_min_tot, "As_max": As_max, "eta": eta,
+        "EI_y_fin": EI_y_fin, "EI_z_fin": EI_z_fin, "NB_y_fin": NB_y_fin, "NB_z_fin": NB_z_fin,
+        "M_Ed_y_fin": M_Ed_y_fin, "M_Ed_z_fin": M_Ed_z_fin, "MRd_y_fin": MRd_y_fin, "MRd_z_fin": MRd_z_fin,
+        "N_Rd_fin": N_Rd_fin, "n_rel_fin": n_rel_fin, "a_exp_fin": a_exp_fin, "eta_fin": eta_fin, "eta_fib": eta_fib,
+        "As1_cm2": As1_cm2, "As2_cm2": As2_cm2, "n1": n1, "n2": n2,
+        "As1_prov_disp": As1_prov_disp, "As2_prov_disp": As2_prov_disp,
+        "n_total": n_total, "As_prov_cm2": As_prov_cm2, "As_min_cm2": As_min_cm2, "As_max_cm2": As_max_cm2,
+        "ok": eta <= eta_limit and As_tot <= As_max,
+        "solver_stats": solver_stats,
+        "cache_hits": cache_after["hits"] - cache_before["hits"],
+        "cache_misses": cache_after["misses"] - cache_before["misses"],
+    }
+
 # ==============================================================================
 # POMOCNICZA FUNKCJA DO ETYKIET Z IKONĄ "?" 
 # ==============================================================================
@@ -286,6 +896,16 @@ def render_column_page():
               min_value=10, max_value=100, value=100, step=10, 
               key="eta_max", on_change=reset_state,
               help="Pozwala na wymuszenie zapasu nośności (np. pod kątem wymogów P-poż).")
+
+    c_sol1, c_sol2 = st.columns(2)
+    with c_sol1:
+        st.selectbox("Solver zbrojenia", ["Skokowy (referencyjny)", "Brent (przedział + sieczna)"],
+                     index=0, key="solver_m", on_change=reset_state,
+                     help="Metoda wyznaczania wymaganego pola zbrojenia z warunku M_Rd(A_s) = M_Ed.")
+    with c_sol2:
+        st.number_input("Tolerancja solvera [cm²]", value=0.01, min_value=0.0001, step=0.01, format="%.4f",
+                        key="solver_tol", on_change=reset_state,
+                        help="Dokładność pola zbrojenia dla solvera Brenta.")
               
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -301,215 +921,42 @@ def render_column_page():
         st.markdown("### WYNIKI OBLICZEŃ")
         
         # --- POBRANIE DANYCH ---
-        concrete = CONCRETE_TABLE[st.session_state.c_class]
-        steel = STEEL_TABLE[st.session_state.s_class]
-        
-        b = st.session_state.b_cm / 100.0
-        h = st.session_state.h_cm / 100.0
-        c_nom = st.session_state.c_mm / 1000.0
-        phi_s = st.session_state.p_s / 1000.0
-        phi_w = st.session_state.p_w / 1000.0
-        
         L_m = st.session_state.l_m
         beta_y = st.session_state.beta_y
         beta_z = st.session_state.beta_z
-        rh = st.session_state.rh_val
-        t0 = st.session_state.t0_val
-        cement_type = st.session_state.cem_val
         m_ratio = st.session_state.m_rat
         eta_limit = st.session_state.eta_max / 100.0
-        
-        NEd = st.session_state.n_ed / 1000.0
-        M0y = st.session_state.m_ey / 1000.0
-        M0z = st.session_state.m_ez / 1000.0
-        
-        # --- PARAMETRY MATERIAŁOWE I GEOMETRYCZNE ---
-        fck = concrete.fck
-        fcm = fck + 8
-        Ecm = concrete.Ecm * 1000 if concrete.Ecm < 1000 else concrete.Ecm
-        fyk = steel.fyk
-        Es = steel.Es * 1000 if steel.Es < 1000 else steel.Es
-        
-        fcd = fck / 1.5
-        fyd = fyk / 1.15
-        
-        Ac = b * h
-        # h0 spójne w mm
-        Ac_mm2 = (b * 1000) * (h * 1000)
-        u_mm = 2 * (b * 1000 + h * 1000)
-        h0 = 2 * Ac_mm2 / u_mm
-        
-        Ic_y = b * h**3 / 12
-        Ic_z = h * b**3 / 12
-        
-        iy = h / math.sqrt(12)
-        iz = b / math.sqrt(12)
-        
-        d2 = c_nom + phi_w + phi_s / 2
-        d_y = h - d2
-        d_z = b - d2
-        area_bar = math.pi * (phi_s / 2)**2
-        
-        # --- PEŁZANIE ---
-        alpha_1 = (35/fcm)**0.7
-        alpha_2 = (35/fcm)**0.2
-        if fcm <= 35:
-            phi_RH = 1 + (1 - rh/100) / (0.1 * (h0)**(1/3))
-        else:
-            phi_RH = (1 + ((1 - rh/100) / (0.1 * (h0)**(1/3))) * alpha_1) * alpha_2
-            
-        beta_fcm = 16.8 / math.sqrt(fcm)
-        alpha_cem = -1 if cement_type.startswith("S") else (0 if cement_type.startswith("N") else 1)
-        t0_adj = max(0.5, t0 * (9 / (2 + t0**1.2) + 1)**alpha_cem)
-        beta_t0 = 1 / (0.1 + t0_adj**0.2)
-        
-        phi_eff = (phi_RH * beta_fcm * beta_t0) * m_ratio
-        
-        # Sztywność betonu Ecd wg 5.8.7.2(2)
-        Ecd = Ecm / 1.2
-        
-        # --- SOLVER: EFEKTY II RZĘDU & ZBROJENIE ---
-        l0_y = beta_y * L_m
-        l0_z = beta_z * L_m
-        
-        lambda_y = l0_y / iy if iy > 0 else 0
-        lambda_z = l0_z / iz if iz > 0 else 0
-        
-        n_rel_N = NEd / (Ac * fcd) if (Ac * fcd) > 0 else 0
-        k1 = math.sqrt(fck / 20.0)
-        k2_y = min(n_rel_N * lambda_y / 170.0, 0.20)
-        k2_z = min(n_rel_N * lambda_z / 170.0, 0.20)
-        
-        # Dokładny współczynnik Kc wg normy 5.8.7.2 (Wzór 5.21)
-        Kc_y = (k1 * k2_y) / (1 + phi_eff)
-        Kc_z = (k1 * k2_z) / (1 + phi_eff)
-        
-        As_min_ec2 = max(0.10 * NEd / fyd, 0.002 * Ac)
-        As_min_user = 4 * area_bar  # Minimum 4 pręty (po 1 w narożniku)
-        As_min_tot = max(As_min_ec2, As_min_user)
-        As_max = 0.04 * Ac
-        
-        # Start iteracji od minimalnego zbrojenia
-        As1 = As_min_tot / 2.0
-        As2 = As_min_tot / 2.0
-        eta = 999.0
-        
-        for step in range(150):
-            Is_y = As1 * (h/2 - d2)**2 + As2 * (1/3) * (h/2 - d2)**2
-            Is_z = As2 * (b/2 - d2)**2 + As1 * (1/3) * (b/2 - d2)**2
-            
-            EI_y = Kc_y * Ecd * Ic_y + Es * Is_y
-            EI_z = Kc_z * Ecd * Ic_z + Es * Is_z
-            
-            NB_y = (math.pi**2 * EI_y) / (l0_y**2) if l0_y > 0 else 1e9
-            NB_z = (math.pi**2 * EI_z) / (l0_z**2) if l0_z > 0 else 1e9
-            
-            # Bezpiecznik przed zerowym mianownikiem (jeśli utrata stateczności)
-            NB_y = max(NB_y, NEd + 0.0001)
-            NB_z = max(NB_z, NEd + 0.0001)
-                
-            M_Ed_y = M0y / (1 - NEd/NB_y)
-            M_Ed_z = M0z / (1 - NEd/NB_z)
-            
-            # 1. Oblicz bazowe zapotrzebowanie 1D
-            req_As1 = solve_1D(NEd, M_Ed_y, b, h, d_y, d2, fcd, fyd, Es, fck)
-            req_As2 = solve_1D(NEd, M_Ed_z, h, b, d_z, d2, fcd, fyd, Es, fck)
-            
-            test_As1 = max(req_As1, As_min_tot / 2.0)
-            test_As2 = max(req_As2, As_min_tot / 2.0)
-            
-            # 2. Wewnętrzna pętla poszukująca interakcji 2D (Dystrybucja proporcjonalna/ważona)
-            for _ in range(30):
-                MRd_y = get_MRd(NEd, test_As1/2, b, h, d_y, d2, fcd, fyd, Es, fck)
-                MRd_z = get_MRd(NEd, test_As2/2, h, b, d_z, d2, fcd, fyd, Es, fck)
-                
-                N_Rd = Ac * fcd + (test_As1 + test_As2) * fyd
-                n_rel = NEd / N_Rd if N_Rd > 0 else 1.0
-                
-                if n_rel <= 0.1: a_exp = 1.0
-                elif n_rel <= 0.7: a_exp = 1.0 + (n_rel - 0.1) * (0.5 / 0.6)
-                elif n_rel <= 1.0: a_exp = 1.5 + (n_rel - 0.7) * (0.5 / 0.3)
-                else: a_exp = 2.0
-                
-                eta_y = (M_Ed_y / MRd_y)**a_exp if MRd_y > 0 else 999.0
-                eta_z = (M_Ed_z / MRd_z)**a_exp if MRd_z > 0 else 999.0
-                eta = eta_y + eta_z
-                
-                if eta <= eta_limit or (test_As1 + test_As2) > As_max:
-                    break
-                
-                # Ustalenie proporcji "winy" za przekroczenie wytężenia
-                w_y = eta_y / eta if eta > 0 else 0.5
-                w_z = eta_z / eta if eta > 0 else 0.5
-                
-                # Obliczenie potrzebnego globalnego zapasu stali dla osiągnięcia warunku eta_limit
-                scale = min(1.2, max(1.02, (eta / eta_limit)**(1/a_exp)))
-                delta_As = (test_As1 + test_As2) * (scale - 1.0)
-                
-                # Aplikacja zapasu proporcjonalnie do udziału osi
-                test_As1 += delta_As * w_y
-                test_As2 += delta_As * w_z
-                
-            target_As1 = test_As1
-            target_As2 = test_As2
-                
-            # Relaksacja numeryczna na zewnątrz dla efektów II rzędu
-            diff1 = abs(As1 - target_As1)
-            diff2 = abs(As2 - target_As2)
-            
-            As1 = 0.5 * As1 + 0.5 * target_As1
-            As2 = 0.5 * As2 + 0.5 * target_As2
-            
-            if diff1 < 1e-5 and diff2 < 1e-5:
-                break
-
-        As_tot = As1 + As2
-
-        # ----------------------------------------------------------------------
-        # PONOWNE WYLICZENIE STANÓW KOŃCOWYCH (DLA MODUŁU "SZCZEGÓŁY OBLICZEŃ")
-        # ----------------------------------------------------------------------
-        Is_y_fin = As1 * (h/2 - d2)**2 + As2 * (1/3) * (h/2 - d2)**2
-        Is_z_fin = As2 * (b/2 - d2)**2 + As1 * (1/3) * (b/2 - d2)**2
-        EI_y_fin = Kc_y * Ecd * Ic_y + Es * Is_y_fin
-        EI_z_fin = Kc_z * Ecd * Ic_z + Es * Is_z_fin
-        NB_y_fin = (math.pi**2 * EI_y_fin) / (l0_y**2) if l0_y > 0 else 1e9
-        NB_z_fin = (math.pi**2 * EI_z_fin) / (l0_z**2) if l0_z > 0 else 1e9
-        NB_y_fin = max(NB_y_fin, NEd + 0.0001)
-        NB_z_fin = max(NB_z_fin, NEd + 0.0001)
-        M_Ed_y_fin = M0y / (1 - NEd/NB_y_fin)
-        M_Ed_z_fin = M0z / (1 - NEd/NB_z_fin)
-        MRd_y_fin = get_MRd(NEd, As1/2, b, h, d_y, d2, fcd, fyd, Es, fck)
-        MRd_z_fin = get_MRd(NEd, As2/2, h, b, d_z, d2, fcd, fyd, Es, fck)
-        N_Rd_fin = Ac * fcd + (As1 + As2) * fyd
-        n_rel_fin = NEd / N_Rd_fin if N_Rd_fin > 0 else 1.0
-        
-        if n_rel_fin <= 0.1: a_exp_fin = 1.0
-        elif n_rel_fin <= 0.7: a_exp_fin = 1.0 + (n_rel_fin - 0.1) * (0.5 / 0.6)
-        elif n_rel_fin <= 1.0: a_exp_fin = 1.5 + (n_rel_fin - 0.7) * (0.5 / 0.3)
-        else: a_exp_fin = 2.0
-        
-        eta_fin = (M_Ed_y_fin / MRd_y_fin)**a_exp_fin + (M_Ed_z_fin / MRd_z_fin)**a_exp_fin if MRd_y_fin > 0 and MRd_z_fin > 0 else 999.0
-        
-        # Obliczenia na cm2 dla prezentacji
-        As1_cm2 = As1 * 10000
-        As2_cm2 = As2 * 10000
-        area_bar_cm2 = area_bar * 10000
+        solver_method = SOLVER_BRENT if st.session_state.solver_m.startswith("Brent") else SOLVER_SKOKOWY
         phi_val = int(st.session_state.p_s)
-        
-        # Przeliczenie na fizyczne pręty dla poszczególnych pasm (min. 2 na krawędź ze względu na narożniki)
-        n1 = max(2, math.ceil(As1_cm2 / area_bar_cm2))
-        As1_prov_disp = n1 * area_bar_cm2
-        
-        n2 = max(2, math.ceil(As2_cm2 / area_bar_cm2))
-        As2_prov_disp = n2 * area_bar_cm2
-        
-        # Wyznaczenie ilości prętów całkowitej (min. 4 szt., zawsze parzysta liczba dla symetrii)
-        n_total = max(4, math.ceil(As_tot / area_bar))
-        n_total = (n_total + 1) // 2 * 2
-        
-        As_prov_cm2 = n_total * area_bar_cm2
-        As_min_cm2 = As_min_tot * 10000
-        As_max_cm2 = As_max * 10000
+
+        res = design_column(
+            st.session_state.c_class, st.session_state.s_class,
+            st.session_state.b_cm, st.session_state.h_cm,
+            st.session_state.n_ed, st.session_state.m_ey, st.session_state.m_ez,
+            L_m=L_m, beta_y=beta_y, beta_z=beta_z,
+            c_mm=st.session_state.c_mm, phi_s_mm=st.session_state.p_s, phi_w_mm=st.session_state.p_w,
+            rh=st.session_state.rh_val, t0=st.session_state.t0_val, cement_type=st.session_state.cem_val,
+            m_ratio=m_ratio, eta_limit=eta_limit,
+            solver_method=solver_method, solver_tol=st.session_state.solver_tol / 10000.0,
+        )
+
+        b, h, c_nom, phi_s, phi_w = res["b"], res["h"], res["c_nom"], res["phi_s"], res["phi_w"]
+        NEd, M0y, M0z = res["NEd"], res["M0y"], res["M0z"]
+        fck, fyk, fcd, fyd, Ecm, Ecd = res["fck"], res["fyk"], res["fcd"], res["fyd"], res["Ecm"], res["Ecd"]
+        d2, d_y, d_z, h0 = res["d2"], res["d_y"], res["d_z"], res["h0"]
+        phi_RH, beta_fcm, beta_t0, phi_eff = res["phi_RH"], res["beta_fcm"], res["beta_t0"], res["phi_eff"]
+        l0_y, l0_z, iy, iz = res["l0_y"], res["l0_z"], res["iy"], res["iz"]
+        lambda_y, lambda_z = res["lambda_y"], res["lambda_z"]
+        k1, k2_y, k2_z, Kc_y, Kc_z = res["k1"], res["k2_y"], res["k2_z"], res["Kc_y"], res["Kc_z"]
+        As_tot, As_max, eta = res["As_tot"], res["As_max"], res["eta"]
+        EI_y_fin, EI_z_fin, NB_y_fin, NB_z_fin = res["EI_y_fin"], res["EI_z_fin"], res["NB_y_fin"], res["NB_z_fin"]
+        M_Ed_y_fin, M_Ed_z_fin, MRd_y_fin, MRd_z_fin = res["M_Ed_y_fin"], res["M_Ed_z_fin"], res["MRd_y_fin"], res["MRd_z_fin"]
+        N_Rd_fin, n_rel_fin, a_exp_fin = res["N_Rd_fin"], res["n_rel_fin"], res["a_exp_fin"]
+        eta_fin, eta_fib = res["eta_fin"], res["eta_fib"]
+        As1_cm2, As2_cm2, n1, n2 = res["As1_cm2"], res["As2_cm2"], res["n1"], res["n2"]
+        As1_prov_disp, As2_prov_disp = res["As1_prov_disp"], res["As2_prov_disp"]
+        n_total, As_prov_cm2, As_min_cm2, As_max_cm2 = res["n_total"], res["As_prov_cm2"], res["As_min_cm2"], res["As_max_cm2"]
+        solver_stats = res["solver_stats"]
 
         # ======================================================================
         # WYŚWIETLANIE WYNIKÓW
@@ -611,6 +1058,18 @@ def render_column_page():
             st.latex(rf"\text{{Wykładnik interakcji }} a = {a_exp_fin:.2f}")
             st.latex(rf"\eta = \left( \frac{{M_{{Ed,y}}^{{II}}}}{{M_{{Rd,y}}}} \right)^a + \left( \frac{{M_{{Ed,z}}^{{II}}}}{{M_{{Rd,z}}}} \right)^a = \left( \frac{{{M_Ed_y_fin*1000:.2f}}}{{{MRd_y_fin*1000:.2f}}} \right)^{{{a_exp_fin:.2f}}} + \left( \frac{{{M_Ed_z_fin*1000:.2f}}}{{{MRd_z_fin*1000:.2f}}} \right)^{{{a_exp_fin:.2f}}} = {eta_fin:.3f}")
 
+            st.markdown("#### 7. Weryfikacja przekrojem włóknowym (N - M_y - M_z)")
+            eta_fib_txt = f"{eta_fib:.3f}" if math.isfinite(eta_fib) else r"\infty"
+            st.latex(rf"\eta_{{fib}} = \frac{{|M_{{Ed}}|}}{{|M_{{Rd}}(N_{{Ed}}, \theta)|}} = {eta_fib_txt} \quad \text{{(całkowanie po włóknach, }} A_{{s1}} = {As1_cm2:.2f}, \ A_{{s2}} = {As2_cm2:.2f}\,\text{{cm}}^2)")
+
+            st.markdown("#### 8. Statystyki solvera zbrojenia")
+            if solver_method == SOLVER_BRENT and solver_stats["calls"] > 0:
+                st.latex(rf"\text{{Wywołania: }} {solver_stats['calls']}, \quad \text{{iteracje: }} {solver_stats['iterations']}, \quad \text{{obliczenia }} M_{{Rd}}: {solver_stats['evaluations']}")
+            hits_run, misses_run = res["cache_hits"], res["cache_misses"]
+            cache_after = get_capacity_cache().stats()
+            st.latex(rf"\text{{Pamięć nośności (to obliczenie): trafienia }} {hits_run}, \quad \text{{chybienia }} {misses_run}")
+            st.latex(rf"\text{{Pamięć nośności (proces): trafienia }} {cache_after['hits']}, \quad \text{{chybienia }} {cache_after['misses']}, \quad \text{{wpisy }} {cache_after['size']}, \quad \text{{skuteczność }} {cache_after['hit_rate']*100:.1f}\%")
+
 def run():
     render_column_page()
 
@@ -0,0 +1,179 @@
+"""
+WymiarowanieSlupowWsadowe.py
+Wsadowe wymiarowanie słupów prostokątnych (bez interfejsu Streamlit).
+
+Wejście: plik CSV lub XLSX z kolumnami
+    b [cm], h [cm], concrete (np. C30/37), steel (np. B500), l0 [m],
+    N_Ed [kN], M0y [kNm], M0z [kNm]
+oraz opcjonalnie: id, l0_z [m], c_nom [mm], phi_s [mm], phi_w [mm], rh [%],
+t0 [dni], cement, m_ratio, eta_max [%].
+
+Wiersze dzielone są na paczki i liczone w puli procesów (ProcessPoolExecutor).
+Wyniki każdej paczki dopisywane są do pliku CSV zaraz po jej zakończeniu.
+
+Przykład:
+    python WymiarowanieSlupowWsadowe.py zestawienie.xlsx -o wyniki.csv --workers 8
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import WymiarowaniePrzekrojeProstokatne as slup  # noqa: E402
+
+KOLUMNY_WYMAGANE = ["b", "h", "concrete", "steel", "l0", "N_Ed", "M0y", "M0z"]
+
+# Stały układ kolumn pliku wynikowego (wiersze z błędem mają puste pola wyników)
+KOLUMNY_WYNIKOW = [
+    "id", "M_Ed_y_kNm", "M_Ed_z_kNm", "As1_cm2", "As2_cm2", "n_total",
+    "As_prov_cm2", "eta", "eta_fib", "ok", "blad",
+]
+
+# Wartości domyślne zgodne z formularzem strony
+DOMYSLNE = {
+    "c_nom": 35,
+    "phi_s": 16,
+    "phi_w": 8,
+    "rh": 50,
+    "t0": 28,
+    "cement": "N - normalnie twardniejący",
+    "m_ratio": 0.7,
+    "eta_max": 100,
+}
+
+
+def read_schedule(path):
+    """Wczytuje zestawienie słupów z pliku CSV lub XLSX."""
+    path = Path(path)
+    if path.suffix.lower() in (".xlsx", ".xls"):
+        df = pd.read_excel(path, engine="openpyxl")
+    else:
+        df = pd.read_csv(path, sep=None, engine="python")
+
+    brak = [k for k in KOLUMNY_WYMAGANE if k not in df.columns]
+    if brak:
+        raise ValueError(f"Brak wymaganych kolumn w zestawieniu: {', '.join(brak)}")
+
+    if "id" not in df.columns:
+        df.insert(0, "id", range(1, len(df) + 1))
+    for key, val in DOMYSLNE.items():
+        if key not in df.columns:
+            df[key] = val
+        else:
+            df[key] = df[key].fillna(val)
+    if "l0_z" not in df.columns:
+        df["l0_z"] = df["l0"]
+    else:
+        df["l0_z"] = df["l0_z"].fillna(df["l0"])
+    return df
+
+
+def design_row(row, solver_method=slup.SOLVER_SKOKOWY, fiber_check=False):
+    """Wymiarowanie jednego wiersza zestawienia; błędy zapisywane w kolumnie 'blad'."""
+    wynik = {"id": row["id"]}
+    try:
+        l0_y = float(row["l0"])
+        l0_z = float(row["l0_z"])
+        res = slup.design_column(
+            str(row["concrete"]), str(row["steel"]),
+            float(row["b"]), float(row["h"]),
+            float(row["N_Ed"]), float(row["M0y"]), float(row["M0z"]),
+            L_m=l0_y, beta_y=1.0, beta_z=l0_z / l0_y if l0_y > 0 else 1.0,
+            c_mm=float(row["c_nom"]), phi_s_mm=float(row["phi_s"]), phi_w_mm=float(row["phi_w"]),
+            rh=float(row["rh"]), t0=float(row["t0"]), cement_type=str(row["cement"]),
+            m_ratio=float(row["m_ratio"]), eta_limit=float(row["eta_max"]) / 100.0,
+            solver_method=solver_method, fiber_check=fiber_check,
+        )
+        wynik.update({
+            "M_Ed_y_kNm": res["M_Ed_y_fin"] * 1000,
+            "M_Ed_z_kNm": res["M_Ed_z_fin"] * 1000,
+            "As1_cm2": res["As1_cm2"],
+            "As2_cm2": res["As2_cm2"],
+            "n_total": res["n_total"],
+            "As_prov_cm2": res["As_prov_cm2"],
+            "eta": res["eta"],
+            "eta_fib": res["eta_fib"] if res["eta_fib"] is not None else math.nan,
+            "ok": res["ok"],
+            "blad": "",
+        })
+    except Exception as e:
+        wynik.update({"ok": False, "blad": str(e)})
+    return wynik
+
+
+def design_chunk(rows, solver_method=slup.SOLVER_SKOKOWY, fiber_check=False):
+    """Paczka wierszy liczona w jednym procesie roboczym."""
+    return [design_row(row, solver_method, fiber_check) for row in rows]
+
+
+def run_batch(input_path, output_path, workers=None, chunk_size=200,
+              solver_method=slup.SOLVER_SKOKOWY, fiber_check=False):
+    """
+    Wymiarowanie całego zestawienia. Wyniki paczek dopisywane są do pliku CSV
+    w kolejności ukończenia, zawsze w układzie KOLUMNY_WYNIKOW (nagłówek zapisywany
+    raz, przed obliczeniami). Zwraca słownik: liczba słupów, czas [s], słupy/s.
+    """
+    df = read_schedule(input_path)
+    rows = df.to_dict("records")
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+    output_path = Path(output_path)
+    pd.DataFrame(columns=KOLUMNY_WYNIKOW).to_csv(output_path, index=False)
+
+    t_start = time.perf_counter()
+    n_done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(design_chunk, chunk, solver_method, fiber_check) for chunk in chunks]
+        for future in as_completed(futures):
+            wyniki = pd.DataFrame(future.result()).reindex(columns=KOLUMNY_WYNIKOW)
+            wyniki.to_csv(output_path, mode="a", header=False, index=False)
+            n_done += len(wyniki)
+            print(f"  {n_done}/{len(rows)} słupów", file=sys.stderr)
+    elapsed = time.perf_counter() - t_start
+
+    return {
+        "n_columns": n_done,
+        "time_s": elapsed,
+        "columns_per_s": n_done / elapsed if elapsed > 0 else math.inf,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wsadowe wymiarowanie słupów prostokątnych wg PN-EN 1992-1-1.")
+    parser.add_argument("input", help="Zestawienie słupów (CSV lub XLSX).")
+    parser.add_argument("-o", "--output", default="wyniki_slupy.csv", help="Plik wynikowy CSV.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Liczba procesów roboczych.")
+    parser.add_argument("--chunk", type=int, default=200, help="Liczba wierszy w paczce.")
+    parser.add_argument("--solver", choices=[slup.SOLVER_BRENT, slup.SOLVER_SKOKOWY], default=slup.SOLVER_SKOKOWY)
+    parser.add_argument("--fiber", action="store_true", help="Dodatkowa weryfikacja przekrojem włóknowym.")
+    args = parser.parse_args(argv)
+
+    stats = run_batch(args.input, args.output, args.workers, args.chunk, args.solver, args.fiber)
+    print(f"Zwymiarowano {stats['n_columns']} słupów w {stats['time_s']:.2f} s "
+          f"({stats['columns_per_s']:.1f} słupów/s). Wyniki: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
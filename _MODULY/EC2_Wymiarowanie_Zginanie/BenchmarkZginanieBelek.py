@@ -0,0 +1,99 @@
+"""
+BenchmarkZginanieBelek.py
+Porównanie przepustowości: pętla po calculate_bending_ec2 vs calculate_bending_ec2_vec.
+
+Obwiednia momentów belki swobodnie podpartej (parabola) w n przekrojach,
+M_qp = 0.7 M_Ed. Wyniki obu wersji są dodatkowo porównywane.
+
+Przykład:
+    python BenchmarkZginanieBelek.py -n 1000 10000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import WymiarowanieBelkiZginanie as belka  # noqa: E402
+
+PRZEKROJ = {
+    "concrete_name": "C30/37",
+    "steel_name": "B500",
+    "width_cm": 30.0,
+    "height_cm": 60.0,
+    "cover_nom_mm": 30,
+    "diameter_bar_mm": 16,
+    "diameter_stirrup_mm": 8,
+}
+
+
+def moment_envelope(n_stations, moment_max_kNm=400.0):
+    """Obwiednia M_Ed i M_qp [kNm] w n przekrojach belki."""
+    x = np.linspace(0.0, 1.0, n_stations)
+    moment_ed = 4.0 * moment_max_kNm * x * (1.0 - x)
+    return moment_ed, 0.7 * moment_ed
+
+
+def benchmark(n_stations, crack_limit_mm=0.3, scalar_limit=20000):
+    """Czas [s] i przepustowość [przekroje/s] obu wersji. Pętla skalarna liczona na co najwyżej scalar_limit przekrojach."""
+    moment_ed, moment_qp = moment_envelope(n_stations)
+
+    t0 = time.perf_counter()
+    res_vec = belka.calculate_bending_ec2_vec(**PRZEKROJ, moment_ed_kNm=moment_ed, moment_qp_kNm=moment_qp,
+                                              crack_limit_mm=crack_limit_mm)
+    t_vec = time.perf_counter() - t0
+
+    n_scalar = min(n_stations, scalar_limit)
+    t0 = time.perf_counter()
+    res_scalar = [
+        belka.calculate_bending_ec2(**PRZEKROJ, moment_ed_kNm=m_ed, moment_qp_kNm=m_qp, crack_limit_mm=crack_limit_mm)
+        for m_ed, m_qp in zip(moment_ed[:n_scalar], moment_qp[:n_scalar])
+    ]
+    t_scalar = time.perf_counter() - t0
+
+    zgodne = all(
+        r["bar_count_final"] == res_vec["bar_count_final"][i] and abs(r["wk_final"] - res_vec["wk_final"][i]) < 1e-9
+        for i, r in enumerate(res_scalar)
+    )
+
+    return {
+        "n": n_stations,
+        "scalar_per_s": n_scalar / t_scalar,
+        "vec_per_s": n_stations / t_vec,
+        "speedup": (n_stations / t_vec) / (n_scalar / t_scalar),
+        "zgodne": zgodne,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark wektorowego wymiarowania belek na zginanie.")
+    parser.add_argument("-n", type=int, nargs="+", default=[1000, 10000, 100000], help="Liczby przekrojów.")
+    parser.add_argument("--wk", type=float, default=0.3, help="Dopuszczalna szerokość rysy [mm].")
+    args = parser.parse_args(argv)
+
+    print(f"{'n':>8} {'pętla [1/s]':>14} {'wektor [1/s]':>14} {'przysp.':>8}  zgodność")
+    for n in args.n:
+        r = benchmark(n, args.wk)
+        print(f"{r['n']:>8} {r['scalar_per_s']:>14.0f} {r['vec_per_s']:>14.0f} {r['speedup']:>7.1f}x  {'TAK' if r['zgodne'] else 'NIE'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,43 +5,92 @@
 import streamlit as st
 import math
 
+import numpy as np
+import pandas as pd
+
 # --- TABLICE ---
 try:
     from TABLICE.ParametryBetonu import CONCRETE_TABLE, list_concrete_classes
     from TABLICE.ParametryStali import STEEL_TABLE
+    from TABLICE.ParametryPretowZbrojeniowych import list_bar_diameters, get_bar_params
 except Exception:
     st.error("Błąd importu TABLICE. Sprawdź pliki w folderze TABLICE.")
     st.stop()
 
 
-def calculate_bending_ec2(
-    concrete_name, 
-    steel_name, 
-    width_cm, 
-    height_cm, 
-    cover_nom_mm, 
-    diameter_bar_mm, 
-    diameter_stirrup_mm, 
-    moment_ed_kNm, 
-    moment_qp_kNm, 
-    crack_limit_mm
-):
+# ==============================================================================
+# SZEROKOŚĆ RYS - JĄDRO WEKTOROWE
+# ==============================================================================
+
+def crack_width_ec2(area_steel_m2, num_bars, moment_qp_mnm, width_m, height_m, effective_depth_d, a1_m,
+                    alpha_e, es_modulus_mpa, fct_eff, cover_nom_mm, diameter_stirrup_mm, diameter_bar_mm):
     """
-    Funkcja obliczeniowa (EC2) - wersja REFERENCYJNA.
+    Szerokość rysy w_k [mm] wg EC2 7.3.4 dla tablic zbrojenia (faza II, s_r,max, eps_sm - eps_cm).
+    Argumenty area_steel_m2, num_bars i moment_qp_mnm są rozgłaszane (NumPy broadcasting).
+    Zwraca słownik tablic pośrednich: x_ii, inertia_ii, sigma_s, rho_p_eff, eps_diff, sr_max, wk.
     """
-    
-    # ---------------------------------------------------------
-    # 0. ZABEZPIECZENIE DANYCH
-    # ---------------------------------------------------------
-    moment_qp_kNm = min(moment_qp_kNm, moment_ed_kNm)
-    
-    warnings = {
-        "layers_exceeded": False,
-        "compression_low": False,
-        "max_reinforcement": False,
-        "spacing_issue": False
+    area = np.asarray(area_steel_m2, dtype=float)
+    moment_qp_mnm = np.asarray(moment_qp_mnm, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Faza II
+        coeff_aa = 0.5 * width_m
+        coeff_bb = alpha_e * area
+        coeff_cc = -alpha_e * area * effective_depth_d
+        x_ii = (-coeff_bb + np.sqrt(coeff_bb**2 - 4 * coeff_aa * coeff_cc)) / (2 * coeff_aa)
+
+        inertia_ii = (width_m * x_ii**3) / 3 + alpha_e * area * (effective_depth_d - x_ii)**2
+        sigma_s = alpha_e * moment_qp_mnm * (effective_depth_d - x_ii) / inertia_ii
+
+        hc_eff = np.minimum(np.minimum(2.5 * a1_m, (height_m - x_ii) / 3.0), height_m / 2.0)
+        ac_eff = width_m * hc_eff
+        rho_p_eff = np.where(ac_eff > 0, area / ac_eff, 0.0)
+
+        val_term = 0.4 * (fct_eff / rho_p_eff) * (1 + alpha_e * rho_p_eff)
+        eps_diff = np.maximum(0.6 * sigma_s / es_modulus_mpa, (sigma_s - val_term) / es_modulus_mpa)
+
+        # s_r,max
+        num_bars_real = np.maximum(2, num_bars)
+        width_available = width_m - 2 * (cover_nom_mm + diameter_stirrup_mm) / 1000.0
+        phi_m = diameter_bar_mm / 1000.0
+        s_clear = (width_available - num_bars_real * phi_m) / (num_bars_real - 1)
+        limit_spacing = 5 * (cover_nom_mm + diameter_bar_mm / 2.0) / 1000.0
+
+        k1, k2, k3, k4 = 0.8, 0.5, 3.4, 0.425
+        sr_max = np.where(
+            s_clear > limit_spacing,
+            1.3 * (height_m - x_ii),
+            k3 * a1_m + k4 * k1 * k2 * phi_m / rho_p_eff
+        )
+
+        wk = sr_max * eps_diff * 1000.0
+
+    wk = np.where(inertia_ii == 0, 0.0, wk)
+    wk = np.where(area <= 1e-9, 999.0, wk)
+
+    return {
+        "x_ii": x_ii,
+        "inertia_ii": inertia_ii,
+        "sigma_s": sigma_s,
+        "rho_p_eff": rho_p_eff,
+        "eps_diff": eps_diff,
+        "sr_max": sr_max,
+        "wk": wk,
     }
 
+
+def bending_section_parameters(
+    concrete_name,
+    steel_name,
+    width_cm,
+    height_cm,
+    cover_nom_mm,
+    diameter_bar_mm,
+    diameter_stirrup_mm
+):
+    """
+    Parametry materiałowe i geometryczne przekroju belki (wspólne dla obliczeń skalarnych i wektorowych).
+    """
     # ---------------------------------------------------------
     # 1. DANE MATERIAŁOWE + AUTO-KOREKTA JEDNOSTEK
     # ---------------------------------------------------------
@@ -111,11 +160,78 @@ def calculate_bending_ec2(
     
     effective_depth_d = height_m - a1_m
 
+    area_one_bar_cm2 = math.pi * (diameter_bar_mm/20)**2
+
+    return {
+        "GAMMA_C": GAMMA_C,
+        "GAMMA_S": GAMMA_S,
+        "ALPHA_CC": ALPHA_CC,
+        "fck": fck,
+        "fctm": fctm,
+        "fct_eff": fct_eff,
+        "fcd": fcd,
+        "ecm_modulus_mpa": ecm_modulus_mpa,
+        "lambda_bet": lambda_bet,
+        "eta_bet": eta_bet,
+        "eps_cu3": eps_cu3,
+        "fyk": fyk,
+        "fyd": fyd,
+        "es_modulus_mpa": es_modulus_mpa,
+        "eps_yd": eps_yd,
+        "alpha_e": alpha_e,
+        "width_m": width_m,
+        "height_m": height_m,
+        "a1_m": a1_m,
+        "a2_m": a2_m,
+        "effective_depth_d": effective_depth_d,
+        "area_one_bar_cm2": area_one_bar_cm2,
+    }
+
+
+def calculate_bending_ec2(
+    concrete_name, 
+    steel_name, 
+    width_cm, 
+    height_cm, 
+    cover_nom_mm, 
+    diameter_bar_mm, 
+    diameter_stirrup_mm, 
+    moment_ed_kNm, 
+    moment_qp_kNm, 
+    crack_limit_mm
+):
+    """
+    Funkcja obliczeniowa (EC2) - wersja REFERENCYJNA.
+    """
+    
+    # ---------------------------------------------------------
+    # 0. ZABEZPIECZENIE DANYCH
+    # ---------------------------------------------------------
+    moment_qp_kNm = min(moment_qp_kNm, moment_ed_kNm)
+    
+    warnings = {
+        "layers_exceeded": False,
+        "compression_low": False,
+        "max_reinforcement": False,
+        "spacing_issue": False
+    }
+
+    # ---------------------------------------------------------
+    # 1. DANE MATERIAŁOWE + 2. GEOMETRIA
+    # ---------------------------------------------------------
+    prm = bending_section_parameters(
+        concrete_name, steel_name, width_cm, height_cm, cover_nom_mm, diameter_bar_mm, diameter_stirrup_mm
+    )
+    GAMMA_C, GAMMA_S, ALPHA_CC, fck = prm["GAMMA_C"], prm["GAMMA_S"], prm["ALPHA_CC"], prm["fck"]
+    fctm, fct_eff, fcd, ecm_modulus_mpa = prm["fctm"], prm["fct_eff"], prm["fcd"], prm["ecm_modulus_mpa"]
+    lambda_bet, eta_bet, eps_cu3, fyk = prm["lambda_bet"], prm["eta_bet"], prm["eps_cu3"], prm["fyk"]
+    fyd, es_modulus_mpa, eps_yd, alpha_e = prm["fyd"], prm["es_modulus_mpa"], prm["eps_yd"], prm["alpha_e"]
+    width_m, height_m, a1_m, a2_m = prm["width_m"], prm["height_m"], prm["a1_m"], prm["a2_m"]
+    effective_depth_d, area_one_bar_cm2 = prm["effective_depth_d"], prm["area_one_bar_cm2"]
+
     moment_ed_mnm = moment_ed_kNm / 1000.0
     moment_qp_mnm = moment_qp_kNm / 1000.0
 
-    area_one_bar_cm2 = math.pi * (diameter_bar_mm/20)**2
-
     # ---------------------------------------------------------
     # KROK 1: OBLICZENIE As_SGN (Nośność)
     # ---------------------------------------------------------
@@ -193,77 +309,40 @@ def calculate_bending_ec2(
     moment_cracking = fct_eff * modulus_section_wc
     moment_cracking_kNm = moment_cracking * 1000.0
 
-    def calculate_crack_width(area_steel_m2):
-        if area_steel_m2 <= 1e-9: return 999.0
-
-        # Faza II
-        coeff_aa = 0.5 * width_m
-        coeff_bb = alpha_e * area_steel_m2
-        coeff_cc = -alpha_e * area_steel_m2 * effective_depth_d
-        
-        delta = coeff_bb**2 - 4 * coeff_aa * coeff_cc
-        x_ii = (-coeff_bb + math.sqrt(delta)) / (2 * coeff_aa)
-
-        inertia_ii = (width_m * x_ii**3) / 3 + alpha_e * area_steel_m2 * (effective_depth_d - x_ii)**2
-        if inertia_ii == 0: return 0.0
-
-        sigma_s = alpha_e * moment_qp_mnm * (effective_depth_d - x_ii) / inertia_ii
-
-        hc_eff = min(2.5 * a1_m, (height_m - x_ii) / 3.0, height_m / 2.0)
-        ac_eff = width_m * hc_eff
-        rho_p_eff = area_steel_m2 / ac_eff if ac_eff > 0 else 0.0
-
-        val_term = 0.4 * (fct_eff / rho_p_eff) * (1 + alpha_e * rho_p_eff)
-        eps_diff = max(
-            0.6 * sigma_s / es_modulus_mpa,
-            (sigma_s - val_term) / es_modulus_mpa
-        )
-
-        # s_r,max
-        area_one_bar_m2 = math.pi * (diameter_bar_mm / 2000.0)**2
-        num_bars_real = max(2, math.ceil(area_steel_m2 / area_one_bar_m2))
-        
-        width_available = width_m - 2*(cover_nom_mm + diameter_stirrup_mm)/1000.0
-        phi_m = diameter_bar_mm / 1000.0
-        
-        s_clear = (width_available - num_bars_real * phi_m) / (num_bars_real - 1)
-        limit_spacing = 5 * (cover_nom_mm + diameter_bar_mm/2.0) / 1000.0
-        
-        if s_clear > limit_spacing:
-            sr_max = 1.3 * (height_m - x_ii)
-        else:
-            k1, k2, k3, k4 = 0.8, 0.5, 3.4, 0.425
-            sr_max = k3 * a1_m + k4 * k1 * k2 * phi_m / rho_p_eff
-
-        return sr_max * eps_diff * 1000.0
-
-
     # --- PRZELICZENIE NA RZECZYWISTE PRĘTY (SGN) ---
     num_bars_sgn = math.ceil(area_s1_sgn_final_cm2 / area_one_bar_cm2)
     area_prov_sgn_cm2 = num_bars_sgn * area_one_bar_cm2
-    
-    # 1. Sprawdzamy rysę dla zbrojenia RZECZYWISTEGO z SGN
-    wk_real_sgn = 0.0
-    if moment_qp_mnm > moment_cracking:
-        wk_real_sgn = calculate_crack_width(area_prov_sgn_cm2 / 10000.0)
-    
-    # 2. Dobór końcowy (Iteracyjnie dodajemy pręty jeśli rysa za duża)
-    num_bars_final = num_bars_sgn
+    is_cracked = moment_qp_mnm > moment_cracking
+
+    # Wszystkie liczby prętów od SGN do granicy 4% (plus jedna ponad granicą,
+    # na której zatrzymywało się dodawanie prętów) liczone jednym przebiegiem
+    num_bars_cap = max(num_bars_sgn, math.floor(0.04 * width_cm * height_cm / area_one_bar_cm2 + 1e-9))
+    bar_counts = np.arange(num_bars_sgn, num_bars_cap + 2)
+    sgu_arrays = crack_width_ec2(
+        bar_counts * area_one_bar_cm2 / 10000.0, bar_counts, moment_qp_mnm,
+        width_m, height_m, effective_depth_d, a1_m, alpha_e, es_modulus_mpa, fct_eff,
+        cover_nom_mm, diameter_stirrup_mm, diameter_bar_mm
+    )
+    sgu_arrays["bar_count"] = bar_counts
+
+    # 1. Rysa dla zbrojenia RZECZYWISTEGO z SGN
+    wk_real_sgn = float(sgu_arrays["wk"][0]) if is_cracked else 0.0
+
+    # 2. Dobór końcowy: pierwsza liczba prętów spełniająca warunek rysy
+    idx_final = 0
     wk_final = wk_real_sgn
-    
-    if moment_qp_mnm > moment_cracking:
-        while wk_final > crack_limit_mm:
-            num_bars_final += 1
-            area_current_cm2 = num_bars_final * area_one_bar_cm2
-            
-            # Bezpiecznik: 4% zbrojenia
-            if (area_current_cm2 / (width_cm * height_cm)) > 0.04:
-                break
-                
-            wk_final = calculate_crack_width(area_current_cm2 / 10000.0)
-    else:
-        wk_final = 0.0
+    if is_cracked:
+        wk_feasible = sgu_arrays["wk"][:-1]
+        compliant = np.flatnonzero(wk_feasible <= crack_limit_mm)
+        if compliant.size:
+            idx_final = int(compliant[0])
+            wk_final = float(wk_feasible[idx_final])
+        else:
+            # Brak rozwiązania do 4% - jak dotąd: liczba prętów ponad granicą, w_k ostatniej dopuszczalnej
+            idx_final = len(bar_counts) - 1
+            wk_final = float(wk_feasible[-1])
 
+    num_bars_final = int(bar_counts[idx_final])
     area_prov_final_cm2 = num_bars_final * area_one_bar_cm2
 
     # --- SGU DEBUG DATA (Dla raportu) ---
@@ -272,53 +351,13 @@ def calculate_bending_ec2(
         "sigma_s": 0.0,
         "sr_max": 0.0,
         "eps_diff": 0.0,
-        "is_cracked": (moment_qp_mnm > moment_cracking)
+        "is_cracked": is_cracked,
+        "arrays": sgu_arrays
     }
 
-    if sgu_debug_data["is_cracked"] and area_prov_final_cm2 > 0:
-        # Przeliczenie raz jeszcze dla ostatecznego zbrojenia, aby wyciągnąć parametry
-        area_steel_final_m2 = area_prov_final_cm2 / 10000.0
-        
-        coeff_aa = 0.5 * width_m
-        coeff_bb = alpha_e * area_steel_final_m2
-        coeff_cc = -alpha_e * area_steel_final_m2 * effective_depth_d
-        
-        delta = coeff_bb**2 - 4 * coeff_aa * coeff_cc
-        x_ii_val = (-coeff_bb + math.sqrt(delta)) / (2 * coeff_aa)
-        
-        inertia_ii_val = (width_m * x_ii_val**3) / 3 + alpha_e * area_steel_final_m2 * (effective_depth_d - x_ii_val)**2
-        
-        if inertia_ii_val > 0:
-            sigma_s_val = alpha_e * moment_qp_mnm * (effective_depth_d - x_ii_val) / inertia_ii_val
-            
-            # Parametry do wk
-            hc_eff = min(2.5 * a1_m, (height_m - x_ii_val) / 3.0, height_m / 2.0)
-            ac_eff = width_m * hc_eff
-            rho_p_eff = area_steel_final_m2 / ac_eff if ac_eff > 0 else 0.0
-            
-            val_term = 0.4 * (fct_eff / rho_p_eff) * (1 + alpha_e * rho_p_eff)
-            eps_diff_val = max(
-                0.6 * sigma_s_val / es_modulus_mpa,
-                (sigma_s_val - val_term) / es_modulus_mpa
-            )
-
-            # sr_max
-            num_bars_final_calc = max(2, num_bars_final)
-            width_available = width_m - 2*(cover_nom_mm + diameter_stirrup_mm)/1000.0
-            phi_m = diameter_bar_mm / 1000.0
-            s_clear = (width_available - num_bars_final_calc * phi_m) / (num_bars_final_calc - 1)
-            limit_spacing = 5 * (cover_nom_mm + diameter_bar_mm/2.0) / 1000.0
-            
-            if s_clear > limit_spacing:
-                sr_max_val = 1.3 * (height_m - x_ii_val)
-            else:
-                k1, k2, k3, k4 = 0.8, 0.5, 3.4, 0.425
-                sr_max_val = k3 * a1_m + k4 * k1 * k2 * phi_m / rho_p_eff
-                
-            sgu_debug_data["x_ii"] = x_ii_val
-            sgu_debug_data["sigma_s"] = sigma_s_val
-            sgu_debug_data["sr_max"] = sr_max_val
-            sgu_debug_data["eps_diff"] = eps_diff_val
+    if is_cracked and area_prov_final_cm2 > 0 and sgu_arrays["inertia_ii"][idx_final] > 0:
+        for key in ("x_ii", "sigma_s", "sr_max", "eps_diff"):
+            sgu_debug_data[key] = float(sgu_arrays[key][idx_final])
 
     # --- WERYFIKACJA WARSTW I ODSTĘPU ---
     width_avail_cm = width_cm - 2*(cover_nom_mm + diameter_stirrup_mm)/10.0
@@ -385,6 +424,226 @@ def calculate_bending_ec2(
     }
 
 
+# ==============================================================================
+# ZGINANIE BELKI - WERSJA WEKTOROWA (OBWIEDNIE MOMENTÓW)
+# ==============================================================================
+
+def calculate_bending_ec2_vec(
+    concrete_name,
+    steel_name,
+    width_cm,
+    height_cm,
+    cover_nom_mm,
+    diameter_bar_mm,
+    diameter_stirrup_mm,
+    moment_ed_kNm,
+    moment_qp_kNm,
+    crack_limit_mm,
+    chunk_size=20000
+):
+    """
+    Wektorowy odpowiednik calculate_bending_ec2 dla tablic M_Ed i M_qp
+    (przekroje wzdłuż belki lub kombinacje obciążeń). Średnice prętów i strzemion
+    mogą być tablicami - wszystkie cztery argumenty są rozgłaszane do wspólnego kształtu.
+    Momenty brane są co do wartości bezwzględnej. Zwraca słownik tablic.
+    """
+    moment_ed_kNm, moment_qp_kNm, diameter_bar_mm, diameter_stirrup_mm = np.broadcast_arrays(
+        np.abs(np.asarray(moment_ed_kNm, dtype=float)),
+        np.abs(np.asarray(moment_qp_kNm, dtype=float)),
+        np.asarray(diameter_bar_mm, dtype=float),
+        np.asarray(diameter_stirrup_mm, dtype=float)
+    )
+    moment_qp_kNm = np.minimum(moment_qp_kNm, moment_ed_kNm)
+
+    prm = bending_section_parameters(
+        concrete_name, steel_name, width_cm, height_cm, cover_nom_mm, diameter_bar_mm, diameter_stirrup_mm
+    )
+    fcd, fyd, fct_eff = prm["fcd"], prm["fyd"], prm["fct_eff"]
+    eta_bet, lambda_bet, eps_cu3, eps_yd = prm["eta_bet"], prm["lambda_bet"], prm["eps_cu3"], prm["eps_yd"]
+    es_modulus_mpa, alpha_e = prm["es_modulus_mpa"], prm["alpha_e"]
+    width_m, height_m, a1_m, a2_m = prm["width_m"], prm["height_m"], prm["a1_m"], prm["a2_m"]
+    effective_depth_d, area_one_bar_cm2 = prm["effective_depth_d"], prm["area_one_bar_cm2"]
+
+    moment_ed_mnm = moment_ed_kNm / 1000.0
+    moment_qp_mnm = moment_qp_kNm / 1000.0
+
+    # ---------------------------------------------------------
+    # KROK 1: As_SGN - gałęzie pojedynczo / podwójnie zbrojone jako maski
+    # ---------------------------------------------------------
+    xi_lim = eps_cu3 / (eps_cu3 + eps_yd)
+    omega_lim = lambda_bet * xi_lim
+    mu_lim = omega_lim * (1 - 0.5 * omega_lim)
+
+    denominator = eta_bet * fcd * width_m * effective_depth_d**2
+    mu_ed = moment_ed_mnm / denominator
+    is_doubly_reinforced = mu_ed > mu_lim
+
+    # Pojedynczo zbrojony
+    omega_req = np.minimum(1 - np.sqrt(np.maximum(0, 1 - 2 * mu_ed)), omega_lim)
+    z_arm = (1 - 0.5 * omega_req) * effective_depth_d
+    with np.errstate(divide="ignore", invalid="ignore"):
+        area_s1_single_m2 = np.where(z_arm > 0, moment_ed_mnm / (z_arm * fyd), 0.0)
+
+    # Podwójnie zbrojony (sigma_s2 zależy tylko od przekroju)
+    moment_rd_lim = mu_lim * denominator
+    x_lim = xi_lim * effective_depth_d
+    sigma_s2 = np.where(x_lim > a2_m, np.minimum(eps_cu3 * (x_lim - a2_m) / x_lim * es_modulus_mpa, fyd), 0.0)
+    compression_low = sigma_s2 < 0.1 * fyd
+    effective_sigma_s2 = np.maximum(sigma_s2, 0.1 * fyd)
+    z_lim = effective_depth_d * (1 - 0.5 * omega_lim)
+
+    area_s2_req_m2 = np.where(
+        is_doubly_reinforced,
+        (moment_ed_mnm - moment_rd_lim) / (effective_sigma_s2 * (effective_depth_d - a2_m)),
+        0.0
+    )
+    area_s1_double_m2 = moment_rd_lim / (z_lim * fyd) + area_s2_req_m2 * (effective_sigma_s2 / fyd)
+
+    area_sgn_cm2 = np.where(is_doubly_reinforced, area_s1_double_m2, area_s1_single_m2) * 10000
+    area_s2_req_cm2 = area_s2_req_m2 * 10000
+
+    # ---------------------------------------------------------
+    # KROK 2: As_SGU - siatka (przekrój x liczba prętów), liczona paczkami
+    # ---------------------------------------------------------
+    moment_cracking = fct_eff * (width_m * height_m**2) / 6.0
+    is_cracked = moment_qp_mnm > moment_cracking
+
+    bar_count_sgn = np.ceil(area_sgn_cm2 / area_one_bar_cm2).astype(int)
+    num_bars_cap = np.floor(0.04 * width_cm * height_cm / area_one_bar_cm2 + 1e-9).astype(int)
+
+    flat_sgn = bar_count_sgn.ravel()
+    flat_qp = moment_qp_mnm.ravel()
+    flat_cracked = is_cracked.ravel()
+    flat_cap = num_bars_cap.ravel()
+    flat_bar = diameter_bar_mm.ravel()
+    flat_stirrup = diameter_stirrup_mm.ravel()
+    flat_a1 = a1_m.ravel()
+    flat_d = effective_depth_d.ravel()
+    flat_area_bar = area_one_bar_cm2.ravel()
+    wk_sgn_only = np.zeros(flat_sgn.shape)
+    wk_final = np.zeros(flat_sgn.shape)
+    bar_count_final = flat_sgn.copy()
+
+    for start in range(0, flat_sgn.size, chunk_size):
+        sl = slice(start, start + chunk_size)
+        n_sgn = flat_sgn[sl]
+        # Kandydaci: od liczby z SGN do granicy 4% oraz jeden pręt ponad granicą
+        n_last = np.maximum(n_sgn, flat_cap[sl]) + 1
+        offsets = np.arange(int((n_last - n_sgn).max()) + 1)
+        counts = n_sgn[:, None] + offsets[None, :]
+        in_range = counts <= n_last[:, None]
+
+        wk = crack_width_ec2(
+            counts * flat_area_bar[sl][:, None] / 10000.0, counts, flat_qp[sl][:, None],
+            width_m, height_m, flat_d[sl][:, None], flat_a1[sl][:, None], alpha_e, es_modulus_mpa, fct_eff,
+            cover_nom_mm, flat_stirrup[sl][:, None], flat_bar[sl][:, None]
+        )["wk"]
+
+        feasible = in_range & (counts < n_last[:, None])
+        compliant = feasible & (wk <= crack_limit_mm)
+        has_solution = compliant.any(axis=1)
+        idx_first = np.argmax(compliant, axis=1)
+        idx_last_feasible = (n_last - n_sgn) - 1
+
+        rows = np.arange(n_sgn.size)
+        idx_final = np.where(has_solution, idx_first, idx_last_feasible + 1)
+        idx_wk = np.where(has_solution, idx_first, idx_last_feasible)
+
+        cracked = flat_cracked[sl]
+        wk_sgn_only[sl] = np.where(cracked, wk[:, 0], 0.0)
+        wk_final[sl] = np.where(cracked, wk[rows, idx_wk], 0.0)
+        bar_count_final[sl] = np.where(cracked, counts[rows, idx_final], n_sgn)
+
+    shape = moment_ed_mnm.shape
+    wk_sgn_only = wk_sgn_only.reshape(shape)
+    wk_final = wk_final.reshape(shape)
+    bar_count_final = bar_count_final.reshape(shape)
+    area_prov_cm2 = bar_count_final * area_one_bar_cm2
+
+    # --- WARSTWY I STOPIEŃ ZBROJENIA ---
+    width_avail_cm = width_cm - 2*(cover_nom_mm + diameter_stirrup_mm)/10.0
+    space_occupied = bar_count_final * (diameter_bar_mm/10.0) + (bar_count_final - 1) * np.maximum(2.0, diameter_bar_mm/10.0)
+
+    return {
+        "area_sgn": area_sgn_cm2,
+        "area_s2_req": area_s2_req_cm2,
+        "is_doubly_reinforced": is_doubly_reinforced,
+        "bar_count_sgn": bar_count_sgn,
+        "bar_count_final": bar_count_final,
+        "area_prov": area_prov_cm2,
+        "wk_sgn_only": wk_sgn_only,
+        "wk_final": wk_final,
+        "is_cracked": is_cracked,
+        "sgu_governs": bar_count_final > bar_count_sgn,
+        "M_cr_kNm": moment_cracking * 1000.0,
+        "warnings": {
+            "layers_exceeded": space_occupied > width_avail_cm,
+            "compression_low": is_doubly_reinforced & compression_low,
+            "max_reinforcement": area_prov_cm2 > (0.04 * width_cm * height_cm),
+        },
+    }
+
+
+# ==============================================================================
+# OPTYMALIZACJA ZBROJENIA - NAJMNIEJSZA MASA STALI
+# ==============================================================================
+
+STIRRUP_DIAMETERS_MM = [6, 8, 10, 12, 16]
+
+
+def optimize_bending_reinforcement(
+    concrete_name,
+    steel_name,
+    width_cm,
+    height_cm,
+    cover_nom_mm,
+    moment_ed_kNm,
+    moment_qp_kNm,
+    crack_limit_mm,
+    bar_diameters_mm=None,
+    stirrup_diameters_mm=None
+):
+    """
+    Wymiarowanie (SGN + SGU) dla wszystkich par średnic pręt / strzemię w jednej siatce
+    wektorowej. Zwraca DataFrame posortowany wg masy stali podłużnej [kg/m]
+    (rozwiązania niedopuszczalne na końcu).
+    """
+    if bar_diameters_mm is None:
+        bar_diameters_mm = list_bar_diameters()
+    if stirrup_diameters_mm is None:
+        stirrup_diameters_mm = STIRRUP_DIAMETERS_MM
+
+    phi_s = np.asarray(bar_diameters_mm, dtype=float)[:, None]
+    phi_w = np.asarray(stirrup_diameters_mm, dtype=float)[None, :]
+    res = calculate_bending_ec2_vec(
+        concrete_name, steel_name, width_cm, height_cm, cover_nom_mm,
+        phi_s, phi_w, moment_ed_kNm, moment_qp_kNm, crack_limit_mm
+    )
+
+    # Masa: pręty rozciągane + ewentualne pręty ściskane tej samej średnicy
+    area_one_bar_cm2 = math.pi * (phi_s / 20.0)**2
+    bar_count_s2 = np.ceil(res["area_s2_req"] / area_one_bar_cm2 - 1e-9).astype(int)
+    mass_per_m = np.array([get_bar_params(int(fi)).masa_liniowa for fi in bar_diameters_mm])[:, None]
+    steel_mass = (res["bar_count_final"] + bar_count_s2) * mass_per_m
+
+    warns = res["warnings"]
+    feasible = (res["wk_final"] <= crack_limit_mm) & ~warns["layers_exceeded"] & ~warns["max_reinforcement"]
+
+    shape = res["bar_count_final"].shape
+    df = pd.DataFrame({
+        "φs [mm]": np.broadcast_to(phi_s, shape).ravel().astype(int),
+        "φw [mm]": np.broadcast_to(phi_w, shape).ravel().astype(int),
+        "n [szt.]": res["bar_count_final"].ravel(),
+        "n_s2 [szt.]": bar_count_s2.ravel(),
+        "A_s,prov [cm²]": res["area_prov"].ravel(),
+        "w_k [mm]": res["wk_final"].ravel(),
+        "masa [kg/m]": steel_mass.ravel(),
+        "decyduje": np.where(res["sgu_governs"].ravel(), "SGU", "SGN"),
+        "dopuszczalne": feasible.ravel(),
+    })
+    return df.sort_values(["dopuszczalne", "masa [kg/m]", "φw [mm]"], ascending=[False, True, True]).reset_index(drop=True)
+
+
 def render_bending_page():
 
     # ------------------------------------------------------------------
@@ -436,9 +695,13 @@ def render_bending_page():
     if "results" not in st.session_state:
         st.session_state.results = None
 
+    if "bending_opt_results" not in st.session_state:
+        st.session_state.bending_opt_results = None
+
     def reset_state():
         st.session_state.bending_calc_done = False
         st.session_state.results = None
+        st.session_state.bending_opt_results = None
 
     # ------------------------------------------------------------------
     # DANE WEJŚCIOWE
@@ -478,6 +741,11 @@ def render_bending_page():
     with col_wk:
         crack_limit_mm = st.selectbox("Dopuszczalna szerokość rozwarcia rysy $w_{lim}$ [mm]", [0.1, 0.2, 0.3, 0.4], index=2, key="inp_bending_wk", on_change=reset_state)    
 
+    optimize_mode = st.toggle(
+        "Optymalizacja zbrojenia – przegląd wszystkich średnic prętów i strzemion (najmniejsza masa stali)",
+        value=False, key="inp_bending_opt", on_change=reset_state
+    )
+
     # ------------------------------------------------------------------
     # PRZYCISK OBLICZ
     # ------------------------------------------------------------------
@@ -499,6 +767,18 @@ def render_bending_page():
             crack_limit_mm
         )
         st.session_state.results = results_data
+        st.session_state.bending_opt_results = None
+        if optimize_mode:
+            st.session_state.bending_opt_results = optimize_bending_reinforcement(
+                concrete_name,
+                steel_name,
+                width_cm,
+                height_cm,
+                cover_nom_mm,
+                moment_ed_kNm,
+                moment_qp_kNm,
+                crack_limit_mm
+            )
         st.session_state.bending_calc_done = True
 
     # ------------------------------------------------------------------
@@ -595,6 +875,31 @@ def render_bending_page():
                     </div>
                     """, unsafe_allow_html=True)
 
+        # --- OPTYMALIZACJA ---
+        opt = st.session_state.bending_opt_results
+        if opt is not None:
+            st.markdown('<div class="result-section-header">OPTYMALIZACJA ZBROJENIA (NAJMNIEJSZA MASA STALI PODŁUŻNEJ)</div>', unsafe_allow_html=True)
+            opt_ok = opt[opt["dopuszczalne"]]
+            if opt_ok.empty:
+                st.warning("⚠️ Żadna kombinacja średnic nie spełnia jednocześnie SGN, SGU i warunku jednej warstwy prętów.")
+            else:
+                best = opt_ok.iloc[0]
+                current_mass = (res['bar_count_final'] + math.ceil(res['area_s2_req'] / (math.pi * (diameter_bar_mm / 20)**2) - 1e-9)) * get_bar_params(diameter_bar_mm).masa_liniowa
+                st.markdown(f"""
+                <div class="metric-box" style="border-left: 3px solid #22c55e;">
+                    <div class="res-label">NAJLŻEJSZE ZBROJENIE (φw = {best['φw [mm]']} mm)</div>
+                    <div class="res-val">
+                        {best['n [szt.]']} szt. ⌀{best['φs [mm]']} &rArr; {best['masa [kg/m]']:.2f} kg/m
+                        <span style="font-size: 0.75em; margin-left: 10px; color: #9ca3af; font-weight: 400;">(wybrane ⌀{diameter_bar_mm}: {current_mass:.2f} kg/m)</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown("")
+                st.dataframe(
+                    opt_ok.drop(columns=["dopuszczalne"]).head(15).round({"A_s,prov [cm²]": 2, "w_k [mm]": 3, "masa [kg/m]": 2}),
+                    use_container_width=True, hide_index=True
+                )
+
         # 4. OSTRZEŻENIA
         if warns['compression_low']:
             st.warning("⚠️ **SGN:** Zbrojenie ściskane jest słabo wykorzystane ($\sigma_{s2} < 0.1 f_{yd}$). Zwiększ wysokość przekroju lub otulinę.")
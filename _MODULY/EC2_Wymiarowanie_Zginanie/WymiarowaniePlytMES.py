@@ -0,0 +1,228 @@
+"""
+WymiarowaniePlytMES.py
+Wymiarowanie płyty na pole momentów z programu MES (bez interfejsu Streamlit).
+
+Wejście: momenty węzłowe mx, my, mxy [kNm/m] (kombinacja SGN) jako
+    - CSV z kolumnami mx, my, mxy oraz opcjonalnie: node, x, y, zone,
+      mx_qp, my_qp, mxy_qp (kombinacja quasi-stała),
+    - .npy (tablica strukturalna z polami o tych nazwach lub tablica 2D
+      z kolumnami wg --columns), czytane jako memmap - bez wczytywania
+      całej siatki do pamięci.
+
+Momenty obliczeniowe zbrojenia wyznaczane są metodą Wooda-Armera dla czterech
+warstw (x/y dołem, x/y górą), a następnie dla każdej warstwy dobierany jest
+rozstaw prętów wg calculate_slab_bending_ec2_vec (SGN + SGU). Gdy brak
+momentów quasi-stałych, przyjmuje się M_qp = qp_ratio * M_Ed.
+
+Wyjście:
+    - mapa zbrojenia .npy (tablica strukturalna, zapis przez memmap paczkami),
+    - zestawienie CSV: wymagane rozstawy i zbrojenie w strefach (kolumna zone).
+
+Przykład:
+    python WymiarowaniePlytMES.py momenty.npy -o zbrojenie.npy --h 25 --phi 12 --concrete C30/37
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import WymiarowaniePlytyZginanie as plyta  # noqa: E402
+
+KOLUMNY_MOMENTOW = ["mx", "my", "mxy"]
+KOLUMNY_QP = ["mx_qp", "my_qp", "mxy_qp"]
+KOLUMNY_NPY_DOMYSLNE = "x,y,mx,my,mxy"
+
+# Warstwy zbrojenia: kierunek, powierzchnia (dół / góra)
+WARSTWY = ["x_dol", "y_dol", "x_gora", "y_gora"]
+POLA_WARSTWY = [("M", "kNm/m"), ("s", "cm"), ("As", "cm2/m"), ("wk", "mm")]
+
+
+# ==============================================================================
+# WCZYTANIE POLA MOMENTÓW
+# ==============================================================================
+
+def read_moment_field(path, columns=KOLUMNY_NPY_DOMYSLNE):
+    """
+    Wczytuje pole momentów. Zwraca słownik nazwa -> tablica (dla .npy widoki memmap).
+    'columns' opisuje kolumny tablicy 2D .npy (ignorowane dla CSV i tablic strukturalnych).
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.dtype.names:
+            field = {name: data[name] for name in data.dtype.names}
+        else:
+            names = [c.strip() for c in columns.split(",")]
+            if data.ndim != 2 or data.shape[1] != len(names):
+                raise ValueError(f"Tablica {data.shape} nie pasuje do kolumn: {', '.join(names)}")
+            field = {name: data[:, i] for i, name in enumerate(names)}
+    else:
+        df = pd.read_csv(path, sep=None, engine="python")
+        field = {name: df[name].to_numpy() for name in df.columns}
+
+    brak = [k for k in KOLUMNY_MOMENTOW if k not in field]
+    if brak:
+        raise ValueError(f"Brak wymaganych kolumn pola momentów: {', '.join(brak)}")
+    return field
+
+
+# ==============================================================================
+# TRANSFORMACJA WOODA-ARMERA
+# ==============================================================================
+
+def wood_armer(mx, my, mxy):
+    """
+    Momenty wymiarujące Wooda-Armera [kNm/m] dla warstw x/y dołem i górą.
+    Zwraca słownik tablic nieujemnych (momenty górne co do wartości bezwzględnej).
+    """
+    mx = np.asarray(mx, dtype=float)
+    my = np.asarray(my, dtype=float)
+    mxy_abs = np.abs(np.asarray(mxy, dtype=float))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio_x = np.where(mx != 0, mxy_abs**2 / np.abs(mx), np.inf)
+        ratio_y = np.where(my != 0, mxy_abs**2 / np.abs(my), np.inf)
+
+    # Dół (momenty dodatnie)
+    mx_dol = mx + mxy_abs
+    my_dol = my + mxy_abs
+    fix_x = mx_dol < 0
+    fix_y = ~fix_x & (my_dol < 0)
+    mx_dol = np.where(fix_x, 0.0, np.where(fix_y, mx + ratio_y, mx_dol))
+    my_dol = np.where(fix_y, 0.0, np.where(fix_x, my + ratio_x, my_dol))
+
+    # Góra (momenty ujemne)
+    mx_gora = mx - mxy_abs
+    my_gora = my - mxy_abs
+    fix_x = mx_gora > 0
+    fix_y = ~fix_x & (my_gora > 0)
+    mx_gora = np.where(fix_x, 0.0, np.where(fix_y, mx - ratio_y, mx_gora))
+    my_gora = np.where(fix_y, 0.0, np.where(fix_x, my - ratio_x, my_gora))
+
+    return {
+        "x_dol": np.maximum(mx_dol, 0.0),
+        "y_dol": np.maximum(my_dol, 0.0),
+        "x_gora": np.maximum(-mx_gora, 0.0),
+        "y_gora": np.maximum(-my_gora, 0.0),
+    }
+
+
+# ==============================================================================
+# WYMIAROWANIE CAŁEJ SIATKI
+# ==============================================================================
+
+def reinforcement_map_dtype():
+    """Typ strukturalny mapy zbrojenia: dla każdej warstwy M, s, As, wk."""
+    return np.dtype([(f"{pole}_{warstwa}", "f8") for warstwa in WARSTWY for pole, _ in POLA_WARSTWY])
+
+
+def design_moment_field(field, output_path, concrete_name, steel_name, height_cm, cover_nom_mm,
+                        diameter_bar_mm, crack_limit_mm, outer_direction="x", qp_ratio=0.7,
+                        spacing_step_mm=1, chunk_nodes=50000):
+    """
+    Wood-Armer + dobór rozstawów dla wszystkich węzłów. Mapa zbrojenia zapisywana
+    do pliku .npy (memmap) paczkami po chunk_nodes węzłów. Zwraca memmap wyników.
+    """
+    n_nodes = len(field["mx"])
+    has_qp = all(k in field for k in KOLUMNY_QP)
+    result = np.lib.format.open_memmap(output_path, mode="w+", dtype=reinforcement_map_dtype(), shape=(n_nodes,))
+
+    # Warstwa zewnętrzna (1-sza) w kierunku outer_direction, wewnętrzna (2-ga) w drugim
+    layer_type = {
+        d: ("1-sza warstwa" if d == outer_direction else "2-ga warstwa") for d in ("x", "y")
+    }
+
+    for start in range(0, n_nodes, chunk_nodes):
+        sl = slice(start, min(start + chunk_nodes, n_nodes))
+        m_ed = wood_armer(field["mx"][sl], field["my"][sl], field["mxy"][sl])
+        if has_qp:
+            m_qp = wood_armer(field["mx_qp"][sl], field["my_qp"][sl], field["mxy_qp"][sl])
+        else:
+            m_qp = {k: qp_ratio * v for k, v in m_ed.items()}
+
+        for warstwa in WARSTWY:
+            res = plyta.calculate_slab_bending_ec2_vec(
+                concrete_name, steel_name, height_cm, cover_nom_mm, diameter_bar_mm,
+                layer_type[warstwa[0]], m_ed[warstwa], m_qp[warstwa], crack_limit_mm, spacing_step_mm
+            )
+            result[f"M_{warstwa}"][sl] = m_ed[warstwa]
+            result[f"s_{warstwa}"][sl] = res["spacing_final"]
+            result[f"As_{warstwa}"][sl] = res["area_prov"]
+            result[f"wk_{warstwa}"][sl] = res["wk_final"]
+        print(f"  {sl.stop}/{n_nodes} węzłów", file=sys.stderr)
+
+    result.flush()
+    return result
+
+
+def zone_summary(result, zones=None):
+    """Zestawienie stref: liczba węzłów, najmniejszy wymagany rozstaw i największe As dla każdej warstwy."""
+    df = pd.DataFrame({
+        "zone": np.asarray(zones) if zones is not None else np.full(len(result), "-", dtype=object),
+    })
+    agg = {"n_wezlow": ("zone", "size")}
+    for warstwa in WARSTWY:
+        df[f"s_{warstwa}"] = result[f"s_{warstwa}"]
+        df[f"As_{warstwa}"] = result[f"As_{warstwa}"]
+        df[f"M_{warstwa}"] = result[f"M_{warstwa}"]
+        agg[f"M_max_{warstwa} [kNm/m]"] = (f"M_{warstwa}", "max")
+        agg[f"s_min_{warstwa} [cm]"] = (f"s_{warstwa}", "min")
+        agg[f"As_max_{warstwa} [cm2/m]"] = (f"As_{warstwa}", "max")
+    return df.groupby("zone", sort=True).agg(**agg).reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wymiarowanie płyty na pole momentów MES (Wood-Armer + EC2).")
+    parser.add_argument("input", help="Pole momentów (CSV lub .npy).")
+    parser.add_argument("-o", "--output", default="zbrojenie_plyty.npy", help="Mapa zbrojenia (.npy).")
+    parser.add_argument("--summary", default=None, help="Zestawienie stref (CSV). Domyślnie obok mapy zbrojenia.")
+    parser.add_argument("--columns", default=KOLUMNY_NPY_DOMYSLNE, help="Kolumny tablicy 2D .npy.")
+    parser.add_argument("--concrete", default="C30/37", help="Klasa betonu.")
+    parser.add_argument("--steel", default="B500", help="Klasa stali.")
+    parser.add_argument("--h", type=float, default=20.0, help="Grubość płyty [cm].")
+    parser.add_argument("--cnom", type=float, default=25.0, help="Otulina [mm].")
+    parser.add_argument("--phi", type=int, default=12, help="Średnica prętów [mm].")
+    parser.add_argument("--wk", type=float, default=0.3, help="Dopuszczalna szerokość rysy [mm].")
+    parser.add_argument("--outer", choices=["x", "y"], default="x", help="Kierunek prętów warstwy zewnętrznej.")
+    parser.add_argument("--qp-ratio", type=float, default=0.7, help="M_qp / M_Ed, gdy brak kolumn *_qp.")
+    parser.add_argument("--step", type=int, choices=[1, 5, 10], default=1, help="Krok rozstawu [mm].")
+    parser.add_argument("--chunk", type=int, default=50000, help="Liczba węzłów w paczce.")
+    args = parser.parse_args(argv)
+
+    t_start = time.perf_counter()
+    field = read_moment_field(args.input, args.columns)
+    result = design_moment_field(
+        field, args.output, args.concrete, args.steel, args.h, args.cnom, args.phi, args.wk,
+        outer_direction=args.outer, qp_ratio=args.qp_ratio, spacing_step_mm=args.step, chunk_nodes=args.chunk
+    )
+    summary = zone_summary(result, field.get("zone"))
+    summary_path = args.summary or str(Path(args.output).with_suffix("")) + "_strefy.csv"
+    summary.to_csv(summary_path, index=False)
+    elapsed = time.perf_counter() - t_start
+
+    print(f"Zwymiarowano {len(result)} węzłów w {elapsed:.2f} s. Mapa: {args.output}, strefy: {summary_path}")
+    print(summary.round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,11 @@
 # WERSJA: PŁYTA (b = 100 cm, wynik w rozstawie prętów)
 # ==============================================================================
 import streamlit as st
+import matplotlib.pyplot as plt
 import math
 
+import numpy as np
+
 # --- TABLICE ---
 try:
     from TABLICE.ParametryBetonu import CONCRETE_TABLE, list_concrete_classes
@@ -14,38 +17,79 @@ except Exception:
     st.stop()
 
 
-def calculate_slab_bending_ec2(
-    concrete_name, 
-    steel_name, 
-    height_cm, 
-    cover_nom_mm, 
-    diameter_bar_mm, 
-    layer_type, 
-    moment_ed_kNm, 
-    moment_qp_kNm, 
-    crack_limit_mm
-):
+# ==============================================================================
+# SZEROKOŚĆ RYS W FUNKCJI ROZSTAWU - JĄDRO WEKTOROWE
+# ==============================================================================
+
+SPACING_MIN_MM = 30
+SPACING_MAX_MM = 400
+
+
+def slab_crack_width_ec2(spacing_mm, moment_qp_mnm, height_m, effective_depth_d, a1_m,
+                         alpha_e, es_modulus_mpa, fct_eff, cover_nom_mm, diameter_bar_mm):
     """
-    Funkcja obliczeniowa dla PŁYTY (EC2).
-    Szerokość b przyjęta na sztywno 100 cm.
-    Wynik podawany jako rozstaw prętów co 1 cm.
+    Szerokość rysy w_k [mm] pasma płyty 1 m dla tablicy rozstawów prętów s [mm].
+    Zwraca słownik tablic: area_cm2, x_ii, sigma_s, sr_max, eps_diff, wk.
     """
-    
-    # ---------------------------------------------------------
-    # 0. STAŁE I ZABEZPIECZENIA
-    # ---------------------------------------------------------
-    width_cm = 100.0  # Płyta obliczana na pasmo 1 m
     width_m = 1.0
-    
-    moment_qp_kNm = min(moment_qp_kNm, moment_ed_kNm)
-    
-    warnings = {
-        "compression_low": False,
-        "max_reinforcement": False,
-        "spacing_too_small": False,
-        "spacing_info": ""
+    spacing_mm = np.asarray(spacing_mm, dtype=float)
+    area_steel_m2 = (1000.0 / spacing_mm) * math.pi * (diameter_bar_mm / 2000.0)**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Faza II
+        coeff_aa = 0.5 * width_m
+        coeff_bb = alpha_e * area_steel_m2
+        coeff_cc = -alpha_e * area_steel_m2 * effective_depth_d
+        x_ii = (-coeff_bb + np.sqrt(coeff_bb**2 - 4 * coeff_aa * coeff_cc)) / (2 * coeff_aa)
+
+        inertia_ii = (width_m * x_ii**3) / 3 + alpha_e * area_steel_m2 * (effective_depth_d - x_ii)**2
+        sigma_s = alpha_e * moment_qp_mnm * (effective_depth_d - x_ii) / inertia_ii
+
+        hc_eff = np.minimum(np.minimum(2.5 * a1_m, (height_m - x_ii) / 3.0), height_m / 2.0)
+        ac_eff = width_m * hc_eff
+        rho_p_eff = np.where(ac_eff > 0, area_steel_m2 / ac_eff, 0.0)
+
+        val_term = 0.4 * (fct_eff / rho_p_eff) * (1 + alpha_e * rho_p_eff)
+        eps_diff = np.maximum(0.6 * sigma_s / es_modulus_mpa, (sigma_s - val_term) / es_modulus_mpa)
+
+        # s_r,max dla płyty zależny od rozstawu s
+        s_clear_m = (spacing_mm - diameter_bar_mm) / 1000.0
+        c_m = cover_nom_mm / 1000.0
+        phi_m = diameter_bar_mm / 1000.0
+        limit_spacing_m = 5.0 * (c_m + phi_m/2.0)
+
+        k1, k2, k3, k4 = 0.8, 0.5, 3.4, 0.425
+        sr_max = np.where(
+            s_clear_m > limit_spacing_m,
+            1.3 * (height_m - x_ii),
+            k3 * c_m + k4 * k1 * k2 * phi_m / rho_p_eff
+        )
+
+        wk = sr_max * eps_diff * 1000.0
+
+    wk = np.where(inertia_ii == 0, 0.0, wk)
+
+    return {
+        "area_cm2": area_steel_m2 * 10000.0,
+        "x_ii": x_ii,
+        "sigma_s": sigma_s,
+        "sr_max": sr_max,
+        "eps_diff": eps_diff,
+        "wk": wk,
     }
 
+
+def slab_section_parameters(
+    concrete_name,
+    steel_name,
+    height_cm,
+    cover_nom_mm,
+    diameter_bar_mm,
+    layer_type
+):
+    """
+    Parametry materiałowe i geometryczne pasma płyty 1 m (wspólne dla obliczeń skalarnych i wektorowych).
+    """
     # ---------------------------------------------------------
     # 1. DANE MATERIAŁOWE
     # ---------------------------------------------------------
@@ -115,11 +159,82 @@ def calculate_slab_bending_ec2(
     
     effective_depth_d = height_m - a1_m
 
+    area_one_bar_cm2 = math.pi * (diameter_bar_mm/20)**2
+
+    return {
+        "GAMMA_C": GAMMA_C,
+        "GAMMA_S": GAMMA_S,
+        "ALPHA_CC": ALPHA_CC,
+        "fck": fck,
+        "fctm": fctm,
+        "fct_eff": fct_eff,
+        "fcd": fcd,
+        "ecm_modulus_mpa": ecm_modulus_mpa,
+        "lambda_bet": lambda_bet,
+        "eta_bet": eta_bet,
+        "eps_cu3": eps_cu3,
+        "fyk": fyk,
+        "fyd": fyd,
+        "es_modulus_mpa": es_modulus_mpa,
+        "eps_yd": eps_yd,
+        "alpha_e": alpha_e,
+        "height_m": height_m,
+        "a1_m": a1_m,
+        "a2_m": a2_m,
+        "effective_depth_d": effective_depth_d,
+        "area_one_bar_cm2": area_one_bar_cm2,
+    }
+
+
+def calculate_slab_bending_ec2(
+    concrete_name, 
+    steel_name, 
+    height_cm, 
+    cover_nom_mm, 
+    diameter_bar_mm, 
+    layer_type, 
+    moment_ed_kNm, 
+    moment_qp_kNm, 
+    crack_limit_mm,
+    spacing_step_mm=1
+):
+    """
+    Funkcja obliczeniowa dla PŁYTY (EC2).
+    Szerokość b przyjęta na sztywno 100 cm.
+    Wynik podawany jako rozstaw prętów [cm] z krokiem spacing_step_mm (domyślnie 1 mm).
+    """
+    
+    # ---------------------------------------------------------
+    # 0. STAŁE I ZABEZPIECZENIA
+    # ---------------------------------------------------------
+    width_cm = 100.0  # Płyta obliczana na pasmo 1 m
+    width_m = 1.0
+    
+    moment_qp_kNm = min(moment_qp_kNm, moment_ed_kNm)
+    
+    warnings = {
+        "compression_low": False,
+        "max_reinforcement": False,
+        "spacing_too_small": False,
+        "spacing_info": ""
+    }
+
+    # ---------------------------------------------------------
+    # 1. DANE MATERIAŁOWE + 2. GEOMETRIA
+    # ---------------------------------------------------------
+    prm = slab_section_parameters(
+        concrete_name, steel_name, height_cm, cover_nom_mm, diameter_bar_mm, layer_type
+    )
+    GAMMA_C, GAMMA_S, ALPHA_CC, fck = prm["GAMMA_C"], prm["GAMMA_S"], prm["ALPHA_CC"], prm["fck"]
+    fctm, fct_eff, fcd, ecm_modulus_mpa = prm["fctm"], prm["fct_eff"], prm["fcd"], prm["ecm_modulus_mpa"]
+    lambda_bet, eta_bet, eps_cu3, fyk = prm["lambda_bet"], prm["eta_bet"], prm["eps_cu3"], prm["fyk"]
+    fyd, es_modulus_mpa, eps_yd, alpha_e = prm["fyd"], prm["es_modulus_mpa"], prm["eps_yd"], prm["alpha_e"]
+    height_m, a1_m, a2_m, effective_depth_d = prm["height_m"], prm["a1_m"], prm["a2_m"], prm["effective_depth_d"]
+    area_one_bar_cm2 = prm["area_one_bar_cm2"]
+
     moment_ed_mnm = moment_ed_kNm / 1000.0
     moment_qp_mnm = moment_qp_kNm / 1000.0
 
-    area_one_bar_cm2 = math.pi * (diameter_bar_mm/20)**2
-
     # ---------------------------------------------------------
     # KROK 1: OBLICZENIE As_SGN (Nośność)
     # ---------------------------------------------------------
@@ -185,12 +300,12 @@ def calculate_slab_bending_ec2(
     # Ostateczne zbrojenie ze statyki (bez min)
     area_s1_sgn_final_cm2 = area_s1_sgn_cm2
     
-    # Obliczamy rozstaw SGN z ograniczeniem do praktycznego minimum 3 cm
+    # Obliczamy rozstaw SGN (krok spacing_step_mm) z ograniczeniem do praktycznego minimum 3 cm
     if area_s1_sgn_final_cm2 > 0:
-        s_sgn_cm = math.floor((100.0 * area_one_bar_cm2) / area_s1_sgn_final_cm2)
+        s_sgn_mm = math.floor((1000.0 * area_one_bar_cm2) / area_s1_sgn_final_cm2 / spacing_step_mm) * spacing_step_mm
     else:
-        s_sgn_cm = 40
-    s_sgn_cm = max(3, min(s_sgn_cm, 40))
+        s_sgn_mm = SPACING_MAX_MM
+    s_sgn_mm = max(SPACING_MIN_MM, min(s_sgn_mm, SPACING_MAX_MM))
 
     # ---------------------------------------------------------
     # KROK 2: DOBÓR ROZSTAWU (SGN + SGU)
@@ -201,89 +316,41 @@ def calculate_slab_bending_ec2(
     moment_cracking = fct_eff * modulus_section_wc
     moment_cracking_kNm = moment_cracking * 1000.0
 
-    # Funkcja pomocnicza: parametry rysy
-    def calculate_crack_width(area_steel_m2, spacing_cm):
-        if area_steel_m2 <= 1e-9: return 999.0, 0, 0, 0, 0
-
-        # Faza II
-        coeff_aa = 0.5 * width_m
-        coeff_bb = alpha_e * area_steel_m2
-        coeff_cc = -alpha_e * area_steel_m2 * effective_depth_d
-        
-        delta = coeff_bb**2 - 4 * coeff_aa * coeff_cc
-        x_ii = (-coeff_bb + math.sqrt(delta)) / (2 * coeff_aa)
-
-        inertia_ii = (width_m * x_ii**3) / 3 + alpha_e * area_steel_m2 * (effective_depth_d - x_ii)**2
-        if inertia_ii == 0: return 0.0, 0, 0, 0, 0
-
-        sigma_s = alpha_e * moment_qp_mnm * (effective_depth_d - x_ii) / inertia_ii
-
-        hc_eff = min(2.5 * a1_m, (height_m - x_ii) / 3.0, height_m / 2.0)
-        ac_eff = width_m * hc_eff
-        rho_p_eff = area_steel_m2 / ac_eff if ac_eff > 0 else 0.0
-
-        val_term = 0.4 * (fct_eff / rho_p_eff) * (1 + alpha_e * rho_p_eff)
-        eps_diff = max(
-            0.6 * sigma_s / es_modulus_mpa,
-            (sigma_s - val_term) / es_modulus_mpa
-        )
+    # Krzywa w_k(s) na całej siatce rozstawów (malejąco) - jedno przeliczenie tablicowe
+    is_cracked = (moment_qp_mnm > moment_cracking)
+    spacing_grid_mm = np.arange(SPACING_MAX_MM, SPACING_MIN_MM - 1e-9, -spacing_step_mm)
+    sgu_curve = slab_crack_width_ec2(
+        spacing_grid_mm, moment_qp_mnm, height_m, effective_depth_d, a1_m,
+        alpha_e, es_modulus_mpa, fct_eff, cover_nom_mm, diameter_bar_mm
+    )
+    wk_curve = sgu_curve["wk"] if is_cracked else np.zeros_like(spacing_grid_mm)
 
-        # s_r,max dla płyty zależny od rozstawu s
-        s_curr = spacing_cm
-        s_clear_m = (s_curr * 10.0 - diameter_bar_mm) / 1000.0
-        c_m = cover_nom_mm / 1000.0
-        phi_m = diameter_bar_mm / 1000.0
-        limit_spacing_m = 5.0 * (c_m + phi_m/2.0)
-        
-        if s_clear_m > limit_spacing_m:
-             sr_max_val = 1.3 * (height_m - x_ii)
+    # 1. Sprawdzenie SGU dla rozstawu SGN
+    idx_sgn = int(np.argmin(np.abs(spacing_grid_mm - s_sgn_mm)))
+    wk_sgn_only = float(wk_curve[idx_sgn])
+
+    # 2. Pierwszy (największy) rozstaw nie większy od SGN spełniający warunek rysy
+    idx_final = idx_sgn
+    if is_cracked and wk_sgn_only > crack_limit_mm:
+        compliant = np.flatnonzero(wk_curve[idx_sgn:] <= crack_limit_mm)
+        if compliant.size:
+            idx_final = idx_sgn + int(compliant[0])
         else:
-             k1, k2, k3, k4 = 0.8, 0.5, 3.4, 0.425
-             sr_max_val = k3 * c_m + k4 * k1 * k2 * phi_m / rho_p_eff
-        
-        wk = sr_max_val * eps_diff * 1000.0
-        
-        return wk, x_ii, sigma_s, sr_max_val, eps_diff
+            idx_final = len(spacing_grid_mm) - 1
 
-    # 1. Sprawdzenie SGU dla rozstawu SGN
-    area_sgn_prov_cm2 = (100.0 / s_sgn_cm) * area_one_bar_cm2
-    is_cracked = (moment_qp_mnm > moment_cracking)
-    wk_sgn_only = 0.0
-    
-    if is_cracked:
-        wk_sgn_only, _, _, _, _ = calculate_crack_width(area_sgn_prov_cm2 / 10000.0, s_sgn_cm)
+    final_s_mm = float(spacing_grid_mm[idx_final])
+    final_wk = float(wk_curve[idx_final])
 
-    # 2. Iteracja (jeśli SGN nie wystarcza)
-    final_s_cm = s_sgn_cm
-    final_wk = wk_sgn_only
-    found_spacing = False
-    
-    # Przechowywanie danych SGU dla ostatecznego wyboru
+    # Dane SGU dla ostatecznego wyboru
     sgu_results = {
         "x_ii": 0.0, "sigma_s": 0.0, "sr_max": 0.0, "eps_diff": 0.0, "wk": 0.0
     }
-    
-    if wk_sgn_only > crack_limit_mm and is_cracked:
-        for s_curr in range(s_sgn_cm, 2, -1):
-             area_curr_cm2 = (100.0 / s_curr) * area_one_bar_cm2
-             wk_curr, x_ii, sig_s, sr, eps = calculate_crack_width(area_curr_cm2 / 10000.0, s_curr)
-             
-             if wk_curr <= crack_limit_mm:
-                 final_s_cm = s_curr
-                 final_wk = wk_curr
-                 sgu_results = {"x_ii": x_ii, "sigma_s": sig_s, "sr_max": sr, "eps_diff": eps, "wk": wk_curr}
-                 found_spacing = True
-                 break
-        if not found_spacing:
-            final_s_cm = 3
-            final_wk = wk_curr 
-    else:
-        final_s_cm = s_sgn_cm
-        final_wk = wk_sgn_only
-        if is_cracked:
-             _, x_ii, sig_s, sr, eps = calculate_crack_width(area_sgn_prov_cm2 / 10000.0, s_sgn_cm)
-             sgu_results = {"x_ii": x_ii, "sigma_s": sig_s, "sr_max": sr, "eps_diff": eps, "wk": wk_sgn_only}
-            
+    if is_cracked:
+        sgu_results = {key: float(sgu_curve[key][idx_final]) for key in sgu_results}
+
+    final_s_cm = final_s_mm / 10.0
+    s_sgn_cm = s_sgn_mm / 10.0
+
     # Obliczenie ostatecznych parametrów dla wybranego 's'
     area_prov_final_cm2 = (100.0 / final_s_cm) * area_one_bar_cm2
     
@@ -340,12 +407,151 @@ def calculate_slab_bending_ec2(
                 "x_ii": sgu_results["x_ii"],
                 "sigma_s": sgu_results["sigma_s"],
                 "sr_max": sgu_results["sr_max"],
-                "eps_diff": sgu_results["eps_diff"]
+                "eps_diff": sgu_results["eps_diff"],
+                "curve": {"spacing_cm": spacing_grid_mm / 10.0, "wk": wk_curve}
             }
         }
     }
 
 
+# ==============================================================================
+# PŁYTA - WERSJA WEKTOROWA (POLA MOMENTÓW, np. WĘZŁY MES)
+# ==============================================================================
+
+def calculate_slab_bending_ec2_vec(
+    concrete_name,
+    steel_name,
+    height_cm,
+    cover_nom_mm,
+    diameter_bar_mm,
+    layer_type,
+    moment_ed_kNm,
+    moment_qp_kNm,
+    crack_limit_mm,
+    spacing_step_mm=1,
+    chunk_size=4000
+):
+    """
+    Wektorowy odpowiednik calculate_slab_bending_ec2 dla tablic M_Ed i M_qp [kNm/m].
+    Momenty brane są co do wartości bezwzględnej. Rozstawy zwracane w [cm].
+    """
+    moment_ed_kNm, moment_qp_kNm = np.broadcast_arrays(
+        np.abs(np.asarray(moment_ed_kNm, dtype=float)),
+        np.abs(np.asarray(moment_qp_kNm, dtype=float))
+    )
+    moment_qp_kNm = np.minimum(moment_qp_kNm, moment_ed_kNm)
+    width_m = 1.0
+
+    prm = slab_section_parameters(
+        concrete_name, steel_name, height_cm, cover_nom_mm, diameter_bar_mm, layer_type
+    )
+    fcd, fyd, fct_eff = prm["fcd"], prm["fyd"], prm["fct_eff"]
+    eta_bet, lambda_bet, eps_cu3, eps_yd = prm["eta_bet"], prm["lambda_bet"], prm["eps_cu3"], prm["eps_yd"]
+    es_modulus_mpa, alpha_e = prm["es_modulus_mpa"], prm["alpha_e"]
+    height_m, a1_m, a2_m, effective_depth_d = prm["height_m"], prm["a1_m"], prm["a2_m"], prm["effective_depth_d"]
+    area_one_bar_cm2 = prm["area_one_bar_cm2"]
+
+    moment_ed_mnm = moment_ed_kNm / 1000.0
+    moment_qp_mnm = moment_qp_kNm / 1000.0
+
+    # ---------------------------------------------------------
+    # KROK 1: As_SGN - gałęzie pojedynczo / podwójnie zbrojone jako maski
+    # ---------------------------------------------------------
+    xi_lim = eps_cu3 / (eps_cu3 + eps_yd)
+    omega_lim = lambda_bet * xi_lim
+    mu_lim = omega_lim * (1 - 0.5 * omega_lim)
+
+    denominator = eta_bet * fcd * width_m * effective_depth_d**2
+    mu_ed = moment_ed_mnm / denominator
+    is_doubly_reinforced = mu_ed > mu_lim
+
+    omega_req = np.minimum(1 - np.sqrt(np.maximum(0, 1 - 2 * mu_ed)), omega_lim)
+    z_arm = (1 - 0.5 * omega_req) * effective_depth_d
+    area_s1_single_m2 = moment_ed_mnm / (z_arm * fyd)
+
+    moment_rd_lim = mu_lim * denominator
+    x_lim = xi_lim * effective_depth_d
+    sigma_s2 = min(eps_cu3 * (x_lim - a2_m) / x_lim * es_modulus_mpa, fyd) if x_lim > a2_m else 0.0
+    effective_sigma_s2 = max(sigma_s2, 0.1 * fyd)
+    z_lim = effective_depth_d * (1 - 0.5 * omega_lim)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        area_s2_req_m2 = np.where(
+            is_doubly_reinforced,
+            (moment_ed_mnm - moment_rd_lim) / (effective_sigma_s2 * (effective_depth_d - a2_m)),
+            0.0
+        )
+    area_s1_double_m2 = moment_rd_lim / (z_lim * fyd) + area_s2_req_m2 * (effective_sigma_s2 / fyd)
+
+    area_sgn_cm2 = np.where(is_doubly_reinforced, area_s1_double_m2, area_s1_single_m2) * 10000
+    area_s2_req_cm2 = area_s2_req_m2 * 10000
+
+    # Rozstaw SGN [mm] w kroku spacing_step_mm, w granicach siatki
+    with np.errstate(divide="ignore"):
+        s_sgn_mm = np.floor((1000.0 * area_one_bar_cm2) / area_sgn_cm2 / spacing_step_mm) * spacing_step_mm
+    s_sgn_mm = np.clip(np.where(area_sgn_cm2 > 0, s_sgn_mm, SPACING_MAX_MM), SPACING_MIN_MM, SPACING_MAX_MM)
+
+    # ---------------------------------------------------------
+    # KROK 2: DOBÓR ROZSTAWU - siatka (węzeł x rozstaw), liczona paczkami
+    # ---------------------------------------------------------
+    moment_cracking = fct_eff * (width_m * height_m**2) / 6.0
+    is_cracked = moment_qp_mnm > moment_cracking
+
+    spacing_grid_mm = np.arange(SPACING_MAX_MM, SPACING_MIN_MM - 1e-9, -spacing_step_mm)
+    idx_sgn = np.rint((SPACING_MAX_MM - s_sgn_mm) / spacing_step_mm).astype(int)
+
+    flat_idx_sgn = idx_sgn.ravel()
+    flat_qp = moment_qp_mnm.ravel()
+    flat_cracked = is_cracked.ravel()
+    idx_final = flat_idx_sgn.copy()
+    wk_sgn_only = np.zeros(flat_idx_sgn.shape)
+    wk_final = np.zeros(flat_idx_sgn.shape)
+
+    for start in range(0, flat_idx_sgn.size, chunk_size):
+        sl = slice(start, start + chunk_size)
+        rows = np.arange(flat_idx_sgn[sl].size)
+        wk = slab_crack_width_ec2(
+            spacing_grid_mm[None, :], flat_qp[sl][:, None], height_m, effective_depth_d, a1_m,
+            alpha_e, es_modulus_mpa, fct_eff, cover_nom_mm, diameter_bar_mm
+        )["wk"]
+        wk = np.where(flat_cracked[sl][:, None], wk, 0.0)
+
+        # Pierwszy rozstaw nie większy od SGN spełniający warunek; brak - rozstaw minimalny
+        candidate = np.arange(spacing_grid_mm.size)[None, :] >= flat_idx_sgn[sl][:, None]
+        compliant = candidate & (wk <= crack_limit_mm)
+        idx = np.where(compliant.any(axis=1), np.argmax(compliant, axis=1), spacing_grid_mm.size - 1)
+
+        idx_final[sl] = idx
+        wk_sgn_only[sl] = wk[rows, flat_idx_sgn[sl]]
+        wk_final[sl] = wk[rows, idx]
+
+    shape = moment_ed_mnm.shape
+    spacing_final_cm = spacing_grid_mm[idx_final].reshape(shape) / 10.0
+    spacing_sgn_cm = s_sgn_mm / 10.0
+    area_prov_cm2 = (100.0 / spacing_final_cm) * area_one_bar_cm2
+
+    s_clear_mm = spacing_final_cm * 10.0 - diameter_bar_mm
+
+    return {
+        "area_sgn": area_sgn_cm2,
+        "area_s2_req": area_s2_req_cm2,
+        "is_doubly_reinforced": is_doubly_reinforced,
+        "spacing_sgn": spacing_sgn_cm,
+        "spacing_final": spacing_final_cm,
+        "area_prov": area_prov_cm2,
+        "wk_sgn_only": wk_sgn_only.reshape(shape),
+        "wk_final": wk_final.reshape(shape),
+        "is_cracked": is_cracked,
+        "sgu_governs": spacing_final_cm < spacing_sgn_cm,
+        "M_cr_kNm": moment_cracking * 1000.0,
+        "warnings": {
+            "compression_low": is_doubly_reinforced & (sigma_s2 < 0.1 * fyd),
+            "max_reinforcement": area_prov_cm2 > (0.04 * 100.0 * height_cm),
+            "spacing_too_small": s_clear_mm < max(20.0, diameter_bar_mm),
+        },
+    }
+
+
 def render_slab_page():
 
     # ------------------------------------------------------------------
@@ -406,13 +612,15 @@ def render_slab_page():
     # ------------------------------------------------------------------
     st.markdown("### DANE WEJŚCIOWE")
 
-    col_concrete, col_steel, col_dim_h = st.columns([1,1,1])      
+    col_concrete, col_steel, col_dim_h, col_step = st.columns([1,1,1,0.6])      
     with col_concrete:
         concrete_name = st.selectbox("Klasa betonu", list_concrete_classes(), index=4, key="inp_slab_concrete", on_change=reset_state)
     with col_steel:
         steel_name = st.selectbox("Klasa stali zbrojeniowej", list(STEEL_TABLE.keys()), index=1, key="inp_slab_steel", on_change=reset_state)
     with col_dim_h:
         height_cm = st.number_input("Grubość płyty $h$ [cm]", value=20.0, step=1.0, key="inp_slab_h", on_change=reset_state) 
+    with col_step:
+        spacing_step_mm = st.selectbox("Krok rozstawu [mm]", [1, 5, 10], index=0, key="inp_slab_step", on_change=reset_state)
       
     col_phi_s, col_layer, col_cover = st.columns(3)
     with col_phi_s:
@@ -454,7 +662,8 @@ def render_slab_page():
             layer_type,
             moment_ed_kNm, 
             moment_qp_kNm, 
-            crack_limit_mm
+            crack_limit_mm,
+            spacing_step_mm
         )
         st.session_state.slab_results = results_data
         st.session_state.slab_calc_done = True
@@ -481,7 +690,7 @@ def render_slab_page():
             <div class="result-card-main" style="border-left: 6px solid {main_border};">
                 <div class="res-label">DOBRANE ZBROJENIE (WYNIK KOŃCOWY)</div>
                 <div style="font-size: 2.5rem; font-weight: 800; color: #ffffff; margin: 5px 0;">
-                    ⌀{diameter_bar_mm} co {s_res} cm
+                    ⌀{diameter_bar_mm} co {s_res:g} cm
                 </div>
                 <div style="color: #9ca3af; margin-bottom: 15px;">
                     A<sub>s,prov</sub> = {res['area_prov']:.2f} <span class="res-unit">cm²/m</span>
@@ -514,7 +723,7 @@ def render_slab_page():
             st.markdown(f"""
             <div class="metric-box">
                 <div class="res-label">ROZSTAW SPEŁNIAJĄCY WARUNEK SGN</div>
-                <div class="res-val">⌀{diameter_bar_mm} co {s_sgn} cm</div>
+                <div class="res-val">⌀{diameter_bar_mm} co {s_sgn:g} cm</div>
             </div>
             """, unsafe_allow_html=True)
 
@@ -539,7 +748,7 @@ def render_slab_page():
                 
                 st.markdown(f"""
                 <div class="metric-box" style="border-left: 3px solid {color_sgn_wk};">
-                    <div class="res-label">SZEROKOŚĆ ROZWARCIA RYSY PRZY ZBROJENIU SGN (⌀{diameter_bar_mm}/{res['spacing_sgn']} cm)</div>
+                    <div class="res-label">SZEROKOŚĆ ROZWARCIA RYSY PRZY ZBROJENIU SGN (⌀{diameter_bar_mm}/{res['spacing_sgn']:g} cm)</div>
                     <div class="res-val">
                         w<sub>k</sub> = {wk_sgn:.3f} mm
                         <span style="font-size: 0.75em; margin-left: 10px; color: {color_sgn_wk}; font-weight: 600;">{status_sgn}</span>
@@ -556,11 +765,24 @@ def render_slab_page():
                     <div class="metric-box" style="border-left: 3px solid #22c55e;">
                         <div class="res-label">ROZSTAW SPEŁNIAJĄCY WARUNEK SGU (ZARYSOWANIE)</div>
                         <div class="res-val" style="font-size: 1.1rem;">
-                             ⌀{diameter_bar_mm} co {res['spacing_final']} cm &rArr; w<sub>k</sub> = {wk_final:.3f} mm
+                             ⌀{diameter_bar_mm} co {res['spacing_final']:g} cm &rArr; w<sub>k</sub> = {wk_final:.3f} mm
                         </div>
                     </div>
                     """, unsafe_allow_html=True)
 
+            # Krzywa w_k(s) z obliczeń (bez ponownego liczenia)
+            curve = dbg['sgu']['curve']
+            fig, ax = plt.subplots(figsize=(8, 3))
+            ax.plot(curve['spacing_cm'], curve['wk'], color='#3b82f6', linewidth=2, label="$w_k(s)$")
+            ax.axhline(crack_limit_mm, color='#ef4444', linestyle='--', linewidth=1.2, label="$w_{lim}$")
+            ax.axvline(res['spacing_sgn'], color='#9ca3af', linestyle=':', linewidth=1.2, label="$s_{SGN}$")
+            ax.plot(res['spacing_final'], res['wk_final'], 'o', color='#22c55e', label="$s$ przyjęty")
+            ax.set_xlabel("Rozstaw prętów s [cm]")
+            ax.set_ylabel("$w_k$ [mm]")
+            ax.set_ylim(0, max(2.0 * crack_limit_mm, 1.2 * wk_sgn))
+            ax.grid(True, alpha=0.3)
+            ax.legend(loc="upper left", fontsize=8)
+            st.pyplot(fig)
 
         # 4. OSTRZEŻENIA
         if warns['compression_low']:
@@ -703,7 +925,7 @@ def render_slab_page():
             else:
                 st.markdown(f"Decyduje warunek **{governing}** (zagęszczono rozstaw).")
             
-            st.latex(f"A_{{s,prov}} = \\phi {diameter_bar_mm} \\text{{ co }} {res['spacing_final']} \\text{{ cm}} = {res['area_prov']:.2f} \\text{{ cm}}^2/m")
+            st.latex(f"A_{{s,prov}} = \\phi {diameter_bar_mm} \\text{{ co }} {res['spacing_final']:g} \\text{{ cm}} = {res['area_prov']:.2f} \\text{{ cm}}^2/m")
 
 
 def run():
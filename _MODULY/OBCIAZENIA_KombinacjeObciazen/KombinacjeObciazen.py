@@ -8,9 +8,12 @@ Wspólny kalkulator: SGN + SGU na zakładkach
 """
 
 import streamlit as st
+import itertools
+import numpy as np
+import pandas as pd
 from pathlib import Path
 import sys
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Iterator
 
 # --- KONFIGURACJA ŚCIEŻEK (jak w oryginalnych plikach) ---
 SCIEZKA_PLIKU = Path(__file__).resolve()
@@ -376,7 +379,283 @@ def StronaKombinacjeSGU():
 
 
 # =============================================================================
-# CZĘŚĆ 3 – WSPÓLNA FUNKCJA DLA APLIKACJI
+# CZĘŚĆ 3 – GENERATOR KOMBINACJI (BEZ INTERFEJSU)
+# =============================================================================
+
+WYRAZENIA_SGN = ("6.10", "6.10a", "6.10b")
+WYRAZENIA_SGU = ("charakterystyczna", "częsta", "quasi-stała")
+
+# Współczynniki wyrażeń: G_sup, G_inf, P, Q oraz ψ dla wiodącego i towarzyszących
+# ("k" - wartość charakterystyczna, 0/1/2 - ψ0/ψ1/ψ2, None - brak wiodącego)
+PARAMETRY_WYRAZEN: Dict[str, Dict[str, Any]] = {
+    "6.10": {"G_sup": GAMMA_G_SUP, "G_inf": GAMMA_G_INF, "P": GAMMA_P, "Q": GAMMA_Q_SUP_VAL, "lead": "k", "acc": 0},
+    "6.10a": {"G_sup": GAMMA_G_SUP, "G_inf": GAMMA_G_INF, "P": GAMMA_P, "Q": GAMMA_Q_SUP_VAL, "lead": None, "acc": 0},
+    "6.10b": {"G_sup": XI_RECOM * GAMMA_G_SUP, "G_inf": GAMMA_G_INF, "P": GAMMA_P, "Q": GAMMA_Q_SUP_VAL,
+              "lead": "k", "acc": 0},
+    "charakterystyczna": {"G_sup": GAMMA_G_SGU, "G_inf": GAMMA_G_SGU, "P": GAMMA_P_SGU, "Q": GAMMA_Q_SGU,
+                          "lead": "k", "acc": 0},
+    "częsta": {"G_sup": GAMMA_G_SGU, "G_inf": GAMMA_G_SGU, "P": GAMMA_P_SGU, "Q": GAMMA_Q_SGU, "lead": 1, "acc": 2},
+    "quasi-stała": {"G_sup": GAMMA_G_SGU, "G_inf": GAMMA_G_SGU, "P": GAMMA_P_SGU, "Q": GAMMA_Q_SGU,
+                    "lead": None, "acc": 2},
+}
+
+CHARAKTER_ODDZIALYWANIA = ["niekorzystne", "korzystne", "zmienne"]
+
+
+def action_psi(action: Dict[str, Any]) -> Tuple[float, float, float]:
+    """ψ0 (tablica SGN) oraz ψ1, ψ2 (tablica SGU) dla kategorii oddziaływania zmiennego."""
+    category = action["category"]
+    return PSI_TABLE_RAW_SGN[category][0], PSI_TABLE_RAW_SGU[category][0], PSI_TABLE_RAW_SGU[category][1]
+
+
+def _expression_plan(actions: List[Dict[str, Any]], expression: str) -> List[Tuple[Any, List[List[tuple]]]]:
+    """
+    Plan wyrażenia: lista (wiodące, sloty). Slot to lista opcji, opcja to krotka par
+    (indeks oddziaływania, współczynnik). Kombinacje = iloczyn kartezjański slotów.
+
+    Kombinacje zdominowane odrzucane są przed wyliczeniem:
+    - G niekorzystne / korzystne mają jeden stan (γ_sup / γ_inf), "zmienne" - oba,
+    - Q niekorzystne jest zawsze obecne, "zmienne" - obecne lub pominięte,
+      korzystne jest pomijane (γ_Q,inf = 0),
+    - oddziaływanie towarzyszące z ψ = 0 nie zmienia kombinacji (bez rozgałęzienia),
+    - z grupy wykluczającej się obecne jest co najwyżej jedno oddziaływanie,
+    - wiodące, dla którego γψ wiodącego = γψ towarzyszącego, jest pomijane, gdy
+      istnieje niekorzystne wiodące z innej grupy (wtedy występuje jako towarzyszące
+      z tym samym współczynnikiem).
+    """
+    par = PARAMETRY_WYRAZEN[expression]
+    slots: List[List[tuple]] = []
+    variable: List[int] = []
+    for i, action in enumerate(actions):
+        if action["type"] == "G":
+            states = {"niekorzystne": [par["G_sup"]], "korzystne": [par["G_inf"]]}.get(
+                action.get("effect"), [par["G_sup"], par["G_inf"]]
+            )
+            slots.append([((i, f),) for f in dict.fromkeys(states)])
+        elif action["type"] == "P":
+            slots.append([((i, par["P"]),)])
+        elif action.get("effect") != "korzystne":
+            variable.append(i)
+
+    psi = {i: action_psi(actions[i]) for i in variable}
+
+    def factor(i, role):
+        key = par[role]
+        return par["Q"] * (1.0 if key == "k" else psi[i][key])
+
+    groups: Dict[str, List[int]] = {}
+    group_of: Dict[int, str] = {}
+    for i in variable:
+        group_of[i] = actions[i].get("group") or f"_{i}"
+        groups.setdefault(group_of[i], []).append(i)
+    unfavourable = {i for i in variable if actions[i].get("effect", "niekorzystne") == "niekorzystne"}
+
+    def group_options(members):
+        options = [((i, factor(i, "acc")),) for i in members if factor(i, "acc") > 0]
+        # Pominięcie grupy jest zdominowane, gdy należy do niej obecne oddziaływanie niekorzystne
+        if not any(option[0][0] in unfavourable for option in options):
+            options.append(())
+        return options
+
+    if par["lead"] is None or not variable:
+        leads: List[Any] = [None]
+    else:
+        gain = {i: factor(i, "lead") - factor(i, "acc") for i in variable}
+        strong = [i for i in variable if i in unfavourable and gain[i] > 0]
+        leads = [i for i in variable
+                 if gain[i] > 0 or (strong and not any(group_of[j] != group_of[i] for j in strong))]
+        if not strong:
+            leads.append(None)
+
+    plan = []
+    for lead in leads:
+        lead_slots = list(slots)
+        for members in groups.values():
+            if lead in members:
+                lead_slots.append([((lead, factor(lead, "lead")),)])
+            else:
+                lead_slots.append(group_options(members))
+        plan.append((lead, lead_slots))
+    return plan
+
+
+def count_combinations(actions: List[Dict[str, Any]], expressions=WYRAZENIA_SGN + WYRAZENIA_SGU) -> int:
+    """Liczba kombinacji po odrzuceniu zdominowanych (bez ich wyliczania)."""
+    total = 0
+    for expression in expressions:
+        for _, slots in _expression_plan(actions, expression):
+            n = 1
+            for options in slots:
+                n *= len(options)
+            total += n
+    return total
+
+
+def generate_combinations(actions: List[Dict[str, Any]], expressions=WYRAZENIA_SGN + WYRAZENIA_SGU) -> Iterator[Dict[str, Any]]:
+    """
+    Leniwy generator kombinacji PN-EN 1990 dla listy oddziaływań.
+
+    Oddziaływanie: {"name", "type": "G" | "P" | "Q", "category" (Q: klucz PSI_TABLE_RAW_SGN),
+    "effect": "niekorzystne" | "korzystne" (Q korzystne jest pomijane) | "zmienne", "group"
+    (opcjonalnie: grupa oddziaływań wykluczających się)}.
+    Zwraca słowniki {"expression", "leading", "factors"}; factors - krotka współczynników
+    w kolejności listy actions.
+    """
+    n = len(actions)
+    for expression in expressions:
+        for lead, slots in _expression_plan(actions, expression):
+            leading = actions[lead]["name"] if lead is not None else None
+            for choice in itertools.product(*slots):
+                factors = [0.0] * n
+                for option in choice:
+                    for i, f in option:
+                        factors[i] = f
+                yield {"expression": expression, "leading": leading, "factors": tuple(factors)}
+
+
+def combination_label(combination: Dict[str, Any], actions: List[Dict[str, Any]]) -> str:
+    """Zapis kombinacji, np. "1.35·G1 + 1.50·Q1 + 0.75·S"."""
+    parts = [f"{f:.2f}·{a['name']}" for f, a in zip(combination["factors"], actions) if f > 0]
+    return " + ".join(parts) if parts else "0"
+
+
+def actions_from_table(table: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Lista oddziaływań z tabeli o kolumnach nazwa, typ, kategoria, charakter, grupa.
+    Zwraca też nazwy pominiętych oddziaływań zmiennych bez poprawnej kategorii.
+    """
+    actions, skipped = [], []
+    for row in table.dropna(subset=["nazwa", "typ"]).to_dict("records"):
+        category = row.get("kategoria")
+        if row["typ"] == "Q" and category not in PSI_TABLE_RAW_SGN:
+            skipped.append(str(row["nazwa"]))
+            continue
+        actions.append({
+            "name": str(row["nazwa"]),
+            "type": row["typ"],
+            "category": category,
+            "effect": row.get("charakter") if isinstance(row.get("charakter"), str) else "niekorzystne",
+            "group": row.get("grupa") if isinstance(row.get("grupa"), str) and row.get("grupa") else None,
+        })
+    return actions, skipped
+
+
+def check_envelope_expressions(expressions) -> None:
+    """
+    Obwiednia obejmuje jeden stan graniczny: wyrażeń SGN i SGU nie można łączyć,
+    a wyrażenie 6.10 i para 6.10a/6.10b są alternatywne (PN-EN 1990, 6.4.3.2(3)).
+    """
+    if any(e in WYRAZENIA_SGN for e in expressions) and any(e in WYRAZENIA_SGU for e in expressions):
+        raise ValueError("Wyrażeń SGN i SGU nie można łączyć w jednej obwiedni")
+    if "6.10" in expressions and ("6.10a" in expressions or "6.10b" in expressions):
+        raise ValueError("Wyrażenia 6.10 nie można łączyć z 6.10a/6.10b w jednej obwiedni")
+
+
+def combination_matrix(actions: List[Dict[str, Any]],
+                       expressions=("6.10a", "6.10b")) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """
+    Macierz współczynników kombinacji (kombinacje × oddziaływania) oraz opis wierszy
+    [{"expression", "leading"}], wypełniana wprost z generatora.
+    """
+    check_envelope_expressions(expressions)
+    n_actions = len(actions)
+    n_comb = count_combinations(actions, expressions)
+    factors = np.empty((n_comb, n_actions))
+    meta: List[Dict[str, Any]] = []
+    for row, combination in enumerate(generate_combinations(actions, expressions)):
+        factors[row] = combination["factors"]
+        meta.append({"expression": combination["expression"], "leading": combination["leading"]})
+    return factors, meta
+
+
+def load_effect_envelope(factors: np.ndarray, unit_effects: np.ndarray, chunk_points: int = None,
+                         max_chunk_mb: float = 64.0) -> Dict[str, np.ndarray]:
+    """
+    Obwiednia efektów: E = factors @ unit_effects (kombinacje × punkty), liczona paczkami
+    punktów tak, aby macierz pośrednia nie przekraczała max_chunk_mb.
+    unit_effects - efekty jednostkowe (oddziaływania × punkty), także memmap.
+    Zwraca max, min oraz indeksy kombinacji miarodajnych comb_max, comb_min.
+    """
+    factors = np.asarray(factors, dtype=float)
+    n_comb, n_actions = factors.shape
+    if unit_effects.shape[0] != n_actions:
+        raise ValueError(f"Efekty jednostkowe {unit_effects.shape} nie pasują do {n_actions} oddziaływań")
+    n_points = unit_effects.shape[1]
+    if chunk_points is None:
+        chunk_points = max(1, int(max_chunk_mb * 1024**2 / (8 * max(n_comb, 1))))
+
+    result = {
+        "max": np.empty(n_points),
+        "min": np.empty(n_points),
+        "comb_max": np.empty(n_points, dtype=np.int64),
+        "comb_min": np.empty(n_points, dtype=np.int64),
+    }
+    columns = np.arange(chunk_points)
+    for start in range(0, n_points, chunk_points):
+        sl = slice(start, min(start + chunk_points, n_points))
+        effects = factors @ np.asarray(unit_effects[:, sl], dtype=float)
+        cols = columns[:effects.shape[1]]
+        i_max = np.argmax(effects, axis=0)
+        i_min = np.argmin(effects, axis=0)
+        result["comb_max"][sl] = i_max
+        result["comb_min"][sl] = i_min
+        result["max"][sl] = effects[i_max, cols]
+        result["min"][sl] = effects[i_min, cols]
+    return result
+
+
+def StronaGeneratorKombinacji():
+    st.markdown("### Generator kombinacji")
+    st.markdown(
+        "Oddziaływania zmienne przyjmują współczynniki ψ z tablic powyżej według kategorii. "
+        "Oddziaływanie **niekorzystne** występuje zawsze, **zmienne** - jest obecne lub pominięte "
+        "(dla G: $\\gamma_{G,sup}$ lub $\\gamma_{G,inf}$), Q **korzystne** jest pomijane ($\\gamma_{Q,inf} = 0$). "
+        "Oddziaływania z tą samą **grupą** wykluczają się."
+    )
+
+    actions_df = st.data_editor(
+        pd.DataFrame({
+            "nazwa": ["G1", "Q1", "S", "W"],
+            "typ": ["G", "Q", "Q", "Q"],
+            "kategoria": ["", "B: Biurowe", "Snieg (H <= 1000m)", "Wiatr"],
+            "charakter": ["niekorzystne", "niekorzystne", "niekorzystne", "zmienne"],
+            "grupa": ["", "", "", ""],
+        }),
+        num_rows="dynamic",
+        use_container_width=True,
+        key="komb_actions",
+        column_config={
+            "typ": st.column_config.SelectboxColumn("typ", options=["G", "P", "Q"], required=True),
+            "kategoria": st.column_config.SelectboxColumn("kategoria", options=[""] + list(PSI_TABLE_RAW_SGN)),
+            "charakter": st.column_config.SelectboxColumn("charakter", options=CHARAKTER_ODDZIALYWANIA),
+        },
+    )
+
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        expressions = st.multiselect(
+            "Wyrażenia", list(WYRAZENIA_SGN + WYRAZENIA_SGU), default=["6.10a", "6.10b"], key="komb_expressions"
+        )
+    with c2:
+        limit = st.number_input("Pokaż [szt.]", value=200, min_value=10, step=50, key="komb_limit")
+
+    actions, skipped = actions_from_table(actions_df)
+    for name in skipped:
+        st.warning(f"Oddziaływanie {name}: wybierz kategorię (pominięto).")
+    if not actions or not expressions:
+        return
+
+    n_total = count_combinations(actions, expressions)
+    st.markdown(f"Liczba kombinacji: **{n_total}**")
+    rows = [
+        {"wyrażenie": c["expression"], "wiodące": c["leading"] or "-", "kombinacja": combination_label(c, actions)}
+        for c in itertools.islice(generate_combinations(actions, expressions), int(limit))
+    ]
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+
+# =============================================================================
+# CZĘŚĆ 4 – WSPÓLNA FUNKCJA DLA APLIKACJI
 # =============================================================================
 
 def StronaKombinacjeObciazen():
@@ -412,12 +691,14 @@ def StronaKombinacjeObciazen():
     )
 
     # ZAKŁADKI (TERAZ POD TYTUŁEM)
-    tab_sgn, tab_sgu = st.tabs(
-        ["STAN GRANICZNY NOŚNOŚCI (SGN)", "STAN GRANICZNY UŻYTKOWALNOŚCI (SGU)"]
+    tab_sgn, tab_sgu, tab_gen = st.tabs(
+        ["STAN GRANICZNY NOŚNOŚCI (SGN)", "STAN GRANICZNY UŻYTKOWALNOŚCI (SGU)", "GENERATOR KOMBINACJI"]
     )
 
     with tab_sgn:
         StronaKombinacjeSGN()
 
     with tab_sgu:
-        StronaKombinacjeSGU()
\ No newline at end of file
+        StronaKombinacjeSGU()
+    with tab_gen:
+        StronaGeneratorKombinacji()
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+ObwiedniaKombinacji.py
+Obwiednie efektów oddziaływań dla wszystkich kombinacji PN-EN 1990 (bez interfejsu Streamlit).
+
+Wejście:
+    - tabela oddziaływań (CSV) z kolumnami: nazwa, typ (G/P/Q), kategoria
+      (dla Q - klucz tablicy ψ), charakter (niekorzystne/korzystne/zmienne),
+      grupa (opcjonalnie - oddziaływania wykluczające się),
+    - efekty jednostkowe: .npy (oddziaływania × punkty, czytane jako memmap)
+      lub CSV z kolumną dla każdego oddziaływania (wiersze - punkty wyników).
+
+Macierz współczynników kombinacji (kombinacje × oddziaływania) mnożona jest
+paczkami przez macierz efektów jednostkowych; dla każdego punktu zapisywane są
+wartości max/min i numery kombinacji miarodajnych.
+
+Wyjście: obwiednia (CSV) oraz lista kombinacji (CSV, obok obwiedni).
+
+Przykład:
+    python ObwiedniaKombinacji.py oddzialywania.csv efekty.npy -o obwiednia.csv --expressions 6.10a 6.10b
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import KombinacjeObciazen as kombinacje  # noqa: E402
+
+
+def read_unit_effects(path, action_names):
+    """Efekty jednostkowe (oddziaływania × punkty). Zwraca macierz (dla .npy memmap) i identyfikatory punktów."""
+    path = Path(path)
+    if path.suffix.lower() == ".npy":
+        effects = np.load(path, mmap_mode="r")
+        if effects.ndim != 2 or effects.shape[0] != len(action_names):
+            raise ValueError(f"Tablica {effects.shape} nie pasuje do {len(action_names)} oddziaływań")
+        return effects, np.arange(effects.shape[1])
+
+    df = pd.read_csv(path, sep=None, engine="python")
+    brak = [name for name in action_names if name not in df.columns]
+    if brak:
+        raise ValueError(f"Brak kolumn efektów dla oddziaływań: {', '.join(brak)}")
+    ids = df["id"].to_numpy() if "id" in df.columns else np.arange(len(df))
+    return df[action_names].to_numpy(dtype=float).T, ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Obwiednie efektów oddziaływań dla kombinacji PN-EN 1990.")
+    parser.add_argument("actions", help="Tabela oddziaływań (CSV).")
+    parser.add_argument("effects", help="Efekty jednostkowe (.npy oddziaływania × punkty lub CSV).")
+    parser.add_argument("-o", "--output", default="obwiednia.csv", help="Obwiednia (CSV).")
+    parser.add_argument("--expressions", nargs="+", default=["6.10a", "6.10b"],
+                        choices=list(kombinacje.PARAMETRY_WYRAZEN), help="Wyrażenia kombinacji.")
+    parser.add_argument("--chunk-mb", type=float, default=64.0, help="Rozmiar paczki macierzy efektów [MB].")
+    args = parser.parse_args(argv)
+    try:
+        kombinacje.check_envelope_expressions(args.expressions)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    actions, skipped = kombinacje.actions_from_table(pd.read_csv(args.actions, sep=None, engine="python"))
+    if skipped:
+        raise ValueError(f"Oddziaływania bez poprawnej kategorii: {', '.join(skipped)}")
+    names = [a["name"] for a in actions]
+    unit_effects, ids = read_unit_effects(args.effects, names)
+
+    t_start = time.perf_counter()
+    factors, meta = kombinacje.combination_matrix(actions, args.expressions)
+    envelope = kombinacje.load_effect_envelope(factors, unit_effects, max_chunk_mb=args.chunk_mb)
+    elapsed = time.perf_counter() - t_start
+
+    pd.DataFrame({
+        "id": ids,
+        "max": envelope["max"],
+        "komb_max": envelope["comb_max"],
+        "min": envelope["min"],
+        "komb_min": envelope["comb_min"],
+    }).to_csv(args.output, index=False)
+
+    combinations_path = str(Path(args.output).with_suffix("")) + "_kombinacje.csv"
+    table = pd.DataFrame(factors, columns=names)
+    table.insert(0, "wiodace", [m["leading"] or "-" for m in meta])
+    table.insert(0, "wyrazenie", [m["expression"] for m in meta])
+    table.index.name = "komb"
+    table.to_csv(combinations_path)
+
+    print(f"{len(meta)} kombinacji × {unit_effects.shape[1]} punktów w {elapsed:.2f} s. "
+          f"Obwiednia: {args.output}, kombinacje: {combinations_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+ObciazeniaGruntemRdzen.py
+Rdzeń obliczeń parcia spoczynkowego gruntu na ścianę wg PN-EN 1997-1 (bez interfejsu Streamlit).
+
+Warstwy podawane są tablicami (..., n) miąższości i parametrów; q i poziom wody
+z_water [m od naziomu] mogą mieć wymiary wiodące (...), np. wektor poziomów wody
+przy analizie parametrycznej - wszystkie warianty liczone są jednym wywołaniem.
+Naprężenia na granicach warstw wyznaczane są sumami prefiksowymi, wypadkowe
+parcia - całkowaniem dokładnym odcinków liniowych (sucha i nawodniona część warstwy).
+"""
+
+import numpy as np
+
+GAMMA_W = 10.0  # Ciężar objętościowy wody [kN/m³]
+
+
+def _out(value, decimals=None):
+    # Skalar -> float (zaokrąglenie jak round), tablica -> ndarray
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return round(value.item(), decimals) if decimals is not None else value.item()
+    return np.round(value, decimals) if decimals is not None else value
+
+
+def calculate_k0(phi_deg, ocr):
+    """Współczynnik parcia spoczynkowego K_0 = (1 - sin φ') √OCR (tablice - broadcasting)."""
+    return _out((1.0 - np.sin(np.radians(np.asarray(phi_deg, dtype=float)))) * np.sqrt(np.asarray(ocr, dtype=float)))
+
+
+# ==============================================================================
+# NAPRĘŻENIA NA GRANICACH WARSTW
+# ==============================================================================
+
+def _shift(values, first):
+    # Wartości na stropach warstw = wartości na spągach warstw poprzednich (first dla pierwszej)
+    first = np.broadcast_to(first, values[..., :1].shape)
+    return np.concatenate([first, values[..., :-1]], axis=-1)
+
+
+def layer_stresses(h, gamma, phi, ocr, q=0.0, z_water=np.inf):
+    """
+    Stan naprężeń w warstwach. Każda warstwa dzielona jest poziomem wody na część suchą
+    [z_top, z_mid] i nawodnioną [z_mid, z_bot] (jedna z nich może mieć zerową grubość);
+    poniżej wody γ' = max(γ - γ_w, 0). σ'_v na stropach warstw - suma prefiksowa przyrostów.
+
+    Zwraca słownik tablic (..., n): z_top, z_mid, z_bot, gamma, gamma_eff, k0,
+    sigma_top, sigma_mid, sigma_bot [kPa], u_top, u_mid, u_bot [kPa] oraz z_water (..., 1).
+    """
+    z_water = np.asarray(z_water, dtype=float)[..., None]
+    q = np.asarray(q, dtype=float)[..., None]
+    h, gamma, phi, ocr, _, _ = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (h, gamma, phi, ocr)), z_water, q
+    )
+
+    z_bot = np.cumsum(h, axis=-1)
+    z_top = _shift(z_bot, 0.0)
+    z_mid = np.clip(z_water, z_top, z_bot)
+    gamma_eff = np.maximum(gamma - GAMMA_W, 0.0)
+
+    przyrost = gamma * (z_mid - z_top) + gamma_eff * (z_bot - z_mid)
+    sigma_bot = q + np.cumsum(przyrost, axis=-1)
+    sigma_top = _shift(sigma_bot, q)
+    sigma_mid = sigma_top + gamma * (z_mid - z_top)
+
+    def u(z):
+        return GAMMA_W * np.maximum(z - z_water, 0.0)
+
+    return {
+        "z_top": z_top, "z_mid": z_mid, "z_bot": z_bot, "z_water": z_water,
+        "gamma": gamma, "gamma_eff": gamma_eff, "k0": np.asarray(calculate_k0(phi, ocr)),
+        "sigma_top": sigma_top, "sigma_mid": sigma_mid, "sigma_bot": sigma_bot,
+        "u_top": u(z_top), "u_mid": u(z_mid), "u_bot": u(z_bot),
+    }
+
+
+# ==============================================================================
+# PROFILE I WYPADKOWE
+# ==============================================================================
+
+def pressure_profile(stan, z):
+    """
+    σ'_v, u i e_0 = K_0 σ'_v + u [kPa] na dowolnych głębokościach z [m] (tablica k-elementowa).
+    Na granicy warstw przyjmowana jest warstwa niższa. Zwraca słownik tablic (..., k): z, warstwa, sigma_v, u, e0.
+    """
+    z_bot = stan["z_bot"]
+    z = np.clip(np.asarray(z, dtype=float), 0.0, z_bot[..., -1:])
+    n = z_bot.shape[-1]
+    warstwa = np.minimum((z[..., None, :] >= z_bot[..., :, None]).sum(axis=-2), n - 1)
+
+    def wez(nazwa):
+        return np.take_along_axis(stan[nazwa], warstwa, axis=-1)
+
+    z_top, z_mid = wez("z_top"), wez("z_mid")
+    sigma_v = (wez("sigma_top") + wez("gamma") * (np.minimum(z, z_mid) - z_top)
+               + wez("gamma_eff") * np.maximum(z - z_mid, 0.0))
+    u = GAMMA_W * np.maximum(z - stan["z_water"], 0.0)
+    return {"z": z, "warstwa": warstwa, "sigma_v": sigma_v, "u": u, "e0": wez("k0") * sigma_v + u}
+
+
+def layer_resultants(stan, H=None):
+    """
+    Wypadkowe parcia e_0 na 1 mb ściany: siła E [kN/m], moment M [kNm/m] względem podstawy
+    (z = H, domyślnie spód ostatniej warstwy) i ramię a = M / E [m] - dla każdej warstwy (..., n)
+    i łącznie (...). Część sucha i nawodniona warstwy całkowane są jako trapezy.
+    """
+    if H is None:
+        H = stan["z_bot"][..., -1:]
+    else:
+        H = np.asarray(H, dtype=float)[..., None]
+    k0 = stan["k0"]
+    e_top = k0 * stan["sigma_top"] + stan["u_top"]
+    e_mid = k0 * stan["sigma_mid"] + stan["u_mid"]
+    e_bot = k0 * stan["sigma_bot"] + stan["u_bot"]
+
+    E = np.zeros(np.broadcast_shapes(e_top.shape, H.shape))
+    M = np.zeros_like(E)
+    for z_a, z_b, e_a, e_b in ((stan["z_top"], stan["z_mid"], e_top, e_mid), (stan["z_mid"], stan["z_bot"], e_mid, e_bot)):
+        L = z_b - z_a
+        F = 0.5 * (e_a + e_b) * L
+        E += F
+        M += F * (H - z_a) - L ** 2 * (e_a + 2.0 * e_b) / 6.0
+
+    E_suma = E.sum(axis=-1)
+    M_suma = M.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ramie = np.where(E > 0, M / E, 0.0)
+        ramie_suma = np.where(E_suma > 0, M_suma / E_suma, 0.0)
+    return {
+        "E": _out(E), "M": _out(M), "ramie": _out(ramie),
+        "E_suma": _out(E_suma), "M_suma": _out(M_suma), "ramie_suma": _out(ramie_suma),
+    }
+
+
+def earth_pressure(h, gamma, phi, ocr, q=0.0, z_water=np.inf, z=None, n_points=101):
+    """
+    Pełne rozwiązanie w jednym wywołaniu: stan warstw, profil na głębokościach z
+    (domyślnie n_points punktów od naziomu do spodu) i wypadkowe. Zwraca (stan, profil, wypadkowe).
+    """
+    stan = layer_stresses(h, gamma, phi, ocr, q, z_water)
+    if z is None:
+        z = np.linspace(0.0, float(np.max(stan["z_bot"][..., -1])), n_points)
+    return stan, pressure_profile(stan, z), layer_resultants(stan)
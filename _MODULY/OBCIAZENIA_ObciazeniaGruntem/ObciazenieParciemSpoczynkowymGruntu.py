@@ -1,9 +1,17 @@
 import streamlit as st
-import math
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.path as mpath
 import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from ObciazeniaGruntemRdzen import layer_resultants, layer_stresses  # noqa: E402
 
 # ======================================================================================
 # 0. KONFIGURACJA I BAZA
@@ -60,110 +68,38 @@ for k, v in BAZA_GRUNTOW_ZRODLO["Spoiste"].items():
 # 1. FUNKCJE OBLICZENIOWE
 # --------------------------------------------------------------------------------------
 
-def calculate_k0(phi_deg, ocr):
-    phi_rad = math.radians(phi_deg)
-    k0 = (1.0 - math.sin(phi_rad)) * math.sqrt(ocr)
-    return k0
+def layer_columns(layers_data):
+    """Kolumny (h, gamma, phi, ocr) listy warstw z formularza."""
+    return tuple([layer[k] for layer in layers_data] for k in ("h", "gamma", "phi", "ocr"))
 
-def solve_layer_pressures(layers_data, q_surcharge, H_total, water_present, h_w_val):
+def solve_layer_pressures(layers_data, stan):
+    """Odcinki warstw do rysunku i szczegółów obliczeń (warstwa przecięta wodą - dwa odcinki)."""
     results = []
-    z_water = H_total - h_w_val if water_present else 99999.0
-    current_depth = 0.0
-    sigma_v_accumulated = q_surcharge 
+    z_water = float(stan["z_water"][0])
 
     for i, layer in enumerate(layers_data):
-        h = layer['h']
-        gamma = layer['gamma']
-        phi = layer['phi']
-        ocr = layer['ocr']
-        name = layer['name']
-
-        k0 = calculate_k0(phi, ocr)
-        z_top = current_depth
-        z_bot = current_depth + h
-        
-        def get_water_pressure(z):
-            if z <= z_water: return 0.0
-            return (z - z_water) * 10.0
-        
-        # A: Nad wodą
+        k0 = float(stan["k0"][i])
+        z_top, z_mid, z_bot = (float(stan[k][i]) for k in ("z_top", "z_mid", "z_bot"))
+        s_top, s_mid, s_bot = (float(stan[k][i]) for k in ("sigma_top", "sigma_mid", "sigma_bot"))
+        u_top, u_mid, u_bot = (float(stan[k][i]) for k in ("u_top", "u_mid", "u_bot"))
+
+        def odcinek(name, z_a, z_b, s_a, s_b, u_a, u_b, is_submerged):
+            return {
+                "id": i + 1, "name": name, "gamma": layer['gamma'], "phi": layer['phi'], "ocr": layer['ocr'], "k0": k0,
+                "z_top": z_a, "z_bot": z_b,
+                "sigma_v_top": s_a, "sigma_v_bot": s_b,
+                "u_top": u_a, "u_bot": u_b,
+                "e0_top": s_a * k0 + u_a, "e0_bot": s_b * k0 + u_b,
+                "is_submerged": is_submerged
+            }
+
         if z_bot <= z_water:
-            sigma_v_top = sigma_v_accumulated
-            sigma_v_bot = sigma_v_accumulated + (gamma * h)
-            
-            e_tot_top = sigma_v_top * k0
-            e_tot_bot = sigma_v_bot * k0
-            
-            results.append({
-                "id": i + 1, "name": name, "gamma": gamma, "phi": phi, "ocr": ocr, "k0": k0,
-                "z_top": z_top, "z_bot": z_bot,
-                "sigma_v_top": sigma_v_top, "sigma_v_bot": sigma_v_bot,
-                "u_top": 0.0, "u_bot": 0.0,
-                "e0_top": e_tot_top, "e0_bot": e_tot_bot,
-                "is_submerged": False
-            })
-            sigma_v_accumulated = sigma_v_bot
-            
-        # B: Pod wodą
+            results.append(odcinek(layer['name'], z_top, z_bot, s_top, s_bot, 0.0, 0.0, False))
         elif z_top >= z_water:
-            gamma_eff = gamma - 10.0
-            if gamma_eff < 0: gamma_eff = 0
-            
-            sigma_v_top = sigma_v_accumulated
-            sigma_v_bot = sigma_v_accumulated + (gamma_eff * h)
-            
-            u_top = get_water_pressure(z_top)
-            u_bot = get_water_pressure(z_bot)
-            
-            e_tot_top = (sigma_v_top * k0) + u_top
-            e_tot_bot = (sigma_v_bot * k0) + u_bot
-            
-            results.append({
-                "id": i + 1, "name": name, "gamma": gamma, "phi": phi, "ocr": ocr, "k0": k0,
-                "z_top": z_top, "z_bot": z_bot,
-                "sigma_v_top": sigma_v_top, "sigma_v_bot": sigma_v_bot,
-                "u_top": u_top, "u_bot": u_bot,
-                "e0_top": e_tot_top, "e0_bot": e_tot_bot,
-                "is_submerged": True
-            })
-            sigma_v_accumulated = sigma_v_bot
-            
-        # C: Przecinana
+            results.append(odcinek(layer['name'], z_top, z_bot, s_top, s_bot, u_top, u_bot, True))
         else:
-            # 1. Sucha
-            h1 = z_water - z_top
-            sigma_v_mid = sigma_v_accumulated + (gamma * h1)
-            
-            results.append({
-                "id": i + 1, "name": name + " (nad wodą)", "gamma": gamma, "phi": phi, "ocr": ocr, "k0": k0,
-                "z_top": z_top, "z_bot": z_water,
-                "sigma_v_top": sigma_v_accumulated, "sigma_v_bot": sigma_v_mid,
-                "u_top": 0.0, "u_bot": 0.0,
-                "e0_top": sigma_v_accumulated * k0, "e0_bot": sigma_v_mid * k0,
-                "is_submerged": False
-            })
-            
-            # 2. Mokra
-            h2 = z_bot - z_water
-            gamma_eff = gamma - 10.0
-            if gamma_eff < 0: gamma_eff = 0
-            sigma_v_bot = sigma_v_mid + (gamma_eff * h2)
-            
-            u_bot_end = get_water_pressure(z_bot)
-            e_tot_mid = sigma_v_mid * k0
-            e_tot_bot = (sigma_v_bot * k0) + u_bot_end
-            
-            results.append({
-                "id": i + 1, "name": name + " (pod wodą)", "gamma": gamma, "phi": phi, "ocr": ocr, "k0": k0,
-                "z_top": z_water, "z_bot": z_bot,
-                "sigma_v_top": sigma_v_mid, "sigma_v_bot": sigma_v_bot,
-                "u_top": 0.0, "u_bot": u_bot_end,
-                "e0_top": e_tot_mid, "e0_bot": e_tot_bot,
-                "is_submerged": True
-            })
-            sigma_v_accumulated = sigma_v_bot
-
-        current_depth += h
+            results.append(odcinek(layer['name'] + " (nad wodą)", z_top, z_mid, s_top, s_mid, 0.0, 0.0, False))
+            results.append(odcinek(layer['name'] + " (pod wodą)", z_mid, z_bot, s_mid, s_bot, u_mid, u_bot, True))
 
     return results
 
@@ -520,24 +456,30 @@ def run():
         
         st.markdown("### WYNIKI")
         
-        results = solve_layer_pressures(layers_data_input, q_surcharge, H_total, water_present, h_w_val)
+        z_water = H_total - h_w_val if water_present else np.inf
+        stan = layer_stresses(*layer_columns(layers_data_input), q_surcharge, z_water)
+        results = solve_layer_pressures(layers_data_input, stan)
+        wypadkowe = layer_resultants(stan, H_total)
         
         c_left, c_mid, c_right = st.columns([1, 3, 1])
         with c_mid:
             fig_res = draw_geometry_and_pressure(H_total, q_surcharge, water_present=water_present, h_w_input=h_w_val, results=results)
             st.pyplot(fig_res, use_container_width=True)
             
-        E0_sum = 0.0
-        Moment_sum = 0.0
-        for r in results:
-            h_lay = r['z_bot'] - r['z_top']
-            area = 0.5 * (r['e0_top'] + r['e0_bot']) * h_lay
-            E0_sum += area
-            y_cg = (h_lay/3) * ((2*r['e0_top'] + r['e0_bot']) / (r['e0_top'] + r['e0_bot'])) if (r['e0_top'] + r['e0_bot']) > 0 else 0
-            arm = (H_total - r['z_bot']) + y_cg
-            Moment_sum += area * arm
+        E0_sum = wypadkowe["E_suma"]
+        Moment_sum = wypadkowe["M_suma"]
         
-        st.info(f"**📊 WYNIKI ZBIORCZE (SIŁY WYPADKOWE):**\n\nCałkowita siła parcia $E_0 = {E0_sum:.2f}$ kN/mb &nbsp;&nbsp;|&nbsp;&nbsp; Moment wywracający $M_O = {Moment_sum:.2f}$ kNm/mb")
+        st.info(f"**📊 WYNIKI ZBIORCZE (SIŁY WYPADKOWE):**\n\nCałkowita siła parcia $E_0 = {E0_sum:.2f}$ kN/mb &nbsp;&nbsp;|&nbsp;&nbsp; Moment wywracający $M_O = {Moment_sum:.2f}$ kNm/mb &nbsp;&nbsp;|&nbsp;&nbsp; Ramię $a = {wypadkowe['ramie_suma']:.2f}$ m")
+
+        df_wyp = pd.DataFrame({
+            "Warstwa": [f"{i + 1}. {layer['name']}" for i, layer in enumerate(layers_data_input)],
+            "z [m]": [f"{z_a:.2f} ÷ {z_b:.2f}" for z_a, z_b in zip(stan["z_top"], stan["z_bot"])],
+            "E0 [kN/mb]": wypadkowe["E"],
+            "Ramię a [m]": wypadkowe["ramie"],
+            "M [kNm/mb]": wypadkowe["M"],
+        })
+        st.dataframe(df_wyp.style.format(precision=2), use_container_width=True, hide_index=True)
+        st.caption("Ramię $a$ mierzone od spodu fundamentu (poziom $z = H$).")
 
         st.markdown("<br>", unsafe_allow_html=True) 
 
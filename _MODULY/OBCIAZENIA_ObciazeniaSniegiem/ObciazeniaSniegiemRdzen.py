@@ -0,0 +1,274 @@
+"""
+ObciazeniaSniegiemRdzen.py
+Wspólny rdzeń obliczeń obciążenia śniegiem dachów wg PN-EN 1991-1-3 (bez interfejsu Streamlit).
+
+Funkcje współczynników (s_k, C_t, mu1, mu2, mu3, zaspy) przyjmują skalary lub
+tablice NumPy; dla argumentów skalarnych zwracają float. roof_snow_loads liczy
+obciążenia charakterystyczne dla całej tabeli dachów (wszystkie przypadki).
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.Miejscowosci import locality  # noqa: E402
+
+# Tablica 5.1 - współczynnik ekspozycji
+TEREN_CE = {
+    "Normalny": 1.0,
+    "Wystawiony na wiatr": 0.8,
+    "Osłonięty": 1.2,
+}
+
+TYPY_DACHOW = ("jednopolaciowy", "dwupolaciowy", "wielopolaciowy", "walcowy", "przylegajacy", "przeszkoda")
+
+# Kolumny opcjonalne tabeli dachów i wartości domyślne
+KOLUMNY_DOMYSLNE = {
+    "teren": "Normalny",
+    "U": 1.0,
+    "Ti": 18.0,
+    "bariery": False,
+    "alpha1": 0.0,
+    "alpha2": 0.0,
+    "alpha3": 0.0,
+    "alpha4": 0.0,
+    "b": 0.0,
+    "h": 0.0,
+    "b1": 0.0,
+    "b2": 0.0,
+    "alpha_high": 0.0,
+    "s_high": 0.0,
+}
+
+
+def _out(value, decimals=None):
+    # Skalar -> float (zaokrąglenie jak round), tablica -> ndarray
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return round(value.item(), decimals) if decimals is not None else value.item()
+    return np.round(value, decimals) if decimals is not None else value
+
+
+# ==============================================================================
+# WSPÓŁCZYNNIKI
+# ==============================================================================
+
+def calculate_sk(strefa, A):
+    """Obciążenie śniegiem gruntu s_k [kN/m²] dla strefy ("1"-"5") i wysokości A [m n.p.m.]."""
+    strefa = np.asarray(strefa).astype(str)
+    A = np.asarray(A, dtype=float)
+    low = A <= 300
+    f12 = 0.007 * A - 1.4
+    f34 = 0.006 * A - 0.6
+    sk = np.select(
+        [strefa == "1", strefa == "2", strefa == "3", strefa == "4", strefa == "5"],
+        [
+            np.where(low, np.maximum(f12, 0.7), f12),
+            np.where(low, 0.9, f12),
+            np.where(low, np.maximum(f34, 1.2), f34),
+            np.where(low, 1.6, f34),
+            np.maximum(0.93 * np.exp(0.00134 * A), 2.0),
+        ],
+        default=0.0,
+    )
+    return _out(sk, 3)
+
+
+def calculate_ct_iso(U_val, Ti_val):
+    """Oblicza Ct wg uproszczonej logiki ISO 4355."""
+    U_val = np.asarray(U_val, dtype=float)
+    delta_T = np.maximum(np.asarray(Ti_val, dtype=float) - (-5.0), 0.0)
+    ct = np.clip(1.0 - 0.0025 * (U_val - 1.0) * delta_T, 0.5, 1.0)
+    return _out(np.where(U_val <= 1.0, 1.0, ct), 2)
+
+
+def calculate_mu1(alpha, snow_guards=False):
+    """Współczynnik kształtu dachu mu1 wg PN-EN 1991-1-3 Tablica 5.2 (bariery: mu1 = 0.8)."""
+    alpha = np.asarray(alpha, dtype=float)
+    mu1 = np.where(alpha <= 30, 0.8, np.where(alpha < 60, 0.8 * (60.0 - alpha) / 30.0, 0.0))
+    return _out(np.where(snow_guards, 0.8, mu1))
+
+
+def calculate_mu2(alpha):
+    """Współczynnik kształtu mu2 wg PN-EN 1991-1-3 Tablica 5.2."""
+    alpha = np.asarray(alpha, dtype=float)
+    return _out(np.where(alpha <= 30, 0.8 + 0.8 * (alpha / 30.0), 1.6))
+
+
+def calculate_mu3(h, b):
+    """
+    Oblicza współczynnik kształtu dachu mu3 wg PN-EN 1991-1-3 (Wzór 5.5).
+    Dla beta <= 60 stopni: mu3 = 0.2 + 10 * (h/b), ale nie więcej niż 2.0.
+    """
+    h = np.asarray(h, dtype=float)
+    b = np.asarray(b, dtype=float)
+    ratio = np.divide(h, b, out=np.zeros(np.broadcast(h, b).shape), where=b > 0)
+    return _out(np.where(b > 0, np.minimum(0.2 + 10.0 * ratio, 2.0), 0.0))
+
+
+def calculate_drift_params(h_obstacle, sk, gamma=2.0):
+    """
+    Parametry zaspy przy przeszkodzie wg PN-EN 1991-1-3 p. 6.2: (mu1, mu2, ls).
+    mu1 = 0.8, mu2 = gamma h / s_k w granicach 0.8-2.0, ls = 2h w granicach 5-15 m.
+    """
+    h_obstacle = np.asarray(h_obstacle, dtype=float)
+    sk = np.asarray(sk, dtype=float)
+    no_snow = sk <= 0.001
+    mu2 = np.clip(np.divide(gamma * h_obstacle, sk, out=np.zeros(np.broadcast(h_obstacle, sk).shape),
+                            where=~no_snow), 0.8, 2.0)
+    ls = np.clip(2.0 * h_obstacle, 5.0, 15.0)
+    mu1 = np.full(np.broadcast(h_obstacle, sk).shape, 0.8)
+    return _out(mu1), _out(np.where(no_snow, 0.8, mu2)), _out(np.where(no_snow, 5.0, ls))
+
+
+def calculate_abutting_drift_params(b1, b2, h, sk, alpha_high, s_high, Ce, Ct, gamma=2.0):
+    """
+    Zaspa na dachu przylegającym do wyższego budynku wg PN-EN 1991-1-3 p. 5.3.6.
+    Zwraca słownik: s_slide (0.5 s_1 dla alpha > 15°), mu_s, mu_w (0.8-4.0, <= gamma h / s_k),
+    mu_2 = mu_s + mu_w oraz ls = 2h w granicach 5-15 m.
+    """
+    b1, b2, h = (np.asarray(v, dtype=float) for v in (b1, b2, h))
+    sk = np.asarray(sk, dtype=float)
+    s_slide = np.where(np.asarray(alpha_high, dtype=float) > 15, 0.5 * np.asarray(s_high, dtype=float), 0.0)
+    s_ref = sk * Ce * Ct
+    mu_s = np.divide(s_slide, s_ref, out=np.zeros(np.broadcast(s_slide, s_ref).shape), where=s_ref > 0.0001)
+    limit_mu_w = np.divide(gamma * h, sk, out=np.full(np.broadcast(h, sk).shape, 999.0), where=sk > 0.0001)
+    mu_w = np.clip(np.minimum((b1 + b2) / (2.0 * h), limit_mu_w), 0.8, 4.0)
+    return {
+        "s_slide": _out(s_slide),
+        "mu_s": _out(mu_s),
+        "mu_w": _out(mu_w),
+        "mu_2": _out(mu_s + mu_w),
+        "ls": _out(np.clip(2.0 * h, 5.0, 15.0)),
+    }
+
+
+# ==============================================================================
+# TRYB WSADOWY
+# ==============================================================================
+
+def roof_snow_loads(roofs):
+    """
+    Obciążenia charakterystyczne śniegiem dla tabeli dachów (DataFrame).
+
+    Kolumny: id, typ (TYPY_DACHOW), strefa i A [m n.p.m.] lub miejscowosc
+    (brakujące strefa/A uzupełniane z bazy miejscowości) oraz opcjonalnie
+    teren, U, Ti, bariery i geometria wg typu: alpha1 (jednopołaciowy), alpha1-2
+    (dwupołaciowy), alpha1-4 (wielopołaciowy: połacie kolejno od lewej), b, h
+    (walcowy), b1, b2, h, alpha_high, s_high (przylegający), h (przeszkoda).
+
+    Zwraca tabelę w postaci długiej: wiersz na dach, przypadek i miejsce
+    z kolumnami sk, Ce, Ct, mu, s [kN/m²] oraz ls [m] dla zasp.
+    """
+    df = roofs.reset_index(drop=True).copy()
+    if "miejscowosc" in df.columns:
+        dane = df["miejscowosc"].map(lambda n: locality(str(n).strip()) if pd.notna(n) else None)
+        nieznane = df.loc[df["miejscowosc"].notna() & dane.isna(), "miejscowosc"]
+        if len(nieznane):
+            raise ValueError(f"Nieznane miejscowości: {', '.join(nieznane.astype(str).unique())}")
+        for col, key in (("strefa", "strefa_snieg"), ("A", "A")):
+            z_bazy = dane.map(lambda d: d[key] if d else np.nan)
+            df[col] = df[col].fillna(z_bazy) if col in df.columns else z_bazy
+    for col, val in KOLUMNY_DOMYSLNE.items():
+        df[col] = df[col].fillna(val) if col in df.columns else val
+
+    typ = df["typ"].astype(str).str.strip().str.lower().to_numpy()
+    nieznane = sorted(set(typ) - set(TYPY_DACHOW))
+    if nieznane:
+        raise ValueError(f"Nieobsługiwane typy dachów: {', '.join(nieznane)}")
+    teren = df["teren"].map(TEREN_CE)
+    if teren.isna().any():
+        raise ValueError(f"Nieznany typ terenu: {', '.join(df.loc[teren.isna(), 'teren'].astype(str).unique())}")
+
+    strefa = pd.to_numeric(df["strefa"], errors="coerce").fillna(0).astype(int).astype(str).to_numpy()
+    sk = np.atleast_1d(calculate_sk(strefa, df["A"].to_numpy(dtype=float)))
+    Ce = teren.to_numpy(dtype=float)
+    Ct = np.atleast_1d(calculate_ct_iso(df["U"].to_numpy(dtype=float), df["Ti"].to_numpy(dtype=float)))
+    base = Ce * Ct * sk
+    guards = df["bariery"].astype(bool).to_numpy()
+    alpha = [df[f"alpha{i}"].to_numpy(dtype=float) for i in range(1, 5)]
+    h = df["h"].to_numpy(dtype=float)
+
+    mu1 = [np.atleast_1d(calculate_mu1(a, guards)) for a in alpha]
+    mu2_valley = np.atleast_1d(calculate_mu2((alpha[1] + alpha[2]) / 2.0))
+    mu3 = np.atleast_1d(calculate_mu3(h, df["b"].to_numpy(dtype=float)))
+    _, mu2_obstacle, ls_obstacle = calculate_drift_params(h, sk)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        abutting = calculate_abutting_drift_params(
+            df["b1"].to_numpy(dtype=float), df["b2"].to_numpy(dtype=float), h, sk,
+            df["alpha_high"].to_numpy(dtype=float), df["s_high"].to_numpy(dtype=float), Ce, Ct,
+        )
+
+    # Przypadki: typ -> [(przypadek, miejsce, mu, ls)]
+    none = np.full(len(df), np.nan)
+    cases = {
+        "jednopolaciowy": [("i", "połać", mu1[0], none)],
+        "dwupolaciowy": [
+            ("i", "L", mu1[0], none), ("i", "P", mu1[1], none),
+            ("ii", "L", 0.5 * mu1[0], none), ("ii", "P", mu1[1], none),
+            ("iii", "L", mu1[0], none), ("iii", "P", 0.5 * mu1[1], none),
+        ],
+        "wielopolaciowy": [
+            ("i", "1.L", mu1[0], none), ("i", "2.L", mu1[1], none),
+            ("i", "1.P", mu1[2], none), ("i", "2.P", mu1[3], none),
+            ("ii", "1.L", mu1[0], none), ("ii", "2.L (kalenica)", mu1[1], none), ("ii", "kosz", mu2_valley, none),
+            ("ii", "1.P (kalenica)", mu1[2], none), ("ii", "2.P", mu1[3], none),
+        ],
+        "walcowy": [
+            ("i", "dach", np.full(len(df), 0.8), none),
+            ("ii", "lewa", 0.5 * mu3, none), ("ii", "prawa", mu3, none),
+        ],
+        "przylegajacy": [
+            ("i", "dach niższy", np.full(len(df), 0.8), none),
+            ("ii", "przy ścianie", abutting["mu_2"], abutting["ls"]),
+            ("ii", "poza zaspą", np.full(len(df), 0.8), abutting["ls"]),
+        ],
+        "przeszkoda": [
+            ("i", "dach", np.full(len(df), 0.8), none),
+            ("ii", "przy przeszkodzie", mu2_obstacle, ls_obstacle),
+            ("ii", "poza zaspą", np.full(len(df), 0.8), ls_obstacle),
+        ],
+    }
+
+    parts = []
+    for roof_type, type_cases in cases.items():
+        idx = np.flatnonzero(typ == roof_type)
+        if not len(idx):
+            continue
+        for order, (przypadek, miejsce, mu, ls) in enumerate(type_cases):
+            mu = np.broadcast_to(mu, len(df))[idx]
+            parts.append(pd.DataFrame({
+                "_row": idx,
+                "_order": order,
+                "id": df["id"].to_numpy()[idx],
+                "typ": roof_type,
+                "przypadek": przypadek,
+                "miejsce": miejsce,
+                "sk": sk[idx],
+                "Ce": Ce[idx],
+                "Ct": Ct[idx],
+                "mu": mu,
+                "s [kN/m2]": mu * base[idx],
+                "ls [m]": np.broadcast_to(ls, len(df))[idx],
+            }))
+    if not parts:
+        return pd.DataFrame(columns=["id", "typ", "przypadek", "miejsce", "sk", "Ce", "Ct", "mu", "s [kN/m2]", "ls [m]"])
+    out = pd.concat(parts, ignore_index=True).sort_values(["_row", "_order"], kind="stable")
+    return out.drop(columns=["_row", "_order"]).reset_index(drop=True)
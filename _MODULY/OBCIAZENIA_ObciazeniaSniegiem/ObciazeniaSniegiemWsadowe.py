@@ -0,0 +1,70 @@
+"""
+ObciazeniaSniegiemWsadowe.py
+Obciążenie śniegiem dachów całego zespołu budynków (bez interfejsu Streamlit).
+
+Wejście: tabela dachów (CSV) z kolumnami:
+    id, typ, strefa, A (lub miejscowosc - strefa i A z bazy miejscowości)
+oraz opcjonalnie: teren, U, Ti, bariery i geometria wg typu dachu:
+    - typ: jednopolaciowy, dwupolaciowy, wielopolaciowy, walcowy,
+      przylegajacy lub przeszkoda,
+    - strefa: 1-5, A [m n.p.m.], teren: "Normalny", "Wystawiony na wiatr",
+      "Osłonięty", U [W/m²K], Ti [°C], bariery: 0/1,
+    - alpha1..alpha4 [°] - połacie kolejno od lewej,
+    - b, h [m] - dach walcowy (rozpiętość, wyniosłość), przeszkoda (h),
+    - b1, b2, h [m], alpha_high [°], s_high [kN/m²] - dach przylegający.
+
+Wszystkie dachy liczone są jednocześnie (roof_snow_loads z ObciazeniaSniegiemRdzen).
+
+Wyjście: obciążenia charakterystyczne dla wszystkich przypadków (CSV, postać długa).
+
+Przykład:
+    python ObciazeniaSniegiemWsadowe.py dachy.csv -o snieg.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_PLIKU.parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from ObciazeniaSniegiemRdzen import roof_snow_loads  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Obciążenie śniegiem dachów zespołu budynków (PN-EN 1991-1-3).")
+    parser.add_argument("input", help="Tabela dachów (CSV).")
+    parser.add_argument("-o", "--output", default="obciazenie_sniegiem.csv", help="Tabela wyników (CSV).")
+    args = parser.parse_args(argv)
+
+    roofs = pd.read_csv(args.input, sep=None, engine="python")
+
+    t_start = time.perf_counter()
+    results = roof_snow_loads(roofs)
+    elapsed = time.perf_counter() - t_start
+    results.to_csv(args.output, index=False)
+
+    print(f"Obliczono {len(roofs)} dachów ({len(results)} wierszy) w {elapsed:.2f} s. Wyniki: {args.output}")
+    s_max = results.groupby(["id", "typ"], sort=False)["s [kN/m2]"].max().reset_index()
+    summary = s_max.groupby("typ")["s [kN/m2]"].agg(liczba="size", s_max="max", s_sr="mean")
+    print(summary.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -4,81 +4,21 @@ import os
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
+import sys
+from pathlib import Path
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from TABLICE.Miejscowosci import city_table, locality_names  # noqa: E402
+from ObciazeniaSniegiemRdzen import calculate_ct_iso, calculate_mu1, calculate_sk  # noqa: E402
 
 # --------------------------------------------------------------------------------------
 # 1. BAZA DANYCH MIAST (STREFY I WYSOKOŚCI)
 # --------------------------------------------------------------------------------------
 # Zweryfikowano wg PN-EN 1991-1-3:2005/NA:2010
-MIASTA_DB = {
-    "Białystok":            {"strefa": "4", "A": 150},
-    "Bielsko-Biała":        {"strefa": "3", "A": 330},
-    "Bydgoszcz":            {"strefa": "2", "A": 60},
-    "Bytom":                {"strefa": "2", "A": 280},
-    "Chełm":                {"strefa": "3", "A": 190},
-    "Chorzów":              {"strefa": "2", "A": 280},
-    "Częstochowa":          {"strefa": "2", "A": 260},
-    "Dąbrowa Górnicza":     {"strefa": "2", "A": 270},
-    "Elbląg":               {"strefa": "3", "A": 10},
-    "Gdańsk":               {"strefa": "3", "A": 15},
-    "Gdynia":               {"strefa": "3", "A": 30},
-    "Gliwice":              {"strefa": "2", "A": 220},
-    "Gorzów Wielkopolski":  {"strefa": "1", "A": 20},
-    "Grudziądz":            {"strefa": "2", "A": 50},
-    "Jelenia Góra":         {"strefa": "3", "A": 350},
-    "Kalisz":               {"strefa": "2", "A": 140},
-    "Katowice":             {"strefa": "2", "A": 270},
-    "Kielce":               {"strefa": "3", "A": 260},
-    "Konin":                {"strefa": "2", "A": 100},
-    "Koszalin":             {"strefa": "2", "A": 35},
-    "Kraków":               {"strefa": "3", "A": 220},
-    "Legnica":              {"strefa": "1", "A": 120},
-    "Lublin":               {"strefa": "3", "A": 200},
-    "Łódź":                 {"strefa": "2", "A": 220},
-    "Nowy Sącz":            {"strefa": "3", "A": 300},
-    "Olsztyn":              {"strefa": "4", "A": 140},
-    "Opole":                {"strefa": "2", "A": 175},
-    "Płock":                {"strefa": "2", "A": 100},
-    "Poznań":               {"strefa": "2", "A": 85},
-    "Radom":                {"strefa": "2", "A": 180},
-    "Ruda Śląska":          {"strefa": "2", "A": 270},
-    "Rybnik":               {"strefa": "2", "A": 240},
-    "Rzeszów":              {"strefa": "3", "A": 220},
-    "Siedlce":              {"strefa": "3", "A": 155},
-    "Sosnowiec":            {"strefa": "2", "A": 260},
-    "Suwałki":              {"strefa": "4", "A": 170},
-    "Szczecin":             {"strefa": "1", "A": 25},
-    "Tarnów":               {"strefa": "3", "A": 210},
-    "Toruń":                {"strefa": "2", "A": 50},
-    "Tychy":                {"strefa": "2", "A": 260},
-    "Wałbrzych":            {"strefa": "3", "A": 450},
-    "Warszawa":             {"strefa": "2", "A": 110},
-    "Włocławek":            {"strefa": "2", "A": 65},
-    "Wrocław":              {"strefa": "1", "A": 120},
-    "Zabrze":               {"strefa": "2", "A": 260},
-    "Zakopane":             {"strefa": "5", "A": 850},
-    "Zielona Góra":         {"strefa": "1", "A": 150},
-}
-
-def calculate_ct_iso(U_val, Ti_val):
-    """Oblicza Ct wg uproszczonej logiki ISO 4355."""
-    if U_val <= 1.0: return 1.0
-    delta_T = Ti_val - (-5.0) 
-    if delta_T < 0: delta_T = 0
-    redukcja = 0.0025 * (U_val - 1.0) * delta_T
-    ct = 1.0 - redukcja
-    if ct < 0.5: ct = 0.5
-    if ct > 1.0: ct = 1.0
-    return round(ct, 2)
-
-def calculate_mu1(alpha):
-    """Oblicza współczynnik kształtu dachu mu1 wg PN-EN 1991-1-3 Tablica 5.2."""
-    if alpha < 0: return 0.8
-    if 0 <= alpha <= 30:
-        return 0.8
-    elif 30 < alpha < 60:
-        return 0.8 * (60.0 - alpha) / 30.0
-    else: # alpha >= 60
-        return 0.0
+MIASTA_DB = city_table("snieg")
 
 def plot_mu_coefficients():
     """Generuje wykres mu1 w funkcji kąta alfa (0-60 stopni)."""
@@ -235,7 +175,7 @@ def run():
         disable_strefa = False
 
         if use_city:
-            lista_miast = sorted(list(MIASTA_DB.keys()))
+            lista_miast = locality_names()
             idx_krakow = lista_miast.index("Kraków") if "Kraków" in lista_miast else 0
             
             wybrane_miasto = st.selectbox(
@@ -384,28 +324,10 @@ def run():
         Ce = current_Ce
         Ct = Ct_val
         
-        sk_calc = 0.0
-        if strefa == "1":
-            formula_val = 0.007 * A - 1.4
-            sk_calc = max(formula_val, 0.7) if A <= 300 else formula_val
-        elif strefa == "2":
-            sk_calc = 0.9 if A <= 300 else 0.007 * A - 1.4
-        elif strefa == "3":
-            formula_val = 0.006 * A - 0.6
-            sk_calc = max(formula_val, 1.2) if A <= 300 else formula_val
-        elif strefa == "4":
-            sk_calc = 1.6 if A <= 300 else 0.006 * A - 0.6
-        elif strefa == "5":
-            formula_val = 0.93 * math.exp(0.00134 * A)
-            sk_calc = max(formula_val, 2.0)
-        
-        sk = round(sk_calc, 3)
+        sk = calculate_sk(strefa, A)
 
         # --- 2. OBLICZENIE Mu1 ---
-        if snow_guards == "Tak":
-            mu1 = 0.8
-        else:
-            mu1 = calculate_mu1(alpha)
+        mu1 = calculate_mu1(alpha, snow_guards == "Tak")
         
         # --- 3. WYNIK KOŃCOWY ---
         s_val = mu1 * Ce * Ct * sk
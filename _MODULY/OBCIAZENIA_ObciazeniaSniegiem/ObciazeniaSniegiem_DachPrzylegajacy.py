@@ -4,80 +4,20 @@ import os
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
+import sys
+from pathlib import Path
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from TABLICE.Miejscowosci import city_table, locality_names  # noqa: E402
+from ObciazeniaSniegiemRdzen import calculate_abutting_drift_params, calculate_ct_iso, calculate_sk  # noqa: E402
 
 # --------------------------------------------------------------------------------------
 # 1. BAZA DANYCH MIAST (STREFY I WYSOKOŚCI)
 # --------------------------------------------------------------------------------------
-MIASTA_DB = {
-    "Białystok":            {"strefa": "4", "A": 150},
-    "Bielsko-Biała":        {"strefa": "3", "A": 330},
-    "Bydgoszcz":            {"strefa": "2", "A": 60},
-    "Bytom":                {"strefa": "2", "A": 280},
-    "Chełm":                {"strefa": "3", "A": 190},
-    "Chorzów":              {"strefa": "2", "A": 280},
-    "Częstochowa":          {"strefa": "2", "A": 260},
-    "Dąbrowa Górnicza":     {"strefa": "2", "A": 270},
-    "Elbląg":               {"strefa": "3", "A": 10},
-    "Gdańsk":               {"strefa": "3", "A": 15},
-    "Gdynia":               {"strefa": "3", "A": 30},
-    "Gliwice":              {"strefa": "2", "A": 220},
-    "Gorzów Wielkopolski":  {"strefa": "1", "A": 20},
-    "Grudziądz":            {"strefa": "2", "A": 50},
-    "Jelenia Góra":         {"strefa": "3", "A": 350},
-    "Kalisz":               {"strefa": "2", "A": 140},
-    "Katowice":             {"strefa": "2", "A": 270},
-    "Kielce":               {"strefa": "3", "A": 260},
-    "Konin":                {"strefa": "2", "A": 100},
-    "Koszalin":             {"strefa": "2", "A": 35},
-    "Kraków":               {"strefa": "3", "A": 220},
-    "Legnica":              {"strefa": "1", "A": 120},
-    "Lublin":               {"strefa": "3", "A": 200},
-    "Łódź":                 {"strefa": "2", "A": 220},
-    "Nowy Sącz":            {"strefa": "3", "A": 300},
-    "Olsztyn":              {"strefa": "4", "A": 140},
-    "Opole":                {"strefa": "2", "A": 175},
-    "Płock":                {"strefa": "2", "A": 100},
-    "Poznań":               {"strefa": "2", "A": 85},
-    "Radom":                {"strefa": "2", "A": 180},
-    "Ruda Śląska":          {"strefa": "2", "A": 270},
-    "Rybnik":               {"strefa": "2", "A": 240},
-    "Rzeszów":              {"strefa": "3", "A": 220},
-    "Siedlce":              {"strefa": "3", "A": 155},
-    "Sosnowiec":            {"strefa": "2", "A": 260},
-    "Suwałki":              {"strefa": "4", "A": 170},
-    "Szczecin":             {"strefa": "1", "A": 25},
-    "Tarnów":               {"strefa": "3", "A": 210},
-    "Toruń":                {"strefa": "2", "A": 50},
-    "Tychy":                {"strefa": "2", "A": 260},
-    "Wałbrzych":            {"strefa": "3", "A": 450},
-    "Warszawa":             {"strefa": "2", "A": 110},
-    "Włocławek":            {"strefa": "2", "A": 65},
-    "Wrocław":              {"strefa": "1", "A": 120},
-    "Zabrze":               {"strefa": "2", "A": 260},
-    "Zakopane":             {"strefa": "5", "A": 850},
-    "Zielona Góra":         {"strefa": "1", "A": 150},
-}
-
-def calculate_ct_iso(U_val, Ti_val):
-    """Oblicza Ct wg uproszczonej logiki ISO 4355."""
-    if U_val <= 1.0: return 1.0
-    delta_T = Ti_val - (-5.0) 
-    if delta_T < 0: delta_T = 0
-    redukcja = 0.0025 * (U_val - 1.0) * delta_T
-    ct = 1.0 - redukcja
-    if ct < 0.5: ct = 0.5
-    if ct > 1.0: ct = 1.0
-    return round(ct, 2)
-
-def calculate_mu1(alpha):
-    """Oblicza współczynnik kształtu dachu mu1 wg PN-EN 1991-1-3 Tablica 5.2."""
-    if alpha < 0: return 0.8
-    if 0 <= alpha <= 30:
-        return 0.8
-    elif 30 < alpha < 60:
-        return 0.8 * (60.0 - alpha) / 30.0
-    else: # alpha >= 60
-        return 0.0
+MIASTA_DB = city_table("snieg")
 
 def plot_geometry_schema(alpha_deg):
     """
@@ -412,7 +352,7 @@ def run():
         disable_strefa = False
 
         if use_city:
-            lista_miast = sorted(list(MIASTA_DB.keys()))
+            lista_miast = locality_names()
             idx_krakow = lista_miast.index("Kraków") if "Kraków" in lista_miast else 0
             
             wybrane_miasto = st.selectbox(
@@ -507,45 +447,20 @@ def run():
 
     if oblicz:
         # --- 1. Sk ---
-        sk_calc = 0.0
-        if strefa == "1": sk_calc = max(0.007*A - 1.4, 0.7) if A<=300 else 0.007*A - 1.4
-        elif strefa == "2": sk_calc = 0.9 if A<=300 else 0.007*A - 1.4
-        elif strefa == "3": sk_calc = max(0.006*A - 0.6, 1.2) if A<=300 else 0.006*A - 0.6
-        elif strefa == "4": sk_calc = 1.6 if A<=300 else 0.006*A - 0.6
-        elif strefa == "5": sk_calc = max(0.93*math.exp(0.00134*A), 2.0)
-        sk = round(sk_calc, 3)
+        sk = calculate_sk(strefa, A)
         st.session_state["dp_sk"] = sk
 
         # --- 2. OBLICZENIA ---
         mu_1_low = 0.8
         s_case1 = mu_1_low * current_Ce * Ct_val * sk
         
-        val_slide = 0.0
-        if alpha_high > 15:
-            val_slide = 0.5 * s_high
-        
-        mu_s = 0.0
-        s_ref_low = sk * current_Ce * Ct_val
-        if s_ref_low > 0.0001:
-            mu_s = val_slide / s_ref_low
-            
-        gamma = 2.0
-        if sk > 0.0001:
-            limit_mu_w = (gamma * h) / sk
-        else:
-            limit_mu_w = 999.0 
-            
-        calc_mu_w = (b1 + b2) / (2.0 * h)
-        mu_w = min(calc_mu_w, limit_mu_w)
-        if mu_w < 0.8: mu_w = 0.8
-        if mu_w > 4.0: mu_w = 4.0
-        
+        drift = calculate_abutting_drift_params(b1, b2, h, sk, alpha_high, s_high, current_Ce, Ct_val)
+        val_slide = drift["s_slide"]
+        mu_s = drift["mu_s"]
+        mu_w = drift["mu_w"]
+        mu_2 = drift["mu_2"]
+        ls = drift["ls"]
         s_w = mu_w * current_Ce * Ct_val * sk
-        mu_2 = mu_s + mu_w
-        
-        ls = 2 * h
-        if ls < 5.0: ls = 5.0
-        if ls > 15.0: ls = 15.0
         
         s_case2_peak = val_slide + s_w
 
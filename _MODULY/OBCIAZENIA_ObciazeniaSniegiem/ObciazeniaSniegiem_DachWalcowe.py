@@ -4,85 +4,25 @@ import os
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
+import sys
+from pathlib import Path
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from TABLICE.Miejscowosci import city_table, locality_names  # noqa: E402
+from ObciazeniaSniegiemRdzen import calculate_ct_iso, calculate_mu3, calculate_sk  # noqa: E402
 
 # --------------------------------------------------------------------------------------
 # 1. BAZA DANYCH MIAST (STREFY I WYSOKOŚCI)
 # --------------------------------------------------------------------------------------
-MIASTA_DB = {
-    "Białystok":            {"strefa": "4", "A": 150},
-    "Bielsko-Biała":        {"strefa": "3", "A": 330},
-    "Bydgoszcz":            {"strefa": "2", "A": 60},
-    "Bytom":                {"strefa": "2", "A": 280},
-    "Chełm":                {"strefa": "3", "A": 190},
-    "Chorzów":              {"strefa": "2", "A": 280},
-    "Częstochowa":          {"strefa": "2", "A": 260},
-    "Dąbrowa Górnicza":     {"strefa": "2", "A": 270},
-    "Elbląg":               {"strefa": "3", "A": 10},
-    "Gdańsk":               {"strefa": "3", "A": 15},
-    "Gdynia":               {"strefa": "3", "A": 30},
-    "Gliwice":              {"strefa": "2", "A": 220},
-    "Gorzów Wielkopolski":  {"strefa": "1", "A": 20},
-    "Grudziądz":            {"strefa": "2", "A": 50},
-    "Jelenia Góra":         {"strefa": "3", "A": 350},
-    "Kalisz":               {"strefa": "2", "A": 140},
-    "Katowice":             {"strefa": "2", "A": 270},
-    "Kielce":               {"strefa": "3", "A": 260},
-    "Konin":                {"strefa": "2", "A": 100},
-    "Koszalin":             {"strefa": "2", "A": 35},
-    "Kraków":               {"strefa": "3", "A": 220},
-    "Legnica":              {"strefa": "1", "A": 120},
-    "Lublin":               {"strefa": "3", "A": 200},
-    "Łódź":                 {"strefa": "2", "A": 220},
-    "Nowy Sącz":            {"strefa": "3", "A": 300},
-    "Olsztyn":              {"strefa": "4", "A": 140},
-    "Opole":                {"strefa": "2", "A": 175},
-    "Płock":                {"strefa": "2", "A": 100},
-    "Poznań":               {"strefa": "2", "A": 85},
-    "Radom":                {"strefa": "2", "A": 180},
-    "Ruda Śląska":          {"strefa": "2", "A": 270},
-    "Rybnik":               {"strefa": "2", "A": 240},
-    "Rzeszów":              {"strefa": "3", "A": 220},
-    "Siedlce":              {"strefa": "3", "A": 155},
-    "Sosnowiec":            {"strefa": "2", "A": 260},
-    "Suwałki":              {"strefa": "4", "A": 170},
-    "Szczecin":             {"strefa": "1", "A": 25},
-    "Tarnów":               {"strefa": "3", "A": 210},
-    "Toruń":                {"strefa": "2", "A": 50},
-    "Tychy":                {"strefa": "2", "A": 260},
-    "Wałbrzych":            {"strefa": "3", "A": 450},
-    "Warszawa":             {"strefa": "2", "A": 110},
-    "Włocławek":            {"strefa": "2", "A": 65},
-    "Wrocław":              {"strefa": "1", "A": 120},
-    "Zabrze":               {"strefa": "2", "A": 260},
-    "Zakopane":             {"strefa": "5", "A": 850},
-    "Zielona Góra":         {"strefa": "1", "A": 150},
-}
+MIASTA_DB = city_table("snieg")
 
 # --------------------------------------------------------------------------------------
 # 2. FUNKCJE OBLICZENIOWE I POMOCNICZE
 # --------------------------------------------------------------------------------------
 
-def calculate_ct_iso(U_val, Ti_val):
-    """Oblicza Ct wg uproszczonej logiki ISO 4355."""
-    if U_val <= 1.0: return 1.0
-    delta_T = Ti_val - (-5.0) 
-    if delta_T < 0: delta_T = 0
-    redukcja = 0.0025 * (U_val - 1.0) * delta_T
-    ct = 1.0 - redukcja
-    if ct < 0.5: ct = 0.5
-    if ct > 1.0: ct = 1.0
-    return round(ct, 2)
-
-def calculate_mu3(h, b):
-    """
-    Oblicza współczynnik kształtu dachu mu3 wg PN-EN 1991-1-3 (Wzór 5.5).
-    Dla beta <= 60 stopni: mu3 = 0.2 + 10 * (h/b), ale nie więcej niż 2.0.
-    """
-    if b <= 0: return 0.0
-    val = 0.2 + 10.0 * (h / b)
-    if val > 2.0: val = 2.0
-    return val
-
 def get_tangent_angle(x, b, h):
     """Oblicza kąt stycznej do dachu w punkcie x (stopnie)."""
     if b <= 0: return 0.0
@@ -380,7 +320,7 @@ def run():
         disable_strefa = False
 
         if use_city:
-            lista_miast = sorted(list(MIASTA_DB.keys()))
+            lista_miast = locality_names()
             idx_default = lista_miast.index("Warszawa") if "Warszawa" in lista_miast else 0
             wybrane_miasto = st.selectbox("Wybierz miasto:", lista_miast, index=idx_default, key="dwl_city")
             dane_miasta = MIASTA_DB[wybrane_miasto]
@@ -487,22 +427,7 @@ def run():
             oblicz_clicked = True
 
     if oblicz_clicked:
-        sk_calc = 0.0
-        if strefa == "1":
-            formula_val = 0.007 * A - 1.4
-            sk_calc = max(formula_val, 0.7) if A <= 300 else formula_val
-        elif strefa == "2":
-            sk_calc = 0.9 if A <= 300 else 0.007 * A - 1.4
-        elif strefa == "3":
-            formula_val = 0.006 * A - 0.6
-            sk_calc = max(formula_val, 1.2) if A <= 300 else formula_val
-        elif strefa == "4":
-            sk_calc = 1.6 if A <= 300 else 0.006 * A - 0.6
-        elif strefa == "5":
-            formula_val = 0.93 * math.exp(0.00134 * A)
-            sk_calc = max(formula_val, 2.0)
-        
-        sk = round(sk_calc, 3)
+        sk = calculate_sk(strefa, A)
         st.session_state["dwl_sk"] = sk
 
         s_uni_val = 0.8 * current_Ce * Ct_val * sk
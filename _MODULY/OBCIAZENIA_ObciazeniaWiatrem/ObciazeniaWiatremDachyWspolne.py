@@ -0,0 +1,238 @@
+"""
+ObciazeniaWiatremDachyWspolne.py
+Wspólna strona Streamlit kalkulatorów dachów, wiat i ścian wolnostojących wg PN-EN 1991-1-4.
+
+Kalkulatory są konfiguracjami STRONY: listą tablic C_pe z ObciazeniaWiatremRdzen
+(warianty krawędzi, kierunki wiatru) i opisem wymiarów. Wszystkie strefy
+wszystkich kierunków liczone są jednym wywołaniem roof_zone_pressures.
+"""
+
+import sys
+from pathlib import Path
+
+import matplotlib.patches as patches
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from ObciazeniaWiatremRdzen import (  # noqa: E402
+    TABLICE_CPE, TERRAIN_PARAMS, calc_single_qp, get_vb0_value, roof_zone_layout, roof_zone_pressures,
+)
+
+# ======================================================================================
+# 1. KONFIGURACJE KALKULATORÓW
+# ======================================================================================
+STRONY = {
+    "dachy_plaskie": {
+        "warianty": {
+            "Ostre krawędzie": ["plaski_ostre"],
+            "Attyka": ["plaski_attyka"],
+            "Krawędzie zaokrąglone": ["plaski_zaokraglony"],
+            "Krawędzie mansardowe": ["plaski_mansardowy"],
+        },
+    },
+    "dachy_jednospadowe": {
+        "warianty": {"": ["jednospadowy_0", "jednospadowy_180", "jednospadowy_90"]},
+    },
+    "dachy_dwuspadowe": {
+        "warianty": {"": ["dwuspadowy_0", "dwuspadowy_90"]},
+    },
+    "dachy_czterospadowe": {
+        "warianty": {"": ["czterospadowy_0", "czterospadowy_90"]},
+    },
+    "dachy_lukowe": {
+        "warianty": {"": ["lukowy"]},
+        "wysokosc": "Wysokość szczytu $h + f$ [m]",
+    },
+    "kopuly": {
+        "warianty": {"": ["kopula"]},
+        "wysokosc": "Wysokość szczytu $h + f$ [m]",
+    },
+    "wiaty_jednospadowe": {
+        "warianty": {"": ["wiata_jednospadowa", "wiata_jednospadowa_cf"]},
+        "netto": True,
+    },
+    "wiaty_dwuspadowe": {
+        "warianty": {"": ["wiata_dwuspadowa", "wiata_dwuspadowa_cf"]},
+        "netto": True,
+    },
+    "wiaty_wielospadowe": {
+        "warianty": {"": ["wiata_wielospadowa", "wiata_wielospadowa_cf"]},
+        "netto": True,
+    },
+    "sciany_wolnostojace": {
+        "warianty": {
+            "Ściana prosta": ["sciana"],
+            "Ściana z narożnikiem (długość ramienia ≥ h)": ["sciana_naroznik"],
+        },
+        "netto": True,
+    },
+}
+
+# Osie tablic podawane przez użytkownika: etykieta, wartość domyślna, krok
+OSIE = {
+    "hp_h": ("Stosunek $h_p/h$ (attyka)", 0.05, 0.005),
+    "r_h": ("Stosunek $r/h$ (zaokrąglenie)", 0.10, 0.01),
+    "alpha_m": (r"Kąt mansardy $\alpha$ [°]", 45.0, 1.0),
+    "alpha": (r"Kąt nachylenia dachu $\alpha$ [°]", 15.0, 1.0),
+    "alpha_90": (r"Kąt nachylenia połaci szczytowej $\alpha_{90}$ [°]", 15.0, 1.0),
+    "phi": (r"Współczynnik wypełnienia $\varphi$", 1.0, 0.05),
+    "phi_z": (r"Współczynnik zablokowania pod wiatą $\varphi$", 0.0, 0.1),
+    "przeslo": ("Przęsło od krawędzi nawietrznej (3 - trzecie i dalsze)", 1.0, 1.0),
+    "f_d": ("Stosunek strzałki do rozpiętości $f/d$", 0.2, 0.01),
+    "h_d": ("Stosunek wysokości ścian do rozpiętości $h/d$ (≥ 0,5 - jak 0,5)", 0.25, 0.05),
+}
+
+KOLORY_STREF = {
+    "A": "#e57373", "B": "#ffb74d", "C": "#fff176", "D": "#aed581",
+    "F": "#e57373", "Fup": "#e57373", "Flow": "#ef9a9a", "G": "#ffb74d",
+    "H": "#fff176", "I": "#aed581", "J": "#90caf9", "cf": "#cfd8dc",
+}
+
+# ======================================================================================
+# 2. RYSUNEK STREF
+# ======================================================================================
+
+def draw_zone_layout(tablica, b, d, h, we):
+    """Rzut dachu lub wiaty (elewacja ściany wolnostojącej) ze strefami i wartościami w [kN/m²]; we = {strefa: (min, max)}."""
+    t = TABLICE_CPE[tablica]
+    bb, dd = (d, b) if t["obrot"] else (b, d)
+    prost = roof_zone_layout(t["uklad"], bb, dd, h)
+    sciana = t["uklad"] == "sciana"
+
+    fig, ax = plt.subplots(figsize=(5, 3.5))
+    ax.set_aspect("equal")
+    ax.axis("off")
+    for strefa, x, y, dx, dy in prost:
+        ax.add_patch(patches.Rectangle((x, y), dx, dy, facecolor=KOLORY_STREF.get(strefa, "#eeeeee"),
+                                       edgecolor="black", lw=0.8))
+        w_min, w_max = we[strefa]
+        opis = f"{w_min:.2f}" if abs(w_max - w_min) < 1e-9 else f"{w_min:.2f}\n{w_max:+.2f}"
+        rozmiar = 7 if min(dx, dy) > 0.08 * max(bb, dd, h) else 5
+        ax.text(x + dx / 2, y + dy / 2, f"{strefa}\n{opis}", ha="center", va="center", fontsize=rozmiar)
+
+    szer, wys = (bb, h) if sciana else (dd, bb)
+    if not sciana:
+        ax.annotate("", xy=(0, -0.12 * wys), xytext=(-0.25 * szer, -0.12 * wys),
+                    arrowprops=dict(arrowstyle="->", color="#1f77b4", lw=1.5))
+        ax.text(-0.125 * szer, -0.08 * wys, "wiatr", color="#1f77b4", ha="center", fontsize=8)
+    ax.set_xlim(-0.3 * szer, 1.05 * szer)
+    ax.set_ylim(-0.2 * wys, 1.05 * wys)
+    plt.tight_layout()
+    return fig
+
+# ======================================================================================
+# 3. STRONA
+# ======================================================================================
+
+def render_roof_page(klucz):
+    """Strona kalkulatora wg konfiguracji STRONY[klucz] (klucz jest też prefiksem kluczy widżetów)."""
+    cfg = STRONY[klucz]
+    netto = cfg.get("netto", False)
+
+    st.markdown("### DANE WEJŚCIOWE")
+    col1, col2, col3 = st.columns([0.3, 0.35, 0.35])
+
+    with col1:
+        strefa = st.selectbox("Strefa obciążenia wiatrem", options=["1", "2", "3"], key=f"{klucz}_strefa")
+        A = st.number_input("Wysokość nad poziomem morza $A$ [m]", value=200.0, step=10.0, format="%.1f", key=f"{klucz}_A")
+        vb0 = get_vb0_value(strefa, A)
+        st.number_input("Wartość podstawowa $v_{b,0}$ [m/s]", value=vb0, disabled=True, format="%.2f", key=f"{klucz}_vb0_{strefa}_{A}")
+        kat_terenu = st.selectbox("Kategoria terenu", options=list(TERRAIN_PARAMS), index=2, key=f"{klucz}_teren")
+
+    with col2:
+        c_season = st.number_input("Współczynnik sezonowy $c_{season}$", value=1.0, step=0.01, format="%.2f", key=f"{klucz}_cseason")
+        c_dir = st.number_input("Współczynnik kierunkowy $c_{dir}$", value=1.0, step=0.05, format="%.2f", key=f"{klucz}_cdir")
+        area = st.number_input(
+            "Pole obciążone $A_{obc}$ [m²]", value=10.0, min_value=0.1, step=1.0, key=f"{klucz}_area",
+            disabled=netto, help="C_pe,1 dla A ≤ 1 m², C_pe,10 dla A ≥ 10 m², pomiędzy - interpolacja po log10 A.",
+        )
+
+    with col3:
+        warianty = cfg["warianty"]
+        wariant = list(warianty)[0]
+        if len(warianty) > 1:
+            wariant = st.radio("Wariant", list(warianty), key=f"{klucz}_wariant")
+        tablice = warianty[wariant]
+
+        c3_1, c3_2, c3_3 = st.columns(3)
+        if TABLICE_CPE[tablice[0]]["uklad"] == "sciana":
+            with c3_1:
+                b = st.number_input("Długość $l$ [m]", value=20.0, min_value=0.1, step=1.0, key=f"{klucz}_l")
+            with c3_2:
+                h = st.number_input("Wysokość $h$ [m]", value=2.0, min_value=0.1, step=0.1, key=f"{klucz}_h")
+            d = 0.0
+        else:
+            with c3_1:
+                b = st.number_input("Szerokość $b$ [m]", value=20.0, min_value=0.1, step=1.0, key=f"{klucz}_b",
+                                    help="Wymiar prostopadły do kierunku wiatru θ = 0°.")
+            with c3_2:
+                d = st.number_input("Głębokość $d$ [m]", value=15.0, min_value=0.1, step=1.0, key=f"{klucz}_d",
+                                    help="Wymiar równoległy do kierunku wiatru θ = 0°.")
+            with c3_3:
+                h = st.number_input(cfg.get("wysokosc", "Wysokość $h$ [m]"), value=10.0, min_value=0.1, step=0.5,
+                                    key=f"{klucz}_h")
+
+        osie = {}
+        for nazwa in dict.fromkeys(n for t in tablice for n in TABLICE_CPE[t]["osie"] if n in OSIE):
+            etykieta, domyslna, krok = OSIE[nazwa]
+            zakres = next(TABLICE_CPE[t]["osie"][nazwa] for t in tablice if nazwa in TABLICE_CPE[t]["osie"])
+            osie[nazwa] = st.number_input(etykieta, value=domyslna, min_value=float(zakres[0]), max_value=float(zakres[-1]),
+                                          step=krok, key=f"{klucz}_{nazwa}")
+        if "alpha" in osie and abs(osie["alpha"]) < 5.0 and not netto:
+            st.warning("Dla $|\\alpha| < 5°$ dach należy traktować jak dach płaski.")
+
+    b1, b2, b3 = st.columns([1, 2, 1])
+    with b2:
+        oblicz_clicked = st.button("OBLICZ", type="primary", use_container_width=True, key=f"{klucz}_btn")
+
+    if not oblicz_clicked:
+        return
+
+    vb = c_dir * c_season * vb0
+    qp = calc_single_qp(h, kat_terenu, vb)
+    wyniki = roof_zone_pressures(tablice, b, d, h, qp, area=area, **osie)
+    cpe10 = roof_zone_pressures(tablice, b, d, h, qp, area=10.0, **osie)
+    cpe1 = roof_zone_pressures(tablice, b, d, h, qp, area=1.0, **osie)
+
+    st.markdown("### WYNIKI")
+    st.markdown(f"Wartość szczytowa ciśnienia prędkości na wysokości $z_e = h = {h:.2f}$ m: "
+                f"$q_p = {qp:.3f}$ kN/m² ($v_b = {vb:.2f}$ m/s)")
+    if "l_h" in TABLICE_CPE[tablice[0]]["osie"]:
+        st.caption(f"Stosunek $l/h = {b / h:.2f}$ (tablica dla $l/h$ od 3 do 10, poza zakresem - wartości skrajne).")
+
+    for nazwa, df in wyniki.groupby("tablica", sort=False):
+        t = TABLICE_CPE[nazwa]
+        st.markdown(f"#### {t['opis']}" + ("" if netto else f", {t['kierunek']}"))
+        r1, r2 = st.columns([0.45, 0.55])
+        with r1:
+            if t["uklad"] is None:
+                st.caption("Rozmieszczenie stref - wg rysunku normy podanego w opisie tablicy.")
+            else:
+                we = {s: (lo, hi) for s, lo, hi in zip(df["strefa"], df["we_min"], df["we_max"])}
+                st.pyplot(draw_zone_layout(nazwa, b, d, h, we), use_container_width=True)
+        with r2:
+            if netto and (df["cpe_min"] == df["cpe_max"]).all():
+                tabela = pd.DataFrame({
+                    "Strefa": df["strefa"], "A strefy [m²]": df["A_strefy"],
+                    "c_p,net": df["cpe_max"], "w [kN/m²]": df["we_max"],
+                })
+            elif netto:
+                tabela = pd.DataFrame({
+                    "Strefa": df["strefa"], "A strefy [m²]": df["A_strefy"],
+                    "c min": df["cpe_min"], "c max": df["cpe_max"],
+                    "w min [kN/m²]": df["we_min"], "w max [kN/m²]": df["we_max"],
+                })
+            else:
+                tabela = pd.DataFrame({
+                    "Strefa": df["strefa"], "A strefy [m²]": df["A_strefy"],
+                    "Cpe,10 min": cpe10.loc[df.index, "cpe_min"], "Cpe,10 max": cpe10.loc[df.index, "cpe_max"],
+                    "Cpe,1 min": cpe1.loc[df.index, "cpe_min"], "Cpe,1 max": cpe1.loc[df.index, "cpe_max"],
+                    "Cpe min": df["cpe_min"], "Cpe max": df["cpe_max"],
+                    "we min [kN/m²]": df["we_min"], "we max [kN/m²]": df["we_max"],
+                })
+            st.dataframe(tabela.style.format(precision=2), use_container_width=True, hide_index=True)
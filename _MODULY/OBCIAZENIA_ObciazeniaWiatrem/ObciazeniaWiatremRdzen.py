@@ -0,0 +1,586 @@
+"""
+ObciazeniaWiatremRdzen.py
+Wspólny rdzeń obliczeń obciążenia wiatrem wg PN-EN 1991-1-4 (bez interfejsu Streamlit).
+
+Funkcje przyjmują skalary lub tablice NumPy (broadcasting); dla argumentów
+skalarnych zwracają float. Profile q_p(z) są buforowane per
+(kategoria terenu, v_b, z_max, liczba punktów). Współczynniki C_pe dachów
+oraz c_p,net i c_f wiat i ścian wolnostojących pochodzą z tablic TABLICE_CPE
+(siatki NumPy).
+"""
+
+import itertools
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+TERRAIN_PARAMS = {
+    "0":   {"z0": 0.003, "zmin": 1.0,  "opis": "Obszary morskie, przybrzeżne wystawione na otwarte morze"},
+    "I":   {"z0": 0.01,  "zmin": 1.0,  "opis": "Jeziora, tereny płaskie poziome, zaniedbywalna roślinność, brak przeszkód"},
+    "II":  {"z0": 0.05,  "zmin": 2.0,  "opis": "Niska roślinność (trawa), izolowane przeszkody (drzewa, zabudowania) w odległości > 20h"},
+    "III": {"z0": 0.30,  "zmin": 5.0,  "opis": "Regularne pokrycie roślinnością/budynkami, izolowane przeszkody w odległości < 20h (wsie, przedmieścia, lasy)"},
+    "IV":  {"z0": 1.00,  "zmin": 10.0, "opis": "Obszary, na których min. 15% powierzchni pokrywają budynki o h > 15m"}
+}
+
+Z0_II = 0.05
+RHO = 1.25
+K_I = 1.0
+
+# Współczynnik kierunkowy c_dir [strefa 1-3, sektor 0°, 30°, ..., 330°] wg PN-EN 1991-1-4/NA
+SEKTORY = np.arange(0, 360, 30)
+CDIR_TABLICA = np.array([
+    [0.8, 0.8, 0.8, 0.8, 0.7, 0.7, 0.9, 1.0, 1.0, 1.0, 0.9, 0.8],
+    [1.0, 1.0, 0.8, 0.8, 0.7, 0.7, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0],
+    [0.8, 0.8, 0.8, 0.8, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 0.9, 0.8],
+])
+
+STREFY_SCIAN = ("A", "B", "C", "D", "E")
+
+# Parametry kategorii terenu w tablicach: z0, zmin, kr (4.5)
+_KATEGORIE = list(TERRAIN_PARAMS)
+_TEREN = np.array([
+    [p["z0"], p["zmin"], 0.19 * ((p["z0"] / Z0_II) ** 0.07)] for p in TERRAIN_PARAMS.values()
+])
+
+
+def _out(value, decimals=None):
+    # Skalar -> float (zaokrąglenie jak round), tablica -> ndarray
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return round(value.item(), decimals) if decimals is not None else value.item()
+    return np.round(value, decimals) if decimals is not None else value
+
+
+def terrain_arrays(terrain_cat):
+    """(z0, zmin, kr) dla kategorii terenu (nazwa lub tablica nazw)."""
+    if isinstance(terrain_cat, str):
+        z0, zmin, kr = _TEREN[_KATEGORIE.index(terrain_cat)]
+        return z0, zmin, kr
+    cats = np.asarray(terrain_cat)
+    try:
+        idx = np.array([_KATEGORIE.index(str(c)) for c in cats.ravel()], dtype=int).reshape(cats.shape)
+    except ValueError:
+        raise ValueError(f"Nieznana kategoria terenu: {sorted(set(map(str, cats.ravel())) - set(_KATEGORIE))}")
+    return _TEREN[idx, 0], _TEREN[idx, 1], _TEREN[idx, 2]
+
+
+# ==============================================================================
+# PRĘDKOŚĆ I CIŚNIENIE PRĘDKOŚCI WIATRU
+# ==============================================================================
+
+def get_vb0_value(strefa, A):
+    """Wartość podstawowa bazowej prędkości wiatru v_b,0 [m/s] dla strefy ("1"-"3") i wysokości A [m n.p.m.]."""
+    strefa = np.asarray(strefa).astype(str)
+    A = np.asarray(A, dtype=float)
+    gory = np.where(A <= 300, 22.0, 22.0 * (1.0 + 0.0006 * (A - 300.0)))
+    return _out(np.select([strefa == "1", strefa == "2", strefa == "3"], [gory, 26.0, gory], default=22.0))
+
+
+def get_cdir_value_from_table(strefa, angle):
+    """Współczynnik kierunkowy c_dir dla strefy ("1"-"3") i kierunku wiatru [°] (sektory co 30°)."""
+    strefa = np.asarray(strefa).astype(str)
+    sektor = np.round(np.asarray(angle, dtype=float) / 30.0).astype(int) % len(SEKTORY)
+    wiersz = np.select([strefa == "1", strefa == "2", strefa == "3"], [0, 1, 2], default=-1)
+    return _out(np.where(wiersz >= 0, CDIR_TABLICA[np.maximum(wiersz, 0), sektor], 1.0))
+
+
+def peak_velocity_pressure(z, terrain_cat, vb, co=1.0):
+    """
+    Wartość szczytowa ciśnienia prędkości q_p(z) [kN/m²] wg PN-EN 1991-1-4 (4.8).
+    z, terrain_cat i vb mogą być tablicami (broadcasting), np. z[:, None]
+    z kategoriami i v_b wielu lokalizacji [None, :] daje macierz wysokość x lokalizacja.
+    """
+    z0, zmin, kr = terrain_arrays(terrain_cat)
+    ln_z = np.log(np.maximum(np.asarray(z, dtype=float), zmin) / z0)
+    vm = kr * ln_z * co * np.asarray(vb, dtype=float)
+    Iv = K_I / (co * ln_z)
+    return _out((1.0 + 7.0 * Iv) * 0.5 * RHO * (vm ** 2) / 1000.0)
+
+
+def calc_single_qp(z_val, terrain_cat, vb):
+    """q_p [kN/m²] na jednej wysokości z_val [m]."""
+    return float(peak_velocity_pressure(z_val, terrain_cat, vb))
+
+
+@lru_cache(maxsize=256)
+def _wind_profile(z_max, terrain_cat, vb, num_points):
+    heights = np.linspace(0.0, z_max, num_points)
+    qp_values = peak_velocity_pressure(heights, terrain_cat, vb)
+    heights.flags.writeable = False
+    qp_values.flags.writeable = False
+    return heights, qp_values
+
+
+def calc_wind_profile(z_max, terrain_cat, vb, num_points=100):
+    """Profil q_p(z) na num_points wysokościach 0..z_max: (wysokości, q_p, zmin). Tablice tylko do odczytu."""
+    heights, qp_values = _wind_profile(float(z_max), terrain_cat, float(vb), int(num_points))
+    return heights, qp_values, TERRAIN_PARAMS[terrain_cat]["zmin"]
+
+
+def site_qp_matrix(heights, terrain_cats, vbs):
+    """Macierz q_p [kN/m²] o wymiarach (len(heights), len(lokalizacje)) - wiele kondygnacji i lokalizacji naraz."""
+    heights = np.asarray(heights, dtype=float)
+    return np.atleast_2d(peak_velocity_pressure(
+        heights[:, None], np.asarray(terrain_cats)[None, :], np.asarray(vbs, dtype=float)[None, :]
+    ))
+
+
+# ==============================================================================
+# ŚCIANY PIONOWE - WSZYSTKIE KIERUNKI, STREFY I PASY WYSOKOŚCI
+# ==============================================================================
+
+def wall_cpe(h, d):
+    """
+    Współczynniki C_pe,10 i C_pe,1 stref A-E ścian (Tablica 7.1) dla h/d (tablice).
+    Zwraca (cpe10, cpe1) o wymiarach (..., 5).
+    """
+    ratio = np.asarray(h, dtype=float) / np.asarray(d, dtype=float)
+    cpe_D = np.round(np.interp(ratio, [0.25, 1.0], [0.7, 0.8]), 2)
+    cpe_E = np.round(np.interp(ratio, [0.25, 1.0, 5.0], [-0.3, -0.5, -0.7]), 2)
+    stale = np.ones_like(ratio)
+    cpe10 = np.stack([-1.2 * stale, -0.8 * stale, -0.5 * stale, cpe_D, cpe_E], axis=-1)
+    cpe1 = np.stack([-1.4 * stale, -1.1 * stale, -0.5 * stale, cpe_D, cpe_E], axis=-1)
+    return cpe10, cpe1
+
+
+def get_cpe_full(h, d):
+    """C_pe stref A-E dla jednego budynku: {strefa: (cpe10, cpe1)}."""
+    cpe10, cpe1 = wall_cpe(h, d)
+    return {zone: (float(c10), float(c1)) for zone, c10, c1 in zip(STREFY_SCIAN, cpe10, cpe1)}
+
+
+def windward_reference_height(z, h, b):
+    """
+    Wysokość odniesienia z_e pasa ściany nawietrznej o górnej krawędzi z (Rys. 7.4):
+    h <= b: z_e = h; dolny pas do b: z_e = b; górny pas od h - b: z_e = h; pasy pośrednie: z_e = z.
+    """
+    z, h, b = (np.asarray(v, dtype=float) for v in (z, h, b))
+    return np.where(h <= b, h, np.where(z <= b, b, np.where(z > h - b, h, z)))
+
+
+def wall_height_strips(h, b):
+    """Górne krawędzie pasów ściany nawietrznej wg Rys. 7.4 (pasy pośrednie o wysokości <= b)."""
+    if h <= b:
+        return np.array([h])
+    if h <= 2 * b:
+        return np.array([b, h])
+    n_mid = int(np.ceil((h - 2 * b) / b))
+    return np.concatenate([[b], np.linspace(b, h - b, n_mid + 1)[1:], [h]])
+
+
+def wall_pressure_matrix(b, d, h, strefa, A, terrain_cat, c_season=1.0, orientation=0.0,
+                         z_strips=None, cpe="10"):
+    """
+    Ciśnienie zewnętrzne w_e = q_p(z_e) C_pe [kN/m²] na ściany budynku prostopadłościennego
+    dla wszystkich 12 sektorów wiatru, stref A-E i pasów wysokości - jedno obliczenie tablicowe.
+
+    Ściana o szerokości b ma normalną skierowaną na azymut orientation [°]; wiatr z sektora s
+    przyjmowany jest jako prostopadły do ściany o najbliższej normalnej (wymiary b/d zamieniane
+    co 90°). z_strips - górne krawędzie pasów [m] (domyślnie pasy z Rys. 7.4 dla obu układów).
+    Strefa D: z_e wg Rys. 7.4, strefy A, B, C, E: z_e = h. Strefy nieistniejące
+    (B dla e >= 5d, C dla e >= d) mają w_e = 0 i istnieje = False.
+
+    Zwraca słownik: sektory, strefy, z, c_dir, vb [12], sciana [12] (0-3), ze [12, nz],
+    istnieje [12, 5], we [12, 5, nz].
+    """
+    sciana = np.round((SEKTORY - orientation) / 90.0).astype(int) % 4
+    b_s = np.where(sciana % 2 == 0, b, d)
+    d_s = np.where(sciana % 2 == 0, d, b)
+    if z_strips is None:
+        z_strips = np.unique(np.concatenate([wall_height_strips(h, b), wall_height_strips(h, d)]))
+    z = np.asarray(z_strips, dtype=float)
+
+    c_dir = np.asarray(get_cdir_value_from_table(strefa, SEKTORY))
+    vb = c_dir * c_season * get_vb0_value(strefa, A)
+    ze = windward_reference_height(z[None, :], h, b_s[:, None])
+    qp_D = peak_velocity_pressure(ze, terrain_cat, vb[:, None])
+    qp_h = peak_velocity_pressure(h, terrain_cat, vb)
+
+    cpe10, cpe1 = wall_cpe(h, d_s)
+    c = cpe10 if cpe == "10" else cpe1
+    e = np.minimum(b_s, 2.0 * h)
+    istnieje = np.column_stack([np.ones(12, bool), d_s > e / 5.0, d_s > e, np.ones(12, bool), np.ones(12, bool)])
+
+    qp = np.broadcast_to(qp_h[:, None, None], (12, 5, len(z))).copy()
+    qp[:, 3, :] = qp_D
+    we = np.where(istnieje[:, :, None], qp * c[:, :, None], 0.0)
+    return {
+        "sektory": SEKTORY, "strefy": STREFY_SCIAN, "z": z, "c_dir": c_dir, "vb": vb,
+        "sciana": sciana, "ze": ze, "istnieje": istnieje, "we": we,
+    }
+
+
+def wall_pressure_envelope(matrix):
+    """
+    Obwiednia po kierunkach: (we_max, we_min, sektor_max, sektor_min) o wymiarach [5, nz],
+    tylko z kierunków, w których strefa istnieje. Strefa nieistniejąca w żadnym kierunku: NaN, sektor -1.
+    """
+    we = matrix["we"]
+    istnieje = matrix["istnieje"][:, :, None]
+    i_max = np.where(istnieje, we, -np.inf).argmax(axis=0)
+    i_min = np.where(istnieje, we, np.inf).argmin(axis=0)
+    obecna = matrix["istnieje"].any(axis=0)[:, None]
+    we_max = np.where(obecna, np.take_along_axis(we, i_max[None], axis=0)[0], np.nan)
+    we_min = np.where(obecna, np.take_along_axis(we, i_min[None], axis=0)[0], np.nan)
+    return we_max, we_min, np.where(obecna, SEKTORY[i_max], -1), np.where(obecna, SEKTORY[i_min], -1)
+
+
+# ==============================================================================
+# DACHY, WIATY I ŚCIANY WOLNOSTOJĄCE - TABLICE C_pe
+# ==============================================================================
+
+def _c(ssanie, parcie=None):
+    # Komórka tablicy (cpe10_min, cpe1_min, cpe10_max, cpe1_max); liczba oznacza C_pe,10 = C_pe,1,
+    # brak drugiej wartości - min = max
+    s10, s1 = ssanie if isinstance(ssanie, tuple) else (ssanie, ssanie)
+    if parcie is None:
+        return (s10, s1, s10, s1)
+    p10, p1 = parcie if isinstance(parcie, tuple) else (parcie, parcie)
+    return (s10, s1, p10, p1)
+
+
+def _wiata(maks, min_0, min_1):
+    # Komórki wiaty (oś alpha, oś phi_z = 0 i 1): c_p,net max niezależne od zablokowania φ
+    return [[_c(s0, p), _c(s1, p)] for p, s0, s1 in zip(maks, min_0, min_1)]
+
+
+def _tablica(opis, kierunek, uklad, osie, strefy, obrot=False):
+    """
+    Tablica współczynników: osie {nazwa: wartości}, strefy {strefa: komórki _c o kształcie osi}.
+    Wartości zapisywane są jako siatka (*osie, strefa, 4). obrot - układ stref dla zamienionych b i d,
+    uklad None - tablica bez rysunku stref (rozmieszczenie wg rysunku normy podanego w opisie).
+    """
+    return {
+        "opis": opis,
+        "kierunek": kierunek,
+        "uklad": uklad,
+        "obrot": obrot,
+        "osie": {nazwa: np.asarray(v, dtype=float) for nazwa, v in osie.items()},
+        "strefy": tuple(strefy),
+        "wartosci": np.stack([np.asarray(v, dtype=float) for v in strefy.values()], axis=-2),
+    }
+
+
+_I_PLASKI = _c(-0.2, 0.2)
+_NACHYLENIA_JEDNOSPADOWE = [5, 15, 30, 45, 60, 75]
+_NACHYLENIA_DWUSPADOWE = [-45, -30, -15, -5, 5, 15, 30, 45, 60, 75]
+_NACHYLENIA_WIAT_JEDNOSPADOWYCH = [0, 5, 10, 15, 20, 25, 30]
+_NACHYLENIA_WIAT_DWUSPADOWYCH = [-20, -15, -10, -5, 5, 10, 15, 20, 25, 30]
+
+# Tablica 7.5 - dachy czterospadowe; kąt α0 dla θ = 0°, α90 dla θ = 90°
+_CZTEROSPADOWY = {
+    "F": [_c((-1.7, -2.5), 0.0), _c((-0.9, -2.0), 0.2), _c((-0.5, -1.5), 0.5), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+    "G": [_c((-1.2, -2.0), 0.0), _c((-0.8, -1.5), 0.2), _c((-0.5, -1.5), 0.7), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+    "H": [_c((-0.6, -1.2), 0.0), _c(-0.3, 0.2), _c(-0.2, 0.4), _c(-0.0, 0.6), _c(0.7), _c(0.8)],
+    "I": [_c(-0.3), _c(-0.5), _c(-0.4), _c(-0.3), _c(-0.3), _c(-0.3)],
+    "J": [_c(-0.6), _c((-1.0, -1.5)), _c((-0.7, -1.2)), _c(-0.6), _c(-0.6), _c(-0.6)],
+    "K": [_c(-0.6), _c((-1.2, -2.0)), _c(-0.5), _c(-0.3), _c(-0.3), _c(-0.3)],
+    "L": [_c((-1.2, -2.0)), _c((-1.4, -2.0)), _c((-1.4, -2.0)), _c((-1.3, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0))],
+    "M": [_c((-0.6, -1.2)), _c((-0.6, -1.2)), _c((-0.8, -1.2)), _c((-0.8, -1.2)), _c(-0.4), _c(-0.4)],
+    "N": [_c(-0.4), _c(-0.3), _c(-0.2), _c(-0.2), _c(-0.2), _c(-0.2)],
+}
+
+# Tablice 7.6 i 7.7 - wiaty: c_f (siła całkowita) oraz c_p,net stref; max, min dla φ = 0, min dla φ = 1
+_WIATA_JEDNOSPADOWA = {
+    "cf": _wiata([0.2, 0.4, 0.5, 0.7, 0.8, 1.0, 1.2], [-0.5, -0.7, -0.9, -1.1, -1.3, -1.6, -1.8],
+                 [-1.3, -1.4, -1.4, -1.4, -1.4, -1.4, -1.4]),
+    "A": _wiata([0.5, 0.8, 1.2, 1.4, 1.7, 2.0, 2.2], [-0.6, -1.1, -1.5, -1.8, -2.2, -2.6, -3.0],
+                [-1.5, -1.6, -2.1, -1.6, -1.6, -1.5, -1.5]),
+    "B": _wiata([1.8, 2.1, 2.4, 2.7, 2.9, 3.1, 3.2], [-1.3, -1.7, -2.0, -2.4, -2.8, -3.2, -3.8],
+                [-1.8, -2.2, -2.6, -2.9, -2.9, -2.5, -2.2]),
+    "C": _wiata([1.1, 1.3, 1.6, 1.8, 2.1, 2.3, 2.4], [-1.4, -1.8, -2.1, -2.5, -2.9, -3.2, -3.6],
+                [-2.2, -2.5, -2.7, -3.0, -3.0, -2.8, -2.7]),
+}
+_WIATA_DWUSPADOWA = {
+    "cf": _wiata([0.7, 0.5, 0.4, 0.3, 0.3, 0.4, 0.4, 0.6, 0.7, 0.9],
+                 [-0.7, -0.6, -0.6, -0.5, -0.6, -0.7, -0.8, -0.9, -1.0, -1.0],
+                 [-0.9, -0.8, -0.8, -0.8, -0.9, -1.1, -1.2, -1.3, -1.4, -1.4]),
+    "A": _wiata([0.8, 0.6, 0.6, 0.5, 0.6, 0.7, 0.9, 1.1, 1.2, 1.3],
+                [-0.9, -0.8, -0.8, -0.7, -0.6, -0.7, -0.9, -1.2, -1.4, -1.4],
+                [-1.5, -1.6, -1.6, -1.5, -1.3, -1.4, -1.4, -1.4, -1.4, -1.4]),
+    "B": _wiata([1.6, 1.5, 1.4, 1.5, 1.8, 1.8, 1.9, 1.9, 1.9, 1.9],
+                [-1.3, -1.3, -1.3, -1.3, -1.4, -1.5, -1.7, -1.8, -1.9, -1.9],
+                [-2.4, -2.7, -2.7, -2.4, -2.0, -2.0, -2.2, -2.2, -2.0, -1.8]),
+    "C": _wiata([0.6, 0.7, 0.8, 0.8, 1.3, 1.4, 1.4, 1.5, 1.6, 1.6],
+                [-1.6, -1.6, -1.5, -1.6, -1.4, -1.4, -1.4, -1.4, -1.4, -1.4],
+                [-2.4, -2.6, -2.6, -2.4, -1.8, -1.8, -1.6, -1.6, -1.5, -1.4]),
+    "D": _wiata([1.7, 1.4, 1.1, 0.8, 0.4, 0.4, 0.4, 0.4, 0.5, 0.7],
+                [-0.6, -0.6, -0.6, -0.6, -1.1, -1.4, -1.8, -2.0, -2.0, -2.0],
+                [-0.6, -0.6, -0.6, -0.6, -1.5, -1.8, -2.1, -2.1, -2.0, -2.0]),
+}
+_OSIE_WIAT_JEDNOSPADOWYCH = {"alpha": _NACHYLENIA_WIAT_JEDNOSPADOWYCH, "phi_z": [0.0, 1.0]}
+_OSIE_WIAT_DWUSPADOWYCH = {"alpha": _NACHYLENIA_WIAT_DWUSPADOWYCH, "phi_z": [0.0, 1.0]}
+
+# Rys. 7.11 i 7.12 - dachy łukowe i kopuły: C_pe,10 odczytane z wykresów w punktach załamania
+# (oś f_d = f/d, oś h_d = h/d: 0 oraz >= 0,5, pomiędzy - interpolacja liniowa). Dla dachu łukowego
+# i 0,2 <= f/d <= 0,3 przy h/d >= 0,5 strefa A ma dwie wartości (min, max).
+_LUKOWY = {
+    "A": [[_c(0.0), _c(-1.2)], [_c(0.32), _c(-0.4, 0.32)], [_c(0.48), _c(0.0, 0.48)], [_c(0.8), _c(0.8)]],
+    "B": [[_c(-0.8)] * 2, [_c(-0.96)] * 2, [_c(-1.04)] * 2, [_c(-1.2)] * 2],
+    "C": [[_c(-0.4)] * 2] * 4,
+}
+_KOPULA = {
+    "A": [[_c(0.0), _c(-0.8)], [_c(0.8), _c(0.6)]],
+    "B": [[_c(-0.4), _c(-0.8)], [_c(-1.2), _c(-1.2)]],
+    "C": [[_c(0.0), _c(-0.4)], [_c(-0.4), _c(-0.4)]],
+}
+
+# Tablica 7.8 - współczynniki ψ_mc (na min, na max) dla przęsła skrajnego, drugiego i kolejnych
+PSI_MC = np.array([[0.8, 1.0], [0.7, 0.9], [0.7, 0.7]])
+
+
+def _przesla(tablica, opis):
+    # Tablica wiaty wielospadowej: wiata dwuspadowa z dodatkową osią "przeslo" (1, 2, 3 i dalsze),
+    # komórki min mnożone przez ψ_mc na min, komórki max - przez ψ_mc na max
+    psi = PSI_MC[:, [0, 0, 1, 1]][:, None, :]
+    return {
+        **tablica,
+        "opis": opis,
+        "osie": {**tablica["osie"], "przeslo": np.arange(1.0, len(PSI_MC) + 1.0)},
+        "wartosci": tablica["wartosci"][..., None, :, :] * psi,
+    }
+
+
+TABLICE_CPE = {
+    # Tablica 7.2 - dachy płaskie
+    "plaski_ostre": _tablica("Tablica 7.2 - dach płaski, ostre krawędzie", "θ = 0°", "plaski", {}, {
+        "F": _c((-1.8, -2.5)), "G": _c((-1.2, -2.0)), "H": _c((-0.7, -1.2)), "I": _I_PLASKI,
+    }),
+    "plaski_attyka": _tablica("Tablica 7.2 - dach płaski z attyką", "θ = 0°", "plaski", {"hp_h": [0.025, 0.05, 0.10]}, {
+        "F": [_c((-1.6, -2.2)), _c((-1.4, -2.0)), _c((-1.2, -1.8))],
+        "G": [_c((-1.1, -1.8)), _c((-0.9, -1.6)), _c((-0.8, -1.4))],
+        "H": [_c((-0.7, -1.2))] * 3,
+        "I": [_I_PLASKI] * 3,
+    }),
+    "plaski_zaokraglony": _tablica("Tablica 7.2 - dach płaski, krawędzie zaokrąglone", "θ = 0°", "plaski",
+                                   {"r_h": [0.05, 0.10, 0.20]}, {
+        "F": [_c((-1.0, -1.5)), _c((-0.7, -1.2)), _c((-0.5, -0.8))],
+        "G": [_c((-1.2, -1.8)), _c((-0.8, -1.4)), _c((-0.5, -0.8))],
+        "H": [_c(-0.4), _c(-0.3), _c(-0.3)],
+        "I": [_I_PLASKI] * 3,
+    }),
+    "plaski_mansardowy": _tablica("Tablica 7.2 - dach płaski, krawędzie mansardowe", "θ = 0°", "plaski",
+                                  {"alpha_m": [30, 45, 60]}, {
+        "F": [_c((-1.0, -1.5)), _c((-1.2, -1.8)), _c((-1.3, -1.9))],
+        "G": [_c((-1.0, -1.5)), _c((-1.3, -1.9)), _c((-1.3, -1.9))],
+        "H": [_c(-0.3), _c(-0.4), _c(-0.5)],
+        "I": [_I_PLASKI] * 3,
+    }),
+    # Tablica 7.3a/b - dachy jednospadowe
+    "jednospadowy_0": _tablica("Tablica 7.3a - dach jednospadowy", "θ = 0°", "jednospadowy",
+                               {"alpha": _NACHYLENIA_JEDNOSPADOWE}, {
+        "F": [_c((-1.7, -2.5), 0.0), _c((-0.9, -2.0), 0.2), _c((-0.5, -1.5), 0.7), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+        "G": [_c((-1.2, -2.0), 0.0), _c((-0.8, -1.5), 0.2), _c((-0.5, -1.5), 0.7), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+        "H": [_c((-0.6, -1.2), 0.0), _c(-0.3, 0.2), _c(-0.2, 0.4), _c(-0.0, 0.6), _c(0.7), _c(0.8)],
+    }),
+    "jednospadowy_180": _tablica("Tablica 7.3a - dach jednospadowy", "θ = 180°", "jednospadowy",
+                                 {"alpha": _NACHYLENIA_JEDNOSPADOWE}, {
+        "F": [_c((-2.3, -2.5)), _c((-2.5, -2.8)), _c((-1.1, -2.3)), _c((-0.6, -1.3)), _c((-0.5, -1.0)), _c((-0.5, -1.0))],
+        "G": [_c((-1.3, -2.0)), _c((-1.3, -2.0)), _c((-0.8, -1.5)), _c(-0.5), _c(-0.5), _c(-0.5)],
+        "H": [_c((-0.8, -1.2)), _c((-0.9, -1.2)), _c(-0.8), _c(-0.7), _c(-0.5), _c(-0.5)],
+    }),
+    "jednospadowy_90": _tablica("Tablica 7.3b - dach jednospadowy", "θ = 90°", "jednospadowy_90",
+                                {"alpha": _NACHYLENIA_JEDNOSPADOWE}, {
+        "Fup": [_c((-2.1, -2.6)), _c((-2.4, -2.9)), _c((-2.1, -2.9)), _c((-1.5, -2.4)), _c((-1.2, -2.0)), _c((-1.2, -2.0))],
+        "Flow": [_c((-2.1, -2.4)), _c((-1.6, -2.4)), _c((-1.3, -2.0)), _c((-1.3, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0))],
+        "G": [_c((-1.8, -2.0)), _c((-1.9, -2.5)), _c((-1.5, -2.0)), _c((-1.4, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0))],
+        "H": [_c((-0.6, -1.2)), _c((-0.8, -1.2)), _c((-1.0, -1.3)), _c((-1.0, -1.3)), _c((-1.0, -1.3)), _c((-1.0, -1.3))],
+        "I": [_c(-0.5), _c((-0.7, -1.2)), _c((-0.8, -1.2)), _c((-0.9, -1.2)), _c((-0.7, -1.2)), _c(-0.5)],
+    }, obrot=True),
+    # Tablica 7.4a/b - dachy dwuspadowe (nachylenia ujemne - dachy odwrócone)
+    "dwuspadowy_0": _tablica("Tablica 7.4a - dach dwuspadowy", "θ = 0°", "dwuspadowy",
+                             {"alpha": _NACHYLENIA_DWUSPADOWE}, {
+        "F": [_c(-0.6), _c((-1.1, -2.0)), _c((-2.5, -2.8)), _c((-2.3, -2.5)), _c((-1.7, -2.5), 0.0),
+              _c((-0.9, -2.0), 0.2), _c((-0.5, -1.5), 0.7), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+        "G": [_c(-0.6), _c((-0.8, -1.5)), _c((-1.3, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0), 0.0),
+              _c((-0.8, -1.5), 0.2), _c((-0.5, -1.5), 0.7), _c(-0.0, 0.7), _c(0.7), _c(0.8)],
+        "H": [_c(-0.8), _c(-0.8), _c((-0.9, -1.2)), _c((-0.8, -1.2)), _c((-0.6, -1.2), 0.0),
+              _c(-0.3, 0.2), _c(-0.2, 0.4), _c(-0.0, 0.6), _c(0.7), _c(0.8)],
+        "I": [_c(-0.7), _c(-0.6), _c(-0.5), _c(-0.6, 0.2), _c(-0.6, 0.2),
+              _c(-0.4, 0.0), _c(-0.4, 0.0), _c(-0.2, 0.0), _c(-0.2), _c(-0.2)],
+        "J": [_c((-1.0, -1.5)), _c((-0.8, -1.4)), _c((-0.7, -1.2)), _c(-0.6, 0.2), _c(-0.6, 0.2),
+              _c((-1.0, -1.5), 0.0), _c(-0.5, 0.0), _c(-0.3, 0.0), _c(-0.3), _c(-0.3)],
+    }),
+    "dwuspadowy_90": _tablica("Tablica 7.4b - dach dwuspadowy", "θ = 90°", "plaski",
+                              {"alpha": _NACHYLENIA_DWUSPADOWE}, {
+        "F": [_c((-1.4, -2.0)), _c((-1.5, -2.1)), _c((-1.9, -2.5)), _c((-1.8, -2.5)), _c((-1.6, -2.2)),
+              _c((-1.3, -2.0)), _c((-1.1, -1.5)), _c((-1.1, -1.5)), _c((-1.1, -1.5)), _c((-1.1, -1.5))],
+        "G": [_c((-1.2, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0)), _c((-1.3, -2.0)),
+              _c((-1.3, -2.0)), _c((-1.4, -2.0)), _c((-1.4, -2.0)), _c((-1.2, -2.0)), _c((-1.2, -2.0))],
+        "H": [_c((-1.0, -1.3)), _c((-1.0, -1.3)), _c((-0.8, -1.2)), _c((-0.7, -1.2)), _c((-0.7, -1.2)),
+              _c((-0.6, -1.2)), _c((-0.8, -1.2)), _c((-0.9, -1.2)), _c((-0.8, -1.0)), _c((-0.8, -1.0))],
+        "I": [_c((-0.9, -1.2)), _c((-0.9, -1.2)), _c((-0.8, -1.2)), _c((-0.6, -1.2)), _c(-0.6),
+              _c(-0.5), _c(-0.5), _c(-0.5), _c(-0.5), _c(-0.5)],
+    }, obrot=True),
+    # Tablica 7.9 - ściany wolnostojące i attyki (c_p,net, dwie osie: phi, l/h)
+    "sciana": _tablica("Tablica 7.9 - ściana wolnostojąca", "θ = 0°", "sciana",
+                       {"phi": [0.8, 1.0], "l_h": [3.0, 5.0, 10.0]}, {
+        "A": [[_c(1.2)] * 3, [_c(2.3), _c(2.9), _c(3.4)]],
+        "B": [[_c(1.2)] * 3, [_c(1.4), _c(1.8), _c(2.1)]],
+        "C": [[_c(1.2)] * 3, [_c(1.2), _c(1.4), _c(1.7)]],
+        "D": [[_c(1.2)] * 3, [_c(1.2)] * 3],
+    }),
+    "sciana_naroznik": _tablica("Tablica 7.9 - ściana wolnostojąca z narożnikiem (długość >= h)", "θ = 0°", "sciana",
+                                {"phi": [0.8, 1.0]}, {
+        "A": [_c(1.2), _c(2.1)], "B": [_c(1.2), _c(1.8)], "C": [_c(1.2), _c(1.4)], "D": [_c(1.2), _c(1.2)],
+    }),
+    # Tablica 7.5 - dachy czterospadowe (strefy F-N wg Rys. 7.9, bez rysunku)
+    "czterospadowy_0": _tablica("Tablica 7.5 - dach czterospadowy (strefy wg Rys. 7.9)", "θ = 0°", None,
+                                {"alpha": _NACHYLENIA_JEDNOSPADOWE}, _CZTEROSPADOWY),
+    "czterospadowy_90": _tablica("Tablica 7.5 - dach czterospadowy (strefy wg Rys. 7.9)", "θ = 90°", None,
+                                 {"alpha_90": _NACHYLENIA_JEDNOSPADOWE}, _CZTEROSPADOWY),
+    # Rys. 7.11 i 7.12 - dachy łukowe i kopuły (dwie osie: f/d, h/d)
+    "lukowy": _tablica("Rys. 7.11 - dach łukowy na rzucie prostokąta", "θ = 0°", "lukowy",
+                       {"f_d": [0.0, 0.2, 0.3, 0.5], "h_d": [0.0, 0.5]}, _LUKOWY),
+    "kopula": _tablica("Rys. 7.12 - kopuła na rzucie koła (strefy A, B, C wg rysunku, pomiędzy - liniowo)",
+                       "θ = 0°", None, {"f_d": [0.0, 0.5], "h_d": [0.0, 0.5]}, _KOPULA),
+    # Tablice 7.6 i 7.7 - wiaty (c_p,net stref i c_f całej wiaty, dwie osie: alpha, phi_z)
+    "wiata_jednospadowa": _tablica("Tablica 7.6 - wiata jednospadowa, c_p,net", "θ = 0°", "wiata",
+                                   _OSIE_WIAT_JEDNOSPADOWYCH, {s: _WIATA_JEDNOSPADOWA[s] for s in "ABC"}),
+    "wiata_jednospadowa_cf": _tablica("Tablica 7.6 - wiata jednospadowa, c_f", "θ = 0°", "calosc",
+                                      _OSIE_WIAT_JEDNOSPADOWYCH, {"cf": _WIATA_JEDNOSPADOWA["cf"]}),
+    "wiata_dwuspadowa": _tablica("Tablica 7.7 - wiata dwuspadowa, c_p,net", "θ = 0°", "wiata_dwuspadowa",
+                                 _OSIE_WIAT_DWUSPADOWYCH, {s: _WIATA_DWUSPADOWA[s] for s in "ABCD"}),
+    "wiata_dwuspadowa_cf": _tablica("Tablica 7.7 - wiata dwuspadowa, c_f", "θ = 0°", "calosc",
+                                    _OSIE_WIAT_DWUSPADOWYCH, {"cf": _WIATA_DWUSPADOWA["cf"]}),
+}
+# Tablica 7.8 - wiaty wielospadowe (przęsło wiaty dwuspadowej)
+TABLICE_CPE["wiata_wielospadowa"] = _przesla(TABLICE_CPE["wiata_dwuspadowa"],
+                                             "Tablice 7.7 i 7.8 - przęsło wiaty wielospadowej, c_p,net")
+TABLICE_CPE["wiata_wielospadowa_cf"] = _przesla(TABLICE_CPE["wiata_dwuspadowa_cf"],
+                                                "Tablice 7.7 i 7.8 - przęsło wiaty wielospadowej, c_f")
+
+
+def _axis_index(os, x):
+    # Indeks przedziału osi i waga interpolacji liniowej; poza zakresem - wartość skrajna (bez ekstrapolacji)
+    x = np.clip(np.asarray(x, dtype=float), os[0], os[-1])
+    if len(os) == 1:
+        return np.zeros(x.shape, dtype=int), np.zeros(x.shape)
+    i = np.clip(np.searchsorted(os, x, side="right") - 1, 0, len(os) - 2)
+    return i, (x - os[i]) / (os[i + 1] - os[i])
+
+
+def cpe_area(cpe1, cpe10, area):
+    """C_pe dla pola obciążonego A [m²] (Rys. 7.2): C_pe,1 dla A <= 1, C_pe,10 dla A >= 10, pomiędzy - liniowo po log10 A."""
+    log_a = np.log10(np.clip(np.asarray(area, dtype=float), 1.0, 10.0))
+    cpe1 = np.asarray(cpe1, dtype=float)
+    return _out(cpe1 - (cpe1 - np.asarray(cpe10, dtype=float)) * log_a)
+
+
+def table_cpe(tablica, strefy, area=10.0, **osie):
+    """
+    Współczynniki (C_pe,min, C_pe,max) z tablicy TABLICE_CPE dla stref (nazwy), pól obciążonych A [m²]
+    i wartości osi tablicy (np. alpha, hp_h, phi, l_h). Wszystkie argumenty podlegają broadcastingowi,
+    więc układ stref wielu dachów liczony jest jednym wywołaniem. Interpolacja liniowa po osiach
+    (dwuliniowa dla dwóch osi), następnie logarytmiczna po polu A.
+    """
+    if isinstance(tablica, str):
+        tablica = TABLICE_CPE[tablica]
+    nazwy = list(tablica["osie"])
+    brak = [n for n in nazwy if n not in osie]
+    if brak:
+        raise ValueError(f"Brak wartości osi tablicy: {', '.join(brak)}")
+
+    indeksy_stref = {strefa: i for i, strefa in enumerate(tablica["strefy"])}
+    strefy = np.asarray(strefy).astype(str)
+    try:
+        z = np.array([indeksy_stref[s] for s in strefy.ravel()], dtype=int).reshape(strefy.shape)
+    except KeyError as err:
+        raise ValueError(f"Nieznana strefa {err} (dostępne: {', '.join(tablica['strefy'])})")
+
+    z, area, *wsp = np.broadcast_arrays(z, np.asarray(area, dtype=float), *(np.asarray(osie[n], dtype=float) for n in nazwy))
+    pozycje = [_axis_index(tablica["osie"][n], x) for n, x in zip(nazwy, wsp)]
+
+    komorka = np.zeros(z.shape + (4,))
+    for rog in itertools.product((0, 1), repeat=len(nazwy)):
+        waga = np.ones(z.shape)
+        indeks = []
+        for n, (i, w), r in zip(nazwy, pozycje, rog):
+            waga = waga * (w if r else 1.0 - w)
+            indeks.append(np.minimum(i + r, len(tablica["osie"][n]) - 1))
+        komorka += waga[..., None] * tablica["wartosci"][tuple(indeks) + (z,)]
+
+    return cpe_area(komorka[..., 1], komorka[..., 0], area), cpe_area(komorka[..., 3], komorka[..., 2], area)
+
+
+def roof_zone_layout(uklad, b, d, h):
+    """
+    Prostokąty stref (strefa, x, y, dx, dy) [m] wg Rys. 7.6-7.8, 7.11, 7.16, 7.17 i 7.19, e = min(b, 2h).
+    Dachy i wiaty: rzut, x - wzdłuż wiatru od krawędzi nawietrznej, y - w poprzek (szerokość b).
+    Ściana wolnostojąca: x - wzdłuż długości l = b od swobodnego końca, y - wysokość h.
+    Strefy o zerowym wymiarze są pomijane.
+    """
+    if uklad == "calosc":
+        return [("cf", 0.0, 0.0, d, b)]
+    if uklad == "lukowy":
+        return [("A", 0.0, 0.0, d / 4.0, b), ("B", d / 4.0, 0.0, d / 2.0, b), ("C", 3.0 * d / 4.0, 0.0, d / 4.0, b)]
+    if uklad in ("wiata", "wiata_dwuspadowa"):
+        # Strefy C - pasy b/10 wzdłuż boków, B - pasy d/10 przy krawędziach nawietrznej i zawietrznej,
+        # D - pasy d/10 po obu stronach kalenicy (kosza) wiaty dwuspadowej
+        yc, xb = b / 10.0, d / 10.0
+        prost = [("C", 0.0, 0.0, d, yc), ("C", 0.0, b - yc, d, yc),
+                 ("B", 0.0, yc, xb, b - 2 * yc), ("B", d - xb, yc, xb, b - 2 * yc)]
+        if uklad == "wiata":
+            prost.append(("A", xb, yc, d - 2 * xb, b - 2 * yc))
+        else:
+            xd = d / 2.0 - xb
+            prost += [("A", xb, yc, xd - xb, b - 2 * yc), ("D", xd, yc, d - 2 * xd, b - 2 * yc),
+                      ("A", d - xd, yc, xd - xb, b - 2 * yc)]
+        return [p for p in prost if p[3] > 0 and p[4] > 0]
+    if uklad == "sciana":
+        granice = [min(x, b) for x in (0.0, 0.3 * h, 2.0 * h, 4.0 * h, b)]
+        prost = [(s, x0, 0.0, x1 - x0, h) for s, x0, x1 in zip("ABCD", granice[:-1], granice[1:])]
+        return [p for p in prost if p[3] > 0]
+
+    e = min(b, 2.0 * h)
+    polowa = d / 2.0 if uklad == "dwuspadowy" else d
+    x1 = min(e / 10.0, polowa)
+    x2 = min(e / 2.0, d)
+    f_lewa, f_prawa = ("Fup", "Flow") if uklad == "jednospadowy_90" else ("F", "F")
+    prost = [(f_lewa, 0.0, 0.0, x1, e / 4.0), ("G", 0.0, e / 4.0, x1, b - e / 2.0), (f_prawa, 0.0, b - e / 4.0, x1, e / 4.0)]
+    if uklad == "jednospadowy":
+        prost.append(("H", x1, 0.0, d - x1, b))
+    elif uklad == "dwuspadowy":
+        prost += [("H", x1, 0.0, polowa - x1, b), ("J", polowa, 0.0, x1, b), ("I", polowa + x1, 0.0, polowa - x1, b)]
+    else:
+        prost += [("H", x1, 0.0, x2 - x1, b), ("I", x2, 0.0, d - x2, b)]
+    return [p for p in prost if p[3] > 0 and p[4] > 0]
+
+
+def roof_zone_pressures(tablice, b, d, h, qp, area=10.0, **osie):
+    """
+    Ciśnienie w_e = q_p(h) C_pe [kN/m²] w strefach dachu (ściany wolnostojącej: c_p,net) dla listy tablic,
+    np. wszystkich kierunków wiatru dachu jednospadowego - jedno wywołanie table_cpe dla wszystkich stref.
+    b, d - wymiary dla θ = 0° (tablice z obrotem liczone dla zamienionych b i d), area - pole obciążone [m²].
+    Oś l_h tablic ścian wolnostojących wyznaczana jest jako b/h, jeśli nie podano.
+    Tablice bez układu stref zwracają wszystkie strefy z A_strefy = NaN.
+    Zwraca DataFrame: tablica, kierunek, strefa, A_strefy, cpe_min, cpe_max, we_min, we_max.
+    """
+    if "l_h" not in osie:
+        osie = {**osie, "l_h": b / h}
+    wiersze = []
+    for nazwa in tablice:
+        t = TABLICE_CPE[nazwa]
+        if t["uklad"] is None:
+            wiersze += [(nazwa, t["kierunek"], strefa, np.nan) for strefa in t["strefy"]]
+            continue
+        bb, dd = (d, b) if t["obrot"] else (b, d)
+        pola = {}
+        for strefa, _, _, dx, dy in roof_zone_layout(t["uklad"], bb, dd, h):
+            pola[strefa] = pola.get(strefa, 0.0) + dx * dy
+        wiersze += [(nazwa, t["kierunek"], strefa, pole) for strefa, pole in pola.items()]
+
+    df = pd.DataFrame(wiersze, columns=["tablica", "kierunek", "strefa", "A_strefy"])
+    cpe_min = np.empty(len(df))
+    cpe_max = np.empty(len(df))
+    for nazwa, idx in df.groupby("tablica", sort=False).indices.items():
+        t = TABLICE_CPE[nazwa]
+        wsp = {n: osie[n] for n in t["osie"]}
+        cpe_min[idx], cpe_max[idx] = table_cpe(t, df["strefa"].to_numpy()[idx], area, **wsp)
+
+    df["cpe_min"] = cpe_min
+    df["cpe_max"] = cpe_max
+    df["we_min"] = qp * cpe_min
+    df["we_max"] = qp * cpe_max
+    return df
@@ -5,68 +5,23 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
 import pandas as pd
+import sys
+from pathlib import Path
+
+for sciezka in (Path(__file__).resolve().parents[2], Path(__file__).resolve().parent):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from TABLICE.Miejscowosci import city_table, locality_names  # noqa: E402
+from ObciazeniaWiatremRdzen import (  # noqa: E402
+    TERRAIN_PARAMS, calc_single_qp, calc_wind_profile, get_cdir_value_from_table, get_cpe_full, get_vb0_value,
+    wall_pressure_envelope, wall_pressure_matrix,
+)
 
 # ======================================================================================
 # 1. BAZA DANYCH I PARAMETRY
 # ======================================================================================
-MIASTA_DB = {
-    "Białystok":            {"strefa": "1", "A": 150},
-    "Bielsko-Biała":        {"strefa": "1", "A": 330},
-    "Bydgoszcz":            {"strefa": "1", "A": 60},
-    "Bytom":                {"strefa": "1", "A": 280},
-    "Chełm":                {"strefa": "1", "A": 190},
-    "Chorzów":              {"strefa": "1", "A": 280},
-    "Częstochowa":          {"strefa": "1", "A": 260},
-    "Dąbrowa Górnicza":     {"strefa": "1", "A": 270},
-    "Elbląg":               {"strefa": "1", "A": 10},
-    "Gdańsk":               {"strefa": "2", "A": 15},
-    "Gdynia":               {"strefa": "2", "A": 30},
-    "Gliwice":              {"strefa": "1", "A": 220},
-    "Gorzów Wielkopolski":  {"strefa": "1", "A": 20},
-    "Grudziądz":            {"strefa": "1", "A": 50},
-    "Jelenia Góra":         {"strefa": "3", "A": 350},
-    "Kalisz":               {"strefa": "1", "A": 140},
-    "Katowice":             {"strefa": "1", "A": 270},
-    "Kielce":               {"strefa": "1", "A": 260},
-    "Konin":                {"strefa": "1", "A": 100},
-    "Koszalin":             {"strefa": "2", "A": 35},
-    "Kraków":               {"strefa": "1", "A": 220},
-    "Legnica":              {"strefa": "1", "A": 120},
-    "Lublin":               {"strefa": "1", "A": 200},
-    "Łódź":                 {"strefa": "1", "A": 220},
-    "Nowy Sącz":            {"strefa": "3", "A": 300},
-    "Olsztyn":              {"strefa": "1", "A": 140},
-    "Opole":                {"strefa": "1", "A": 175},
-    "Płock":                {"strefa": "1", "A": 100},
-    "Poznań":               {"strefa": "1", "A": 85},
-    "Radom":                {"strefa": "1", "A": 180},
-    "Ruda Śląska":          {"strefa": "1", "A": 270},
-    "Rybnik":               {"strefa": "1", "A": 240},
-    "Rzeszów":              {"strefa": "1", "A": 220},
-    "Siedlce":              {"strefa": "1", "A": 155},
-    "Sosnowiec":            {"strefa": "1", "A": 260},
-    "Suwałki":              {"strefa": "1", "A": 170},
-    "Szczecin":             {"strefa": "1", "A": 25},
-    "Świnoujście":          {"strefa": "2", "A": 5},
-    "Tarnów":               {"strefa": "1", "A": 210},
-    "Toruń":                {"strefa": "1", "A": 50},
-    "Tychy":                {"strefa": "1", "A": 260},
-    "Wałbrzych":            {"strefa": "3", "A": 450},
-    "Warszawa":             {"strefa": "1", "A": 110},
-    "Włocławek":            {"strefa": "1", "A": 65},
-    "Wrocław":              {"strefa": "1", "A": 120},
-    "Zabrze":               {"strefa": "1", "A": 260},
-    "Zakopane":             {"strefa": "3", "A": 850},
-    "Zielona Góra":         {"strefa": "1", "A": 150},
-}
-
-TERRAIN_PARAMS = {
-    "0":   {"z0": 0.003, "zmin": 1.0,  "opis": "Obszary morskie, przybrzeżne wystawione na otwarte morze"},
-    "I":   {"z0": 0.01,  "zmin": 1.0,  "opis": "Jeziora, tereny płaskie poziome, zaniedbywalna roślinność, brak przeszkód"},
-    "II":  {"z0": 0.05,  "zmin": 2.0,  "opis": "Niska roślinność (trawa), izolowane przeszkody (drzewa, zabudowania) w odległości > 20h"},
-    "III": {"z0": 0.30,  "zmin": 5.0,  "opis": "Regularne pokrycie roślinnością/budynkami, izolowane przeszkody w odległości < 20h (wsie, przedmieścia, lasy)"},
-    "IV":  {"z0": 1.00,  "zmin": 10.0, "opis": "Obszary, na których min. 15% powierzchni pokrywają budynki o h > 15m"}
-}
+MIASTA_DB = city_table("wiatr")
 
 def update_city_defaults():
     """Funkcja callback aktualizująca strefę i wysokość po wyborze miasta."""
@@ -75,63 +30,6 @@ def update_city_defaults():
         st.session_state["ddp_strefa_w"] = MIASTA_DB[sel_city]["strefa"]
         st.session_state["ddp_A_w"] = float(MIASTA_DB[sel_city]["A"])
 
-def get_vb0_value(strefa, A):
-    vb0 = 22.0 
-    if strefa == "1":
-        if A <= 300: vb0 = 22.0
-        else: vb0 = 22.0 * (1.0 + 0.0006 * (A - 300.0))
-    elif strefa == "2":
-        vb0 = 26.0
-    elif strefa == "3":
-        if A <= 300: vb0 = 22.0
-        else: vb0 = 22.0 * (1.0 + 0.0006 * (A - 300.0))
-    return vb0
-
-def calc_single_qp(z_val, terrain_cat, vb):
-    params = TERRAIN_PARAMS[terrain_cat]
-    z0 = params["z0"]
-    zmin = params["zmin"]
-    z0_II = 0.05
-    kr = 0.19 * ((z0 / z0_II) ** 0.07)
-    rho = 1.25
-    z_calc = max(z_val, zmin)
-    cr = kr * math.log(z_calc / z0)
-    co = 1.0
-    vm = cr * co * vb
-    kl = 1.0
-    Iv = kl / (co * math.log(z_calc / z0))
-    qp_pa = (1.0 + 7.0 * Iv) * 0.5 * rho * (vm ** 2)
-    qp_kn = qp_pa / 1000.0
-    return qp_kn
-
-def calc_wind_profile(z_max, terrain_cat, vb, num_points=100):
-    heights = np.linspace(0.0, z_max, num_points)
-    qp_values = []
-    for z in heights:
-        qp = calc_single_qp(z, terrain_cat, vb)
-        qp_values.append(qp)
-    return heights, qp_values, TERRAIN_PARAMS[terrain_cat]["zmin"]
-
-def get_cdir_value_from_table(strefa, angle):
-    val = 1.0
-    if strefa == "1":
-        if angle in [210, 240, 270]: val = 1.0
-        elif angle in [180, 300]: val = 0.9
-        elif angle in [120, 150]: val = 0.7
-        else: val = 0.8
-    elif strefa == "2":
-        if angle in [240, 270, 300, 330, 0, 30]: val = 1.0
-        elif angle in [210]: val = 0.9
-        elif angle in [60, 90, 180]: val = 0.8
-        elif angle in [120, 150]: val = 0.7
-        else: val = 1.0 
-    elif strefa == "3":
-        if angle in [180, 210, 240, 270]: val = 1.0
-        elif angle in [150, 300]: val = 0.9
-        elif angle in [120]: val = 0.7
-        else: val = 0.8
-    return val
-
 # --------------------------------------------------------------------------------------
 # 5. RYSUNEK SCHEMATYCZNY (GEOMETRIA 3D)
 # --------------------------------------------------------------------------------------
@@ -550,25 +448,6 @@ def draw_wall_pressures_only(b, d, h, cpe_dict, qp_val):
     plt.tight_layout()
     return fig
 
-def get_cpe_full(h, d):
-    ratio = h / d
-    cpe10_A, cpe1_A = -1.2, -1.4
-    cpe10_B, cpe1_B = -0.8, -1.1
-    cpe10_C, cpe1_C = -0.5, -0.5
-    
-    if ratio <= 0.25: cpe_D = 0.7
-    elif ratio >= 1.0: cpe_D = 0.8
-    else: cpe_D = 0.7 + (0.8 - 0.7) * (ratio - 0.25) / 0.75
-    cpe10_D = cpe1_D = round(cpe_D, 2)
-        
-    if ratio <= 0.25: cpe_E = -0.3
-    elif ratio >= 5.0: cpe_E = -0.7
-    elif ratio <= 1.0: cpe_E = -0.3 + (-0.5 - (-0.3)) * (ratio - 0.25) / 0.75
-    else: cpe_E = -0.5 + (-0.7 - (-0.5)) * (ratio - 1.0) / 4.0
-    cpe10_E = cpe1_E = round(cpe_E, 2)
-    
-    return {"A": (cpe10_A, cpe1_A), "B": (cpe10_B, cpe1_B), "C": (cpe10_C, cpe1_C), "D": (cpe10_D, cpe1_D), "E": (cpe10_E, cpe1_E)}
-
 def run():
     if "ddp_qp_max" not in st.session_state: st.session_state["ddp_qp_max"] = 0.0
 
@@ -616,7 +495,7 @@ def run():
         disable_strefa = False
 
         if use_city:
-            lista_miast = sorted(list(MIASTA_DB.keys()))
+            lista_miast = locality_names()
             idx_krakow = lista_miast.index("Kraków") if "Kraków" in lista_miast else 0
             wybrane_miasto = st.selectbox("Wybierz miasto:", lista_miast, index=idx_krakow, key="ddp_city_w", on_change=update_city_defaults)
             dane_miasta = MIASTA_DB[wybrane_miasto]
@@ -819,6 +698,30 @@ def run():
                 df_pi.set_index("Wariant", inplace=True)
                 st.table(df_pi)
 
+        # -------------------------------------------------------------------------
+        # WSZYSTKIE KIERUNKI WIATRU
+        # -------------------------------------------------------------------------
+        with st.expander("🧭 Ciśnienie $w_e$ dla wszystkich kierunków wiatru"):
+            st.caption(
+                f"Ściana o szerokości b zwrócona na północ (0°), $c_{{dir}}$ wg sektorów dla strefy {strefa}, "
+                f"$c_{{season}} = {c_season:.2f}$, $C_{{pe,10}}$ bez $C_{{pi}}$. Strefy nieistniejące: 0."
+            )
+            matrix = wall_pressure_matrix(b_bud, d_bud, z_bud, strefa, A, kat_terenu, c_season)
+            df_dir = pd.DataFrame(matrix["we"][:, :, -1], columns=list(matrix["strefy"]),
+                                  index=[f"{s}°" for s in matrix["sektory"]])
+            df_dir.insert(0, "c_dir", matrix["c_dir"])
+            df_dir.index.name = "Sektor"
+            st.markdown(f"**$w_e$ [kN/m²] w najwyższym pasie ($z = {z_bud:.2f}$ m)**")
+            st.dataframe(df_dir.style.format("{:.2f}"), use_container_width=True)
+
+            we_max, we_min, _, _ = wall_pressure_envelope(matrix)
+            df_env = pd.DataFrame({"z [m]": matrix["z"], "D max": we_max[3]})
+            for i, zone in enumerate(matrix["strefy"]):
+                if zone != "D":
+                    df_env[f"{zone} min"] = we_min[i]
+            st.markdown("**Obwiednia po kierunkach w pasach wysokości [kN/m²]** (strefy nieistniejące: -)")
+            st.dataframe(df_env.style.format("{:.2f}", na_rep="-"), use_container_width=True, hide_index=True)
+
         # -------------------------------------------------------------------------
         # SZCZEGÓŁOWY RAPORT OBLICZEŃ
         # -------------------------------------------------------------------------
@@ -0,0 +1,52 @@
+"""
+Testy regresyjne generatora kombinacji PN-EN 1990 (KombinacjeObciazen).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "_MODULY" / "OBCIAZENIA_KombinacjeObciazen"))
+
+import KombinacjeObciazen as kombinacje  # noqa: E402
+
+KATEGORIA_E = next(k for k in kombinacje.PSI_TABLE_RAW_SGN if k.startswith("E"))
+
+
+def _q(name, category, group=None, effect="niekorzystne"):
+    return {"name": name, "type": "Q", "category": category, "effect": effect, "group": group}
+
+
+G = {"name": "G", "type": "G", "category": None, "effect": "niekorzystne", "group": None}
+
+
+def _labels(actions, expression):
+    return {kombinacje.combination_label(c, actions) for c in kombinacje.generate_combinations(actions, [expression])}
+
+
+def test_wiodace_z_psi0_rownym_1_w_grupie_wiodacego_niekorzystnego():
+    # Q1 (ψ0 = 0,7) i E (ψ0 = 1,0) w jednej grupie - E musi być też wiodące
+    actions = [G, _q("Q1", "B: Biurowe", "x"), _q("E", KATEGORIA_E, "x")]
+    assert _labels(actions, "6.10") == {"1.35·G + 1.50·Q1", "1.35·G + 1.50·E"}
+    assert _labels(actions, "6.10b") == {"1.15·G + 1.50·Q1", "1.15·G + 1.50·E"}
+
+
+def test_wiodace_z_psi0_rownym_1_pominiete_gdy_towarzyszace():
+    # Bez grupy E występuje jako towarzyszące z tym samym współczynnikiem - bez duplikatów
+    actions = [G, _q("Q1", "B: Biurowe"), _q("E", KATEGORIA_E)]
+    assert _labels(actions, "6.10") == {"1.35·G + 1.50·Q1 + 1.50·E"}
+    assert kombinacje.count_combinations(actions, ["6.10"]) == 1
+
+
+def test_zmienne_korzystne_pominiete():
+    actions = [G, _q("Q1", "B: Biurowe"), _q("Qk", "B: Biurowe", effect="korzystne")]
+    assert _labels(actions, "6.10") == {"1.35·G + 1.50·Q1"}
+
+
+def test_obwiednia_jednego_stanu_granicznego():
+    _, meta = kombinacje.combination_matrix([G])
+    assert {m["expression"] for m in meta} == {"6.10a", "6.10b"}
+    for expressions in (["6.10a", "charakterystyczna"], ["6.10", "6.10b"]):
+        with pytest.raises(ValueError):
+            kombinacje.combination_matrix([G], expressions)